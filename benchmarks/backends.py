@@ -0,0 +1,112 @@
+from functools import partial
+from random import Random
+from typing import Callable, TextIO
+import os
+
+from rich.console import Console
+from rich.table import Table
+
+from practice_turkish.dictionaries import CSVDictionaryEntry, Dictionary
+from practice_turkish.output import Backend, PlainBackend, RichBackend, output
+from practice_turkish.session import FeedbackSink, Outcome, Question, Response
+from benchmarks.generator import dictionary_path
+from benchmarks.timing import Result, measure
+
+N_FEEDBACK = 2_000
+DICTIONARY_SIZE = 1_000
+WIDTH = 100
+
+
+def rich_console(stream: TextIO) -> Console:
+    "A console rendering with colors as if the stream was a terminal."
+    return Console(file=stream, force_terminal=True, width=WIDTH)
+
+
+backends: dict[str, Callable[[TextIO], Backend]] = {
+    "rich": lambda stream: RichBackend(rich_console(stream)),
+    "plain": lambda stream: PlainBackend(stream, color=True),
+}
+
+
+def give_feedback(outcomes: list[Outcome]) -> None:
+    "Tell the user the grades with the current backend, flushing after each."
+    sink = FeedbackSink()
+    for outcome in outcomes:
+        sink.consume(outcome)
+        output.flush()
+
+
+def give_feedback_with_markup(console: Console, outcomes: list[Outcome]) -> None:
+    "Tell the user the grades as sessions did before backends, parsing markup."
+    for outcome in outcomes:
+        verdict = (
+            "[green]Correct![/green]" if outcome.is_correct else "[red]Incorrect![/red]"
+        )
+        expected = outcome.question.expected
+        console.print(f'{verdict} In the file: "[green]{expected}[/green]".')
+
+
+def print_table_with_markup(console: Console, dictionary: Dictionary) -> None:
+    "Print the table of a dictionary as sessions did before backends."
+    table = Table(title="Your mistakes")
+    table.add_column(dictionary.language_a.value, justify="left")
+    table.add_column(dictionary.language_b.value, justify="right")
+    for entry in dictionary.entries:
+        table.add_row(entry.query_a, entry.query_b)
+    console.print(table)
+
+
+def run_backends(
+    _scales: list[int], directory: str, seed: int = 0, repeats: int = 3
+) -> list[Result]:
+    """Time output of sessions with each backend.
+
+    Feedback to `N_FEEDBACK` answers is given through `FeedbackSink`,
+    flushing after each answer as sessions do, and the table of a generated
+    dictionary of `DICTIONARY_SIZE` entries is printed. Both are timed with
+    each backend writing to the null device, and once more the way sessions
+    did before backends existed, with rich parsing markup. Rich renders with
+    colors as it does in a terminal, and so does the plain backend.
+
+    Parameters
+    ----------
+    _scales : list[int]
+        Ignored, output doesn't depend on the scale of dictionaries.
+    directory : str
+        The directory generated dictionaries are kept in.
+    seed : int
+        Seed of the generated dictionary and answers.
+    repeats : int
+        The number of times each output is timed.
+
+    Returns
+    ----------
+    results : list[Result]
+        Timings of feedback and tables with each backend.
+    """
+    rng = Random(seed)
+    path = dictionary_path(directory, "csv", DICTIONARY_SIZE, seed)
+    dictionary = Dictionary.from_file(path, CSVDictionaryEntry)
+    dictionary.sort()
+    outcomes = [
+        Outcome(Response(Question(entry, True), ""), rng.random() < 0.5)
+        for entry in rng.choices(dictionary.entries, k=N_FEEDBACK)
+    ]
+
+    results = []
+    with open(os.devnull, "w", encoding="utf-8") as null:
+        console = rich_console(null)
+        feedback = partial(give_feedback_with_markup, console, outcomes)
+        table = partial(print_table_with_markup, console, dictionary)
+        results.append(
+            Result("feedback:markup", N_FEEDBACK, measure(feedback, repeats))
+        )
+        results.append(Result("table:markup", DICTIONARY_SIZE, measure(table, repeats)))
+        for name, make_backend in backends.items():
+            with output.redirect(make_backend(null)):
+                feedback = partial(give_feedback, outcomes)
+                times = measure(feedback, repeats)
+                results.append(Result(f"feedback:{name}", N_FEEDBACK, times))
+                times = measure(partial(dictionary.print, "Your mistakes"), repeats)
+                results.append(Result(f"table:{name}", DICTIONARY_SIZE, times))
+    return results
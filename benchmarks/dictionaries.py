@@ -0,0 +1,184 @@
+from functools import partial
+from itertools import islice
+from random import Random
+import os
+
+from rich import get_console
+
+from practice_turkish.dictionaries import (
+    CSVDictionaryEntry,
+    Dictionary,
+    DictionaryEntry,
+    TurkrutDictionaryEntry,
+)
+from practice_turkish.languages.inflection import (
+    InflectionTable,
+    build_tables,
+    check_answers as check_forms,
+    drill,
+)
+from practice_turkish.languages.morphology import (
+    end_kind,
+    harmony_class,
+    lemmas,
+    noun_chains,
+    realize,
+    suffix_automaton,
+    verb_chains,
+)
+from practice_turkish.make_csv import write_dictionary
+from practice_turkish.number import (
+    read_many,
+    read_ordinal,
+    spell_many,
+    spell_number,
+    spell_ordinal,
+)
+from practice_turkish.output import RichBackend, output
+from practice_turkish.session import Question, Response, exact_grader, grade
+from benchmarks.generator import dictionary_path
+from benchmarks.timing import Result, measure
+
+PRINT_LIMIT = 1_000
+N_CHECKS = 10_000
+N_NUMBERS = 10_000
+
+formats = {"csv": CSVDictionaryEntry, "turkrut": TurkrutDictionaryEntry}
+
+
+def check_answers(answers: list[tuple[DictionaryEntry, str]]) -> None:
+    "Check prepared answers in both directions."
+    for entry, answer in answers:
+        entry.check_translation(True, answer)
+        entry.check_translation(False, answer)
+
+
+def inflect(rng: Random, word: str, chains: list[tuple[str, ...]]) -> str:
+    "Add a random chain of suffixes to the last word of a Turkish phrase."
+    last = word.split()[-1]
+    vowel_class = harmony_class(last)
+    if not vowel_class:
+        return word
+    suffix, dropped = realize(rng.choice(chains), vowel_class, end_kind(last))
+    return (word[:-1] if dropped else word) + suffix
+
+
+def grade_inflections(responses: list[Response]) -> None:
+    "Grade prepared answers, accepting inflected forms."
+    for _ in grade(responses, exact_grader, inflections=True):
+        pass
+
+
+def drill_forms(tables: list[InflectionTable], n: int, seed: int) -> None:
+    "Draw n forms of words and check their right answers."
+    items = drill(tables, Random(seed))
+    answers = [(table, name, table.forms[name]) for table, name in islice(items, n)]
+    check_forms(answers)
+
+
+def spell_numbers(numbers: list[int]) -> None:
+    "Spell prepared numbers."
+    for number in numbers:
+        spell_number(number)
+
+
+def round_trip_ordinals(numbers: list[int]) -> None:
+    "Spell prepared numbers as ordinals in one batch and read them back."
+    if read_many(spell_many(numbers, spell_ordinal), read_ordinal) != numbers:
+        raise AssertionError("Ordinals aren't read back as they were spelled.")
+
+
+def print_silently(dictionary: Dictionary) -> None:
+    "Render the table of a dictionary without writing it to the terminal."
+    with get_console().capture(), output.redirect(RichBackend()):
+        dictionary.print()
+
+
+def run_dictionaries(
+    scales: list[int], directory: str, seed: int = 0, repeats: int = 3
+) -> list[Result]:
+    """Time common operations on dictionaries at several scales.
+
+    Reading is timed for both formats. Other operations use the CSV
+    dictionary: sorting shuffled entries, shuffling, writing to a CSV file,
+    checking answers and printing. Checking is timed on a fixed number of
+    answers and printing on at most `PRINT_LIMIT` entries, so they stay
+    comparable between scales. Spelling numbers, and spelling ordinals and
+    reading them back, don't depend on the scale and are timed once.
+
+    Parameters
+    ----------
+    scales : list[int]
+        Numbers of entries of generated dictionaries.
+    directory : str
+        The directory generated dictionaries are kept in.
+    seed : int
+        Seed of generated dictionaries and random choices of benchmarks.
+    repeats : int
+        The number of times each operation is timed.
+
+    Returns
+    ----------
+    results : list[Result]
+        Timings of each operation at each scale.
+    """
+    rng = Random(seed)
+    results = []
+    for n in scales:
+        for format, T in formats.items():
+            path = dictionary_path(directory, format, n, seed)
+            read = partial(Dictionary.from_file, path, T)
+            results.append(Result(f"from_file:{format}", n, measure(read, repeats)))
+
+        dictionary = Dictionary.from_file(
+            dictionary_path(directory, "csv", n, seed), CSVDictionaryEntry
+        )
+        entries = dictionary.entries
+        mix = partial(Random(seed).shuffle, entries)
+        results.append(Result("sort", n, measure(dictionary.sort, repeats, mix)))
+        results.append(Result("shuffle", n, measure(dictionary.shuffle, repeats)))
+
+        written = os.path.join(directory, "written.csv")
+        write = partial(write_dictionary, dictionary, written)
+        results.append(Result("write_dictionary", n, measure(write, repeats)))
+        os.remove(written)
+
+        answers = []
+        for entry in rng.choices(entries, k=N_CHECKS):
+            words = entry.words_b if rng.random() < 0.5 else rng.choice(entries).words_b
+            answers.append((entry, rng.choice(sorted(words))))
+        check = partial(check_answers, answers)
+        results.append(Result("check_translation", n, measure(check, repeats)))
+
+        suffix_automaton()
+        chains = [*noun_chains(), *verb_chains()]
+        responses = []
+        for entry in rng.choices(entries, k=N_CHECKS):
+            word = rng.choice(sorted(entry.words_a))
+            answer = inflect(rng, word, chains) if rng.random() < 0.5 else word
+            responses.append(Response(Question(entry, False), answer))
+        inflections = partial(grade_inflections, responses)
+        times = measure(inflections, repeats, lemmas.cache_clear)
+        results.append(Result("inflection_grader", n, times))
+
+        turkish = [word for entry in entries for word in entry.words_a]
+        build = partial(build_tables, turkish)
+        results.append(Result("inflection_tables", n, measure(build, repeats)))
+        drill_checks = partial(drill_forms, build_tables(turkish), N_CHECKS, seed)
+        results.append(Result("drill", n, measure(drill_checks, repeats)))
+
+        shown = Dictionary(
+            entries[:PRINT_LIMIT], dictionary.language_a, dictionary.language_b
+        )
+        render = partial(print_silently, shown)
+        results.append(Result("print", n, measure(render, repeats)))
+
+    numbers = [rng.randrange(10**12) for _ in range(N_NUMBERS)]
+    spell = partial(spell_numbers, numbers)
+    results.append(Result("spell_number", N_NUMBERS, measure(spell, repeats)))
+    ordinals = [number + 1 for number in numbers]
+    round_trip = partial(round_trip_ordinals, ordinals)
+    results.append(
+        Result("round_trip:ordinal", N_NUMBERS, measure(round_trip, repeats))
+    )
+    return results
@@ -0,0 +1,142 @@
+from random import Random
+from typing import Optional
+import os
+
+from practice_turkish.languages import Language
+
+consonants = {
+    Language.turkish: "bcçdfgğhjklmnprsştvyz",
+    Language.russian: "бвгджзклмнпрстфхцчшщ",
+    Language.english: "bcdfghjklmnprstvwyz",
+}
+vowels = {
+    Language.turkish: "aeıioöuü",
+    Language.russian: "аеёиоуыэюя",
+    Language.english: "aeiouy",
+}
+
+MAX_ALTERNATIVES = 3
+PHRASE_PROBABILITY = 0.1
+HINT_PROBABILITY = 0.2
+
+
+def generate_word(rng: Random, language: Language) -> str:
+    "Generate a word of one to four syllables in the language."
+    syllables = []
+    for _ in range(rng.randint(1, 4)):
+        syllable = rng.choice(consonants[language]) + rng.choice(vowels[language])
+        if rng.random() < 0.3:
+            syllable += rng.choice(consonants[language])
+        syllables.append(syllable)
+    return "".join(syllables)
+
+
+def generate_alternative(rng: Random, language: Language) -> str:
+    "Generate a word or, rarely, a phrase of two words."
+    if rng.random() < PHRASE_PROBABILITY:
+        return f"{generate_word(rng, language)} {generate_word(rng, language)}"
+    return generate_word(rng, language)
+
+
+def generate_side(rng: Random, language: Language) -> tuple[list[str], Optional[str]]:
+    "Generate alternatives and an optional hint for one language of an entry."
+    n = rng.randint(1, MAX_ALTERNATIVES)
+    words = list(dict.fromkeys(generate_alternative(rng, language) for _ in range(n)))
+    hint = generate_word(rng, language) if rng.random() < HINT_PROBABILITY else None
+    return words, hint
+
+
+def write_csv(
+    path: str,
+    n: int,
+    seed: int = 0,
+    language_a: Language = Language.turkish,
+    language_b: Language = Language.russian,
+) -> None:
+    """Write a CSV dictionary of n synthetic entries.
+
+    Words are built from syllables of the language, so their lengths and
+    letters look like real ones. Entries have up to three alternatives, some
+    of them are phrases and some entries have hints.
+
+    Parameters
+    ----------
+    path : str
+        A string representing filepath to write to.
+    n : int
+        The number of entries.
+    seed : int
+        Seed of the random number generator, the same seed gives the same file.
+    language_a : Language
+        Language of the 1st column, default is Turkish.
+    language_b : Language
+        Language of the 2nd column, default is Russian.
+    """
+    rng = Random(seed)
+    la, lb = language_a.name, language_b.name
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(f"{la};{lb};{la} hint;{lb} hint\n")
+        for _ in range(n):
+            words_a, hint_a = generate_side(rng, language_a)
+            words_b, hint_b = generate_side(rng, language_b)
+            f.write(
+                f"{'/'.join(words_a)};{'/'.join(words_b)};"
+                f"{hint_a or ''};{hint_b or ''}\n"
+            )
+
+
+def write_turkrut(path: str, n: int, seed: int = 0) -> None:
+    """Write a turkrut dictionary of n synthetic entries.
+
+    Parameters
+    ----------
+    path : str
+        A string representing filepath to write to.
+    n : int
+        The number of entries.
+    seed : int
+        Seed of the random number generator, the same seed gives the same file.
+    """
+    rng = Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(n):
+            sides = []
+            for language in (Language.turkish, Language.russian):
+                words, hint = generate_side(rng, language)
+                side = ", ".join(words)
+                if hint is not None:
+                    side += f" ({hint})"
+                sides.append(side)
+            f.write(f"{sides[0]} — {sides[1]}\n")
+
+
+def dictionary_path(directory: str, format: str, n: int, seed: int = 0) -> str:
+    """Path to a synthetic dictionary, generating it if it doesn't exist yet.
+
+    Parameters
+    ----------
+    directory : str
+        The directory generated dictionaries are kept in.
+    format : str
+        Either "csv" or "turkrut".
+    n : int
+        The number of entries.
+    seed : int
+        Seed of the random number generator.
+
+    Returns
+    ----------
+    path : str
+        A string representing the path to the dictionary.
+    """
+    extension = ".csv" if format == "csv" else ".txt"
+    path = os.path.join(directory, f"{format}-{n}-{seed}{extension}")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        temporary = path + ".tmp"
+        if format == "csv":
+            write_csv(temporary, n, seed)
+        else:
+            write_turkrut(temporary, n, seed)
+        os.replace(temporary, path)
+    return path
@@ -0,0 +1,231 @@
+from multiprocessing import Event, Process
+from random import Random
+from typing import Any, Optional
+import asyncio
+import json
+import os
+import socket
+import time
+
+from rich import print
+from rich.table import Table
+import typer
+
+from practice_turkish.cache import cache_path
+from practice_turkish.dictionaries import CSVDictionaryEntry, Dictionary
+from practice_turkish.server import Library, PracticeServer
+from benchmarks.generator import dictionary_path
+from benchmarks.timing import Result
+
+PERCENTILES = (50, 95, 99)
+
+
+class Connection:
+    """A class used to send JSON requests over one keep-alive connection.
+
+    Methods
+    ----------
+    async def request(self, method: str, path: str,
+                      payload: Optional[dict] = None) -> tuple[int, Any]
+        Send a request and wait for the response.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> "Connection":
+        "Connect to the server."
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(
+        self, method: str, path: str, payload: Optional[dict] = None
+    ) -> tuple[int, Any]:
+        "Send a request and wait for the response, return its status and JSON."
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            "Host: localhost\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    def close(self) -> None:
+        "Close the connection."
+        self.writer.close()
+
+
+def run_server(path: str, port: int, ready: Any) -> None:
+    "Serve the dictionary in this process until terminated."
+    library = Library.load([path])
+    asyncio.run(PracticeServer(library).serve("127.0.0.1", port, ready))
+
+
+def free_port() -> int:
+    "A port nobody listens on at the moment."
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def drive(
+    host: str,
+    port: int,
+    dictionary: str,
+    n_sessions: int,
+    n_questions: int,
+    n_connections: int,
+    answers: dict[str, str],
+    seed: int,
+) -> tuple[list[float], float]:
+    """Start sessions and answer their questions concurrently.
+
+    All sessions are started first, then questions are answered round-robin,
+    so every session stays in progress until the end of the test.
+
+    Returns
+    ----------
+    latencies : list[float]
+        Durations of answer requests in seconds.
+    elapsed : float
+        Duration of the answering phase in seconds.
+    """
+    rng = Random(seed)
+    connections = [await Connection.open(host, port) for _ in range(n_connections)]
+    pending: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+
+    async def start(connection: Connection, count: int) -> None:
+        for _ in range(count):
+            parameters = {
+                "dictionary": dictionary,
+                "questions": n_questions,
+                "seed": rng.randrange(2**31),
+            }
+            status, reply = await connection.request("POST", "/sessions", parameters)
+            if status != 201:
+                raise RuntimeError(f"Can't start a session: {reply}")
+            pending.put_nowait((reply["session"], reply["question"]))
+
+    shares = [n_sessions // n_connections] * n_connections
+    for i in range(n_sessions % n_connections):
+        shares[i] += 1
+    await asyncio.gather(*map(start, connections, shares))
+
+    latencies: list[float] = []
+
+    async def answer(connection: Connection) -> None:
+        while not pending.empty():
+            identifier, question = pending.get_nowait()
+            text = answers.get(question["query"], "yanlış")
+            if rng.random() < 0.5:
+                text = "yanlış"
+            begin = time.perf_counter()
+            status, reply = await connection.request(
+                "POST", f"/sessions/{identifier}/answer", {"answer": text}
+            )
+            latencies.append(time.perf_counter() - begin)
+            if status != 200:
+                raise RuntimeError(f"Can't answer: {reply}")
+            if reply["next"] is not None:
+                pending.put_nowait((identifier, reply["next"]))
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*map(answer, connections))
+    elapsed = time.perf_counter() - start_time
+    for connection in connections:
+        connection.close()
+    return latencies, elapsed
+
+
+def loadtest(
+    sessions: int = typer.Option(2000, "--sessions", help="Concurrent sessions."),
+    questions: int = typer.Option(10, "--questions", help="Questions per session."),
+    connections: int = typer.Option(
+        100, "--connections", help="Connections sessions are spread over."
+    ),
+    size: int = typer.Option(1000, "--size", help="Entries of the dictionary."),
+    seed: int = typer.Option(0, "--seed", help="Seed of the dictionary and answers."),
+) -> None:
+    """Load test the practice server with many concurrent sessions.
+
+    A dictionary is generated and served by a server started in a separate
+    process, so the server uses a single core. Sessions are started all at
+    once and their questions are answered round-robin, half of them right,
+    over a pool of keep-alive connections. Throughput and percentiles of the
+    latency of answers are printed.
+
+    Parameters
+    ----------
+    sessions : int
+        The number of sessions in progress at the same time.
+    questions : int
+        The number of questions of each session.
+    connections : int
+        The number of connections requests are sent over.
+    size : int
+        The number of entries of the generated dictionary.
+    seed : int
+        Seed of the generated dictionary and answers.
+    """
+    directory = os.path.dirname(cache_path("benchmarks", "data", "dictionary"))
+    path = dictionary_path(directory, "csv", size, seed)
+    dictionary = Dictionary.from_file(path, CSVDictionaryEntry)
+    answers = {entry.query_a: next(iter(entry.words_b)) for entry in dictionary}
+    name = os.path.relpath(path).replace(os.sep, "/")
+
+    port = free_port()
+    ready = Event()
+    server = Process(target=run_server, args=(path, port, ready), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(timeout=60):
+            raise RuntimeError("The server didn't start.")
+        latencies, elapsed = asyncio.run(
+            drive(
+                "127.0.0.1",
+                port,
+                name,
+                sessions,
+                questions,
+                connections,
+                answers,
+                seed,
+            )
+        )
+    finally:
+        server.terminate()
+        server.join()
+
+    result = Result("answer", sessions, latencies)
+    table = Table(title="Load test")
+    table.add_column("Measure", justify="left")
+    table.add_column("Value", justify="right")
+    table.add_row("Concurrent sessions", str(sessions))
+    table.add_row("Connections", str(connections))
+    table.add_row("Answers", str(len(latencies)))
+    table.add_row("Answers per second", f"{len(latencies) / elapsed:.0f}")
+    for q in PERCENTILES:
+        table.add_row(f"Latency p{q}, ms", f"{result.percentile(q) * 1e3:.2f}")
+    print(table)
+
+
+def main() -> None:
+    "If open as a script, run loadtest function."
+    typer.run(loadtest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+from functools import partial
+from random import Random
+from typing import Callable, Iterable
+import random
+import time
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import PipeInput, create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from rich import get_console, print
+from rich.table import Table
+
+from practice_turkish.dictionaries import CSVDictionaryEntry, Dictionary
+from practice_turkish.languages import Language, PrompterInTheLanguage
+from practice_turkish.number import practice_number, spell_number
+from practice_turkish.output import RichBackend, output
+from practice_turkish.session import (
+    Asker,
+    FeedbackSink,
+    Outcome,
+    Question,
+    Response,
+    ask_typing,
+    default_grader,
+    prefetch,
+    prepare_choice,
+)
+from practice_turkish.session.askers import choice_options, pick_option
+from benchmarks.generator import dictionary_path
+from benchmarks.timing import Result
+
+# Questions of each kind asked per entry of the smallest scale, 200 by default.
+QUESTIONS_PER_ENTRY = 0.2
+DICTIONARY_SIZE = 1_000
+PERCENTILES = (50, 95, 99)
+# Pause between questions letting prefetching catch up, as a learner would.
+THINK_TIME = 0.002
+# InquirerPy moves the pointer of a select prompt down on Ctrl+N.
+DOWN = "\x0e"
+
+
+def time_questions(
+    questions: Iterable[Question], asker: Asker, think_time: float = 0.0
+) -> list[float]:
+    """Time each question from drawing it to telling the user the grade.
+
+    Parameters
+    ----------
+    questions : Iterable[Question]
+        Questions to ask.
+    asker : Asker
+        The asker answering questions with scripted keystrokes.
+    think_time : float
+        Pause after each question in seconds, not timed.
+
+    Returns
+    ----------
+    latencies : list[float]
+        Durations in seconds, one for each question.
+    """
+    feedback = FeedbackSink()
+    latencies: list[float] = []
+    iterator = iter(questions)
+    while True:
+        start = time.perf_counter()
+        question = next(iterator, None)
+        if question is None:
+            return latencies
+        response = asker(question)
+        feedback.consume(Outcome(response, default_grader(response)))
+        latencies.append(time.perf_counter() - start)
+        time.sleep(think_time)
+
+
+def typing_asker(pipe: PipeInput, rng: Random, pool: Dictionary) -> Asker:
+    "Asker typing in the right translation or a word of another entry."
+
+    def asker(question: Question) -> Response:
+        entry = question.entry if rng.random() < 0.5 else rng.choice(pool.entries)
+        words = entry.words_b if question.a2b else entry.words_a
+        pipe.send_text(rng.choice(sorted(words)) + "\r")
+        return ask_typing(question)
+
+    return asker
+
+
+def choice_asker(pipe: PipeInput, rng: Random, pool: Dictionary) -> Asker:
+    "Asker picking the right option or a random one, as `ask_choice` does."
+
+    def asker(question: Question) -> Response:
+        options = question.options or choice_options(question, pool)
+        if rng.random() < 0.5:
+            target = options.index(question.entry)
+        else:
+            target = rng.randrange(len(options))
+        pipe.send_text(DOWN * target + "\r")
+        return pick_option(question, options)
+
+    return asker
+
+
+def time_numbers(pipe: PipeInput, rng: Random, n_questions: int) -> list[float]:
+    "Time questions of the numbers session, answered right half of the time."
+    prompter = PrompterInTheLanguage(Language.turkish)
+    latencies = []
+    for _ in range(n_questions):
+        number = rng.randrange(10**12)
+        answer = number if rng.random() < 0.5 else rng.randrange(10**12)
+        pipe.send_text(spell_number(answer) + "\r")
+        start = time.perf_counter()
+        practice_number(number, prompter)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def print_latencies(results: list[Result]) -> None:
+    "Print percentiles of latencies of questions."
+    table = Table(title="Latency of a question")
+    table.add_column("Session", justify="left")
+    for q in PERCENTILES:
+        table.add_column(f"p{q}, ms", justify="right")
+    for result in results:
+        table.add_row(
+            result.name, *(f"{result.percentile(q) * 1e3:.2f}" for q in PERCENTILES)
+        )
+    print(table)
+
+
+def run_prompts(
+    scales: list[int], directory: str, seed: int = 0, _repeats: int = 3
+) -> list[Result]:
+    """Time questions of sessions end to end, with scripted keystrokes.
+
+    Keystrokes are sent to prompts through a pipe, and prompts render to a
+    dummy output, so everything but the terminal is timed: building the
+    prompt, validating the input, grading and printing the feedback with
+    rich. Typing and choice questions are asked on a generated dictionary of
+    `DICTIONARY_SIZE` entries, choice questions once more prefetched on a
+    worker thread during `THINK_TIME` pauses, then numbers are spelled.
+    Latencies don't depend on the scale, so the smallest scale only sets the
+    number of questions of each kind, `QUESTIONS_PER_ENTRY` of it, and each
+    question is timed once.
+
+    Parameters
+    ----------
+    scales : list[int]
+        Scales of the run, the smallest one sets the number of questions.
+    directory : str
+        The directory generated dictionaries are kept in.
+    seed : int
+        Seed of the generated dictionary and scripted answers.
+    _repeats : int
+        Ignored, each question is a repeat.
+
+    Returns
+    ----------
+    results : list[Result]
+        Latencies of questions of each kind, compared by the median.
+    """
+    n_questions = max(1, int(min(scales) * QUESTIONS_PER_ENTRY))
+    rng = Random(seed)
+    random.seed(seed)
+    path = dictionary_path(directory, "csv", DICTIONARY_SIZE, seed)
+    dictionary = Dictionary.from_file(path, CSVDictionaryEntry)
+    questions = [
+        Question(rng.choice(dictionary.entries), i % 2 == 0) for i in range(n_questions)
+    ]
+    askers: dict[str, Callable[[PipeInput, Random, Dictionary], Asker]] = {
+        "latency:typing": typing_asker,
+        "latency:choice": choice_asker,
+    }
+    results = []
+    with create_pipe_input() as pipe, create_app_session(
+        input=pipe, output=DummyOutput()
+    ), get_console().capture(), output.redirect(RichBackend()):
+        for name, make_asker in askers.items():
+            latencies = time_questions(questions, make_asker(pipe, rng, dictionary))
+            results.append(Result(name, n_questions, latencies, "p50"))
+        prefetched = prefetch(
+            (Question(q.entry, q.a2b) for q in questions),
+            partial(prepare_choice, pool=dictionary),
+        )
+        asker = choice_asker(pipe, rng, dictionary)
+        latencies = time_questions(prefetched, asker, THINK_TIME)
+        results.append(Result("latency:choice+prefetch", n_questions, latencies, "p50"))
+        latencies = time_numbers(pipe, rng, n_questions)
+        results.append(Result("latency:numbers", n_questions, latencies, "p50"))
+    print_latencies(results)
+    return results
@@ -0,0 +1,108 @@
+from typing import Callable, Optional
+import os
+
+from rich import print
+import typer
+
+from practice_turkish.cache import cache_path
+from benchmarks.backends import run_backends
+from benchmarks.dictionaries import run_dictionaries
+from benchmarks.prompts import run_prompts
+from benchmarks.timing import (
+    DEFAULT_THRESHOLD,
+    Result,
+    compare,
+    load_results,
+    save_results,
+)
+
+Suite = Callable[[list[int], str, int, int], list[Result]]
+
+suites: dict[str, Suite] = {
+    "dictionaries": run_dictionaries,
+    "prompts": run_prompts,
+    "backends": run_backends,
+}
+
+
+def benchmark(
+    scales: Optional[list[int]] = typer.Option(
+        None,
+        "--scale",
+        help="Number of entries of generated dictionaries, may be repeated. "
+        "Default is 1000, 100000 and 1000000.",
+    ),
+    only: Optional[list[str]] = typer.Option(
+        None, "--suite", help=f"Suites to run, any of {', '.join(suites)}."
+    ),
+    seed: int = typer.Option(0, "--seed", help="Seed of generated dictionaries."),
+    repeats: int = typer.Option(3, "--repeats", help="Times each operation is timed."),
+    output: Optional[str] = typer.Option(
+        None, "--output", help="JSON file to write results to."
+    ),
+    baseline: Optional[str] = typer.Option(
+        None, "--baseline", help="JSON file with results to compare with."
+    ),
+    threshold: float = typer.Option(
+        DEFAULT_THRESHOLD,
+        "--threshold",
+        help="Ratio to the baseline time considered a regression.",
+    ),
+) -> None:
+    """Run benchmarks on generated dictionaries and compare with a baseline.
+
+    Generated dictionaries are kept in the cache directory, so they're written
+    only once for each scale and seed. Results are written as JSON, to be
+    passed as the baseline of later runs. The exit code is 1, if any
+    benchmark is slower than the baseline more than the threshold allows.
+
+    Parameters
+    ----------
+    scales : Optional[list[int]]
+        Numbers of entries of generated dictionaries.
+    only : Optional[list[str]]
+        Names of suites to run, all of them by default.
+    seed : int
+        Seed of generated dictionaries and random choices of benchmarks.
+    repeats : int
+        The number of times each operation is timed, the best time is compared.
+    output : Optional[str]
+        A path to write results to, `.practice_turkish/benchmarks/results.json`
+        by default.
+    baseline : Optional[str]
+        A path to results of an earlier run to compare with.
+    threshold : float
+        A benchmark regressed, if its best time is this many times longer than
+        the baseline one.
+    """
+    scales = scales or [1_000, 100_000, 1_000_000]
+    names = only or list(suites)
+    unknown = [name for name in names if name not in suites]
+    if unknown:
+        print(f"[red]Unknown suites[/red]: [yellow]{', '.join(unknown)}[/yellow]")
+        raise typer.Exit(code=2)
+
+    directory = os.path.dirname(cache_path("benchmarks", "data", "dictionary"))
+    results: list[Result] = []
+    for name in names:
+        print(f"Running [yellow]{name}[/yellow]...")
+        results += suites[name](scales, directory, seed, repeats)
+
+    output = output or cache_path("benchmarks", "results.json")
+    save_results(results, output)
+    regressions = compare(
+        results, load_results(baseline) if baseline else [], threshold
+    )
+    print(f"Results written to [yellow]{output}[/yellow].")
+    if regressions:
+        print(f"[red]{len(regressions)} benchmarks regressed.[/red]")
+        raise typer.Exit(code=1)
+
+
+def main() -> None:
+    "If open as a script, run benchmark function."
+    typer.run(benchmark)
+
+
+if __name__ == "__main__":
+    main()
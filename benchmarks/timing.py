@@ -0,0 +1,180 @@
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+import gc
+import json
+import math
+import platform
+import time
+
+from rich import print
+from rich.markup import escape
+from rich.table import Table
+
+DEFAULT_THRESHOLD = 1.2
+
+
+@dataclass
+class Result:
+    """A class used to represent timings of one benchmark.
+
+    Attributes
+    ----------
+    name : str
+        The name of the benchmark, e.g. "from_file:csv".
+    scale : int
+        The number of entries of the dictionary the benchmark ran on.
+    times : list[float]
+        Durations of repeats in seconds.
+    statistic : str
+        The statistic of durations compared between runs, "best" for the
+        shortest duration or a percentile like "p50".
+    """
+
+    name: str
+    scale: int
+    times: list[float]
+    statistic: str = "best"
+
+    @property
+    def key(self) -> str:
+        "The name and the scale identifying the benchmark between runs."
+        return f"{self.name}@{self.scale}"
+
+    @property
+    def best(self) -> float:
+        "The shortest duration, the least disturbed by other processes."
+        return min(self.times)
+
+    @property
+    def mean(self) -> float:
+        "The mean duration."
+        return sum(self.times) / len(self.times)
+
+    @property
+    def value(self) -> float:
+        "The statistic of durations compared between runs."
+        if self.statistic == "best":
+            return self.best
+        return self.percentile(float(self.statistic.removeprefix("p")))
+
+    def percentile(self, q: float) -> float:
+        "The duration not exceeded by q percent of repeats, by the nearest rank."
+        ordered = sorted(self.times)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+def measure(
+    function: Callable[[], object],
+    repeats: int = 5,
+    setup: Optional[Callable[[], object]] = None,
+) -> list[float]:
+    """Time calls of a function.
+
+    The garbage collector is disabled while the function runs, as `timeit`
+    does, so collections triggered by previous repeats don't add noise.
+
+    Parameters
+    ----------
+    function : Callable[[], object]
+        The function to time.
+    repeats : int
+        The number of calls.
+    setup : Optional[Callable[[], object]]
+        The function called before each call without being timed, e.g. to
+        restore the state changed by the previous call.
+
+    Returns
+    ----------
+    times : list[float]
+        Durations of calls in seconds.
+    """
+    times = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        finally:
+            if enabled:
+                gc.enable()
+    return times
+
+
+def save_results(results: list[Result], path: str) -> None:
+    "Write results to a JSON file together with the version of Python."
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.time(),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> list[Result]:
+    "Read results written by `save_results`."
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    return [Result(**result) for result in document["results"]]
+
+
+def compare(
+    results: list[Result],
+    baseline: list[Result],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[tuple[Result, Result]]:
+    """Print statistics of results next to the baseline and find regressions.
+
+    Parameters
+    ----------
+    results : list[Result]
+        Results of the current run.
+    baseline : list[Result]
+        Stored results of an earlier run.
+    threshold : float
+        A benchmark regressed, if its statistic is this many times longer
+        than the baseline one. Default is 1.2.
+
+    Returns
+    ----------
+    regressions : list[tuple[Result, Result]]
+        Pairs of the current and the baseline results of regressed benchmarks.
+    """
+    stored = {result.key: result for result in baseline}
+    table = Table(title="Benchmarks")
+    table.add_column("Benchmark", justify="left", overflow="fold")
+    table.add_column("Statistic", justify="left")
+    table.add_column("Time, ms", justify="right")
+    table.add_column("Baseline, ms", justify="right")
+    table.add_column("Ratio", justify="right")
+    regressions = []
+    for result in results:
+        old = stored.get(result.key)
+        if old is None:
+            table.add_row(
+                escape(result.key),
+                result.statistic,
+                f"{result.value * 1e3:.2f}",
+                "",
+                "",
+            )
+            continue
+        ratio = result.value / old.value
+        color = "red" if ratio > threshold else "green"
+        if ratio > threshold:
+            regressions.append((result, old))
+        table.add_row(
+            escape(result.key),
+            result.statistic,
+            f"{result.value * 1e3:.2f}",
+            f"{old.value * 1e3:.2f}",
+            f"[{color}]{ratio:.2f}[/{color}]",
+        )
+    print(table)
+    return regressions
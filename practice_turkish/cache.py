@@ -0,0 +1,27 @@
+import os
+
+
+CACHE_DIRECTORY = ".practice_turkish"
+
+
+def cache_path(*parts: str) -> str:
+    """Build a path inside the cache directory, creating parent directories.
+
+    The cache directory lives next to `config.ini` in the directory the
+    application is launched from. It stores indexes, which can always be
+    rebuilt from the dictionaries themselves, and weights of entries learned
+    in adaptive sessions.
+
+    Parameters
+    ----------
+    parts : str
+        Components of the path relative to the cache directory.
+
+    Returns
+    ----------
+    path : str
+        A string representing the path inside the cache directory.
+    """
+    path = os.path.join(CACHE_DIRECTORY, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
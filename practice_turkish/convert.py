@@ -0,0 +1,266 @@
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from typing import Iterator, Optional
+import os
+import time
+
+from rich import print
+from rich.markup import escape
+import typer
+
+from practice_turkish.dictionaries import (
+    Dictionary,
+    CSVDictionaryEntry,
+    TurkrutDictionaryEntry,
+)
+from practice_turkish.dictionaries.catalog import scan_directories
+from practice_turkish.dictionaries.compression import (
+    DECOMPRESSION_ERRORS,
+    has_extension,
+    strip_compression_suffix,
+)
+from practice_turkish.dictionaries.parse import inside_parenthesis
+from practice_turkish.make_csv import CSVDict, write_dictionary
+
+
+class ConversionStatus(str, Enum):
+    """Enum used to represent the outcome of converting one file."""
+
+    CONVERTED = "CONVERTED"
+    UP_TO_DATE = "UP_TO_DATE"
+    FAILED = "FAILED"
+
+
+def in_line_order(words: set[str], side: str) -> list[str]:
+    """Alternatives in the order they have in a side of a turkrut line.
+
+    Alternatives missing from the side, e.g. merged from another line, follow
+    in alphabetical order, so the order never depends on the order of a set.
+    """
+    hint = inside_parenthesis(side)
+    positions: dict[str, int] = {}
+    for i, word in enumerate(side.replace(f"({hint})", "").strip().split(", ")):
+        positions.setdefault(word, i)
+    return sorted(words, key=lambda word: (positions.get(word, len(positions)), word))
+
+
+def to_csv_entry(entry: TurkrutDictionaryEntry) -> CSVDictionaryEntry:
+    """Convert a turkrut dictionary entry into a CSV dictionary entry.
+
+    Alternatives keep the order they have in the turkrut line, so converting
+    the same file always gives the same result.
+    """
+    words_a = in_line_order(entry.words_a, entry.query_a)
+    words_b = in_line_order(entry.words_b, entry.query_b)
+    return CSVDictionaryEntry(
+        words_a,
+        words_b,
+        entry.language_a,
+        entry.language_b,
+        entry.hint_a,
+        entry.hint_b,
+    )
+
+
+def destination_path(source: str, root: str, output: str) -> str:
+    """Path of the CSV dictionary a turkrut dictionary is converted into.
+
+    Parameters
+    ----------
+    source : str
+        A path to the turkrut dictionary, possibly compressed.
+    root : str
+        The directory given by the user the source was found in, or the
+        directory of the source if it was given explicitly.
+    output : str
+        The directory CSV dictionaries are written to.
+
+    Returns
+    ----------
+    path : str
+        The path within the output directory with the same relative location
+        as the source within the root, and ".csv" extension.
+    """
+    relative = os.path.relpath(strip_compression_suffix(source), root)
+    return os.path.join(output, os.path.splitext(relative)[0] + ".csv")
+
+
+def is_up_to_date(source: str, destination: str) -> bool:
+    "Check if the destination exists and was modified after the source."
+    try:
+        return os.stat(destination).st_mtime_ns >= os.stat(source).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def convert_file(source: str, destination: str) -> tuple[ConversionStatus, str]:
+    """Convert one turkrut dictionary into a CSV dictionary.
+
+    The dictionary is written to a temporary file first, which then replaces
+    the destination, so an interrupted conversion never leaves a truncated
+    file looking up to date.
+
+    Parameters
+    ----------
+    source : str
+        A path to the turkrut dictionary.
+    destination : str
+        A path to the CSV dictionary to write.
+
+    Returns
+    ----------
+    status : ConversionStatus
+        CONVERTED or FAILED.
+    message : str
+        The number of entries, or the reason of the failure.
+    """
+    try:
+        turkrut = Dictionary.from_file(source, TurkrutDictionaryEntry)
+    except OSError as error:
+        return ConversionStatus.FAILED, f"can't be read: {error}"
+    except (ValueError, UnicodeDecodeError, *DECOMPRESSION_ERRORS) as error:
+        return ConversionStatus.FAILED, f"can't be parsed: {error}"
+
+    dictionary: CSVDict = Dictionary(
+        [to_csv_entry(entry) for entry in turkrut],
+        turkrut.language_a,
+        turkrut.language_b,
+    )
+    temporary = f"{destination}.tmp"
+    try:
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        write_dictionary(dictionary, temporary)
+        os.replace(temporary, destination)
+    except OSError as error:
+        return ConversionStatus.FAILED, f"can't be written: {error}"
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return ConversionStatus.CONVERTED, f"{len(dictionary)} entries"
+
+
+def find_conversions(paths: list[str], output: str) -> Iterator[tuple[str, str]]:
+    "Generator yielding turkrut dictionaries and their destinations."
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path, destination_path(path, os.path.dirname(path), output)
+            continue
+        for source in scan_directories([path]):
+            if has_extension(source, TurkrutDictionaryEntry.extension()):
+                yield source, destination_path(source, path, output)
+
+
+def convert_files(
+    conversions: list[tuple[str, str]], processes: Optional[int] = None
+) -> Iterator[tuple[str, str, ConversionStatus, str]]:
+    """Generator yielding outcomes of conversions, converting files in parallel.
+
+    Files are distributed among worker processes in batches. Results are
+    yielded in the order of conversions.
+
+    Parameters
+    ----------
+    conversions : list[tuple[str, str]]
+        Pairs of paths to turkrut dictionaries and CSV dictionaries to write.
+    processes : Optional[int]
+        The number of worker processes, the number of CPUs by default. Files
+        are converted in this process if it's 1 or there are few files.
+
+    Yields
+    ----------
+    source : str
+        A path to the turkrut dictionary.
+    destination : str
+        A path to the CSV dictionary.
+    status : ConversionStatus
+        CONVERTED or FAILED.
+    message : str
+        The number of entries, or the reason of the failure.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    sources = [source for source, _ in conversions]
+    destinations = [destination for _, destination in conversions]
+    if processes == 1 or len(conversions) < 2 * processes:
+        results: Iterator[tuple[ConversionStatus, str]] = map(
+            convert_file, sources, destinations
+        )
+        for source, destination, (status, message) in zip(
+            sources, destinations, results
+        ):
+            yield source, destination, status, message
+        return
+
+    chunksize = max(1, len(conversions) // (processes * 8))
+    with ProcessPoolExecutor(processes) as executor:
+        results = executor.map(convert_file, sources, destinations, chunksize=chunksize)
+        for source, destination, (status, message) in zip(
+            sources, destinations, results
+        ):
+            yield source, destination, status, message
+
+
+def convert(
+    paths: list[str] = typer.Argument(
+        ..., help="Turkrut dictionaries or directories with them."
+    ),
+    output: str = typer.Option(
+        CSVDictionaryEntry.default_directory(),
+        "--output",
+        help="Directory to write CSV dictionaries to.",
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Convert files even if they are up to date."
+    ),
+    processes: Optional[int] = typer.Option(
+        None, "--processes", help="Number of worker processes, all CPUs by default."
+    ),
+) -> None:
+    """Convert turkrut dictionaries into CSV dictionaries.
+
+    Files found in directories keep their relative location inside the output
+    directory. A file is skipped if its CSV dictionary was modified after it,
+    so converting the same files again only converts new and changed ones.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Turkrut dictionaries or directories with them.
+    output : str
+        The directory to write CSV dictionaries to, "CSV" by default.
+    force : bool
+        True, if up to date files should be converted again.
+    processes : Optional[int]
+        The number of worker processes, the number of CPUs by default.
+    """
+    start = time.perf_counter()
+    counts = {status: 0 for status in ConversionStatus}
+    pending = []
+    for source, destination in find_conversions(paths, output):
+        if not force and is_up_to_date(source, destination):
+            counts[ConversionStatus.UP_TO_DATE] += 1
+        else:
+            pending.append((source, destination))
+
+    for source, _, status, message in convert_files(pending, processes):
+        counts[status] += 1
+        if status == ConversionStatus.FAILED:
+            print(f"[red]{escape(source)}[/red] {escape(message)}")
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Converted [green]{counts[ConversionStatus.CONVERTED]}[/green] files, "
+        f"{counts[ConversionStatus.UP_TO_DATE]} up to date, "
+        f"[red]{counts[ConversionStatus.FAILED]}[/red] failed in {elapsed:.2f} s."
+    )
+    if counts[ConversionStatus.FAILED]:
+        raise typer.Exit(code=1)
+
+
+def main() -> None:
+    """If open as a script, run convert function."""
+    typer.run(convert)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from practice_turkish.dictionaries.dictionary import (
     Dictionary,
     DictionaryEntry,
     DictionaryFormatError,
+    FileDictionaryEntry,
 )
 from practice_turkish.dictionaries.csvdictionary import CSVDictionaryEntry
 from practice_turkish.dictionaries.turkrutdictionary import TurkrutDictionaryEntry
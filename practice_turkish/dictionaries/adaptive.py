@@ -0,0 +1,182 @@
+from typing import Generic, Iterator, Optional
+import hashlib
+import json
+import os
+import random
+
+from practice_turkish.cache import cache_path
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import Dictionary, DictionaryFormatError
+from practice_turkish.dictionaries.dictionary import DE
+from practice_turkish.dictionaries.fenwick import FenwickTree
+
+DEFAULT_WEIGHT = 1.0
+MISTAKE_FACTOR = 2.0
+CORRECT_FACTOR = 0.7
+MIN_WEIGHT = 0.05
+MAX_WEIGHT = 1024.0
+
+
+def entry_key(entry: DE) -> str:
+    "A key identifying an entry between sessions, even if the file is reordered."
+    return f"{entry.query_a}\t{entry.query_b}"
+
+
+def weights_path(path: str) -> str:
+    "Path of the file storing weights of entries of the dictionary file."
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return cache_path("weights", f"{digest}.json")
+
+
+def load_weights(path: str) -> dict[str, float]:
+    """Load weights of entries of a dictionary file saved by previous sessions.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the dictionary file.
+
+    Returns
+    ----------
+    weights : dict[str, float]
+        Weights of entries by their keys, see `entry_key`. Empty if the
+        dictionary wasn't practiced adaptively before.
+    """
+    try:
+        with open(weights_path(path), encoding="utf-8") as f:
+            return dict(json.load(f)["weights"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def save_weights(path: str, weights: dict[str, float]) -> None:
+    "Save weights of entries of a dictionary file, omitting default ones."
+    changed = {
+        key: weight for key, weight in weights.items() if weight != DEFAULT_WEIGHT
+    }
+    with open(weights_path(path), "w", encoding="utf-8") as f:
+        json.dump({"path": os.path.abspath(path), "weights": changed}, f)
+
+
+class AdaptiveDictionary(Generic[DE]):
+    """A class used to practice a dictionary focusing on mistakes.
+
+    Questions are drawn with probabilities proportional to weights of entries.
+    The weight of an entry is multiplied by `MISTAKE_FACTOR` after each wrong
+    answer and by `CORRECT_FACTOR` after each correct one, within the range
+    from `MIN_WEIGHT` to `MAX_WEIGHT`. Weights are kept in a Fenwick tree, so
+    both drawing a question and updating a weight cost O(log n), and persist
+    between sessions.
+
+    Attributes
+    ----------
+    dictionary : Dictionary
+        The practiced dictionary.
+    path : str
+        A string representing a path to the dictionary file.
+    n_questions : int
+        The number of questions drawn by iterating over the dictionary.
+
+    Methods
+    ----------
+    def draw(self) -> DictionaryEntry
+        Draw a random entry, avoiding the previous one.
+
+    def record(self, entry: DictionaryEntry, is_correct: bool) -> None
+        Update the weight of an entry after an answer.
+
+    def sample(self, k: int) -> list[DictionaryEntry]
+        Draw k distinct random entries uniformly.
+
+    def save(self) -> None
+        Save weights of entries for the following sessions.
+    """
+
+    def __init__(
+        self,
+        dictionary: Dictionary[DE],
+        path: str,
+        n_questions: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Create an adaptive session over a dictionary.
+
+        Parameters
+        ----------
+        dictionary : Dictionary
+            The dictionary to practice.
+        path : str
+            A string representing a path to the dictionary file, which
+            identifies saved weights.
+        n_questions : Optional[int]
+            The number of questions in the session, the number of entries by
+            default.
+        seed : Optional[int]
+            Seed of the random number generator drawing questions.
+
+        Raises
+        ----------
+        DictionaryFormatError
+            If the dictionary is empty.
+        """
+        if not dictionary:
+            raise DictionaryFormatError("The dictionary is empty.")
+        self.dictionary = dictionary
+        self.path = path
+        self.n_questions = len(dictionary) if n_questions is None else n_questions
+        self._rng = random.Random(seed)
+        self._weights = load_weights(path)
+        self._positions = {id(entry): i for i, entry in enumerate(dictionary)}
+        self._tree = FenwickTree(
+            self._weights.get(entry_key(entry), DEFAULT_WEIGHT) for entry in dictionary
+        )
+        self._previous: Optional[int] = None
+
+    @property
+    def language_a(self) -> Language:
+        "Language A of the dictionary."
+        return self.dictionary.language_a
+
+    @property
+    def language_b(self) -> Language:
+        "Language B of the dictionary."
+        return self.dictionary.language_b
+
+    def draw(self) -> DE:
+        "Draw a random entry, avoiding the previous one if there are others."
+        i = self._tree.draw(self._rng)
+        if i == self._previous and len(self.dictionary) > 1:
+            i = self._tree.draw(self._rng)
+        self._previous = i
+        return self.dictionary[i]
+
+    def record(self, entry: DE, is_correct: bool) -> None:
+        """Update the weight of an entry after an answer.
+
+        Parameters
+        ----------
+        entry : DictionaryEntry
+            The entry of the dictionary the user answered.
+        is_correct : bool
+            True, if the answer was correct.
+        """
+        i = self._positions[id(entry)]
+        factor = CORRECT_FACTOR if is_correct else MISTAKE_FACTOR
+        weight = min(max(self._tree[i] * factor, MIN_WEIGHT), MAX_WEIGHT)
+        self._tree.set(i, weight)
+        self._weights[entry_key(entry)] = weight
+
+    def sample(self, k: int) -> list[DE]:
+        "Draw k distinct random entries uniformly."
+        return self.dictionary.sample(k)
+
+    def save(self) -> None:
+        "Save weights of entries for the following sessions."
+        save_weights(self.path, self._weights)
+
+    def __iter__(self) -> Iterator[DE]:
+        for _ in range(self.n_questions):
+            yield self.draw()
+
+    def __len__(self) -> int:
+        return self.n_questions
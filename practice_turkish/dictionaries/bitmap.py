@@ -0,0 +1,360 @@
+from abc import ABC, abstractmethod
+from itertools import repeat
+from typing import TYPE_CHECKING, Callable, Generic, Iterator, Sequence, TypeVar
+import re
+
+from practice_turkish.dictionaries.duplicates import normalize_word
+
+if TYPE_CHECKING:
+    from practice_turkish.dictionaries.dictionary import DictionaryEntry
+
+DE = TypeVar("DE", bound="DictionaryEntry")
+T = TypeVar("T")
+
+Predicate = Callable[["DictionaryEntry"], bool]
+
+MAX_LENGTH = 255
+# Letters whose bitsets are built with the index, the lowercase Turkish
+# alphabet and letters with circumflex.
+TURKISH_LETTERS = "abcçdefgğhıijklmnoöprsştuüvyzâîû"
+FLAG_DIGITS = b"01" + b"0" * 254
+
+token_pattern = re.compile(r"\s*(\(|\)|&|\||!|~|[^\s()&|!~]+)")
+
+
+class FilterExpressionError(ValueError):
+    """Exception raised if a filter expression can't be parsed."""
+
+
+def from_flags(flags: bytes, table: bytes = FLAG_DIGITS) -> int:
+    """Pack bytes into a bitset, the i-th bit set if the i-th byte is "true".
+
+    Bytes are translated into binary digits by the table, by default 1 is
+    translated into "1" and anything else into "0". The packing runs in C.
+    """
+    if not flags:
+        return 0
+    return int(flags.translate(table)[::-1], 2)
+
+
+def iterate_bits(bits: int) -> Iterator[int]:
+    "Generator yielding indices of set bits in ascending order."
+    digits = format(bits, "b")[::-1]
+    i = digits.find("1")
+    while i >= 0:
+        yield i
+        i = digits.find("1", i + 1)
+
+
+def entry_texts(entry: "DictionaryEntry") -> list[str]:
+    "Normalized alternatives of the entry in both languages."
+    texts = [normalize_word(word, entry.language_a) for word in entry.words_a]
+    texts += [normalize_word(word, entry.language_b) for word in entry.words_b]
+    return texts
+
+
+def shortest_length(entry: "DictionaryEntry") -> int:
+    "The length of the shortest word of the entry in language A, at most 255."
+    shortest = min(map(len, entry.words_a), default=0)
+    return min(shortest, MAX_LENGTH)
+
+
+def parse_length(bounds: str) -> tuple[int, int]:
+    """Parse bounds of a `len:` feature, e.g. "3-6", "-4", "5-" or "3".
+
+    Raises
+    ----------
+    FilterExpressionError
+        If a bound isn't a number.
+    """
+    low_text, _, high_text = bounds.partition("-")
+    if "-" not in bounds:
+        high_text = low_text
+    try:
+        low = int(low_text) if low_text else 0
+        high = int(high_text) if high_text else MAX_LENGTH
+    except ValueError:
+        raise FilterExpressionError(f"Invalid length range {bounds!r}.")
+    return low, high
+
+
+class FilterExpression(ABC, Generic[T]):
+    """An ABC used to evaluate filter expressions.
+
+    Expressions combine features with `&` (and), `|` (or), `!` (not) and
+    parenthesis, `not` binding tighter than `and`, and `and` tighter than
+    `or`. Words `and`, `or` and `not` may be used instead of symbols.
+    Features:
+    - `hint`: the entry has a hint in any of the languages.
+    - `phrase`: an alternative in any language consists of several words.
+    - `has:<letters>`: a word contains any of the letters, e.g. `has:ğşı`.
+    - `len:<low>-<high>`: the shortest word in language A has from low to high
+      letters. Either bound may be omitted, `len:<n>` means exactly n.
+
+    Subclasses define what a feature evaluates to and how values of features
+    are combined, e.g. bitsets of entries or predicates checking one entry.
+
+    Methods
+    ----------
+    def feature(self, name: str) -> T
+        The value of the feature.
+
+    def negate(self, value: T) -> T
+        The value of the negated expression.
+
+    def both(self, left: T, right: T) -> T
+        The value of the conjunction of expressions.
+
+    def either(self, left: T, right: T) -> T
+        The value of the disjunction of expressions.
+
+    def evaluate(self, expression: str) -> T
+        The value of the filter expression.
+    """
+
+    @abstractmethod
+    def feature(self, name: str) -> T:
+        """The value of the feature.
+
+        Raises
+        ----------
+        FilterExpressionError
+            If the feature is unknown.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def negate(self, value: T) -> T:
+        "The value of the negated expression."
+        raise NotImplementedError
+
+    @abstractmethod
+    def both(self, left: T, right: T) -> T:
+        "The value of the conjunction of expressions."
+        raise NotImplementedError
+
+    @abstractmethod
+    def either(self, left: T, right: T) -> T:
+        "The value of the disjunction of expressions."
+        raise NotImplementedError
+
+    def evaluate(self, expression: str) -> T:
+        """The value of the filter expression.
+
+        Parameters
+        ----------
+        expression : str
+            The filter expression, e.g. "hint & !phrase" or "has:ğş | len:-4".
+
+        Raises
+        ----------
+        FilterExpressionError
+            If the expression can't be parsed.
+        """
+        tokens = tokenize(expression)
+        position, value = self._parse_or(tokens, 0)
+        if position != len(tokens):
+            raise FilterExpressionError(f"Unexpected {tokens[position]!r}.")
+        return value
+
+    def _parse_or(self, tokens: list[str], position: int) -> tuple[int, T]:
+        position, value = self._parse_and(tokens, position)
+        while position < len(tokens) and tokens[position] in ("|", "or"):
+            position, other = self._parse_and(tokens, position + 1)
+            value = self.either(value, other)
+        return position, value
+
+    def _parse_and(self, tokens: list[str], position: int) -> tuple[int, T]:
+        position, value = self._parse_not(tokens, position)
+        while position < len(tokens) and tokens[position] in ("&", "and"):
+            position, other = self._parse_not(tokens, position + 1)
+            value = self.both(value, other)
+        return position, value
+
+    def _parse_not(self, tokens: list[str], position: int) -> tuple[int, T]:
+        if position >= len(tokens):
+            raise FilterExpressionError("Unexpected end of the expression.")
+        token = tokens[position]
+        if token in ("!", "~", "not"):
+            position, value = self._parse_not(tokens, position + 1)
+            return position, self.negate(value)
+        if token == "(":
+            position, value = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ")":
+                raise FilterExpressionError("Missing closing parenthesis.")
+            return position + 1, value
+        if token in (")", "&", "|", "and", "or"):
+            raise FilterExpressionError(f"Unexpected {token!r}.")
+        return position + 1, self.feature(token)
+
+
+class BitmapIndex(FilterExpression[int], Generic[DE]):
+    """A class used to select dictionary entries by combinations of features.
+
+    Each feature is a bitset stored in an `int`, with the i-th bit set if the
+    i-th entry has the feature. Features are combined with bitwise operations
+    on whole integers, which take time proportional to n/64 for n entries,
+    rather than checking entries one by one. The index is built once: bitsets
+    of hints, phrases and of each letter of `TURKISH_LETTERS` are computed
+    right away, so `has:` is an `|` of bitsets of its letters. Bitsets of
+    other letters and of lengths are computed on first use and cached. See
+    `FilterExpression` for the syntax of expressions.
+
+    Methods
+    ----------
+    def feature(self, name: str) -> int
+        Bitset of entries with the feature.
+
+    def evaluate(self, expression: str) -> int
+        Bitset of entries matching the filter expression.
+
+    def select(self, bits: int) -> list[DictionaryEntry]
+        Entries whose bits are set.
+    """
+
+    def __init__(self, entries: Sequence[DE]) -> None:
+        self.entries = entries
+        self.n = len(entries)
+        self.all = (1 << self.n) - 1
+        hints = bytearray(self.n)
+        phrases = bytearray(self.n)
+        lengths = bytearray(self.n)
+        self._texts: list[str] = []
+        for i, entry in enumerate(entries):
+            texts = entry_texts(entry)
+            self._texts.append("\t".join(texts))
+            hints[i] = entry.has_hint
+            phrases[i] = any(" " in text for text in texts)
+            lengths[i] = shortest_length(entry)
+        self._lengths = bytes(lengths)
+        self._features = {"hint": from_flags(hints), "phrase": from_flags(phrases)}
+        self._letters: dict[str, int] = {}
+        for letter in TURKISH_LETTERS:
+            self._letter(letter)
+
+    def _letter(self, letter: str) -> int:
+        bits = self._letters.get(letter)
+        if bits is None:
+            # The letter is looked up in all texts by `map`, which runs in C.
+            found = map(str.__contains__, self._texts, repeat(letter))
+            bits = self._letters[letter] = from_flags(bytes(found))
+        return bits
+
+    def _has(self, letters: str) -> int:
+        bits = 0
+        for letter in set(letters.lower()):
+            bits |= self._letter(letter)
+        return bits
+
+    def _length(self, bounds: str) -> int:
+        low, high = parse_length(bounds)
+        table = bytes(49 if low <= i <= high else 48 for i in range(256))
+        return from_flags(self._lengths, table)
+
+    def feature(self, name: str) -> int:
+        """Bitset of entries with the feature.
+
+        Parameters
+        ----------
+        name : str
+            The feature, e.g. "hint", "has:ğ" or "len:3-6".
+
+        Returns
+        ----------
+        bits : int
+            The bitset with the i-th bit set if the i-th entry has the feature.
+
+        Raises
+        ----------
+        FilterExpressionError
+            If the feature is unknown.
+        """
+        bits = self._features.get(name)
+        if bits is not None:
+            return bits
+        kind, _, argument = name.partition(":")
+        builders: dict[str, Callable[[str], int]] = {
+            "has": self._has,
+            "len": self._length,
+        }
+        if kind not in builders or not argument:
+            raise FilterExpressionError(f"Unknown feature {name!r}.")
+        bits = builders[kind](argument)
+        self._features[name] = bits
+        return bits
+
+    def negate(self, value: int) -> int:
+        return self.all ^ value
+
+    def both(self, left: int, right: int) -> int:
+        return left & right
+
+    def either(self, left: int, right: int) -> int:
+        return left | right
+
+    def select(self, bits: int) -> list[DE]:
+        "Entries whose bits are set, in the order of the dictionary."
+        entries = self.entries
+        return [entries[i] for i in iterate_bits(bits)]
+
+    def __len__(self) -> int:
+        return self.n
+
+
+class EntryMatcher(FilterExpression[Predicate]):
+    """A class used to check single entries against filter expressions.
+
+    Features are the same as features of `BitmapIndex`, computed from the
+    entry itself, so entries of a stream or a few changed entries are checked
+    without building an index. See `FilterExpression` for the syntax.
+    """
+
+    def feature(self, name: str) -> Predicate:
+        if name == "hint":
+            return lambda entry: entry.has_hint
+        if name == "phrase":
+            return lambda entry: any(" " in text for text in entry_texts(entry))
+        kind, _, argument = name.partition(":")
+        if kind == "has" and argument:
+            letters = frozenset(argument.lower())
+            return lambda entry: any(
+                not letters.isdisjoint(text) for text in entry_texts(entry)
+            )
+        if kind == "len" and argument:
+            low, high = parse_length(argument)
+            return lambda entry: low <= shortest_length(entry) <= high
+        raise FilterExpressionError(f"Unknown feature {name!r}.")
+
+    def negate(self, value: Predicate) -> Predicate:
+        return lambda entry: not value(entry)
+
+    def both(self, left: Predicate, right: Predicate) -> Predicate:
+        return lambda entry: left(entry) and right(entry)
+
+    def either(self, left: Predicate, right: Predicate) -> Predicate:
+        return lambda entry: left(entry) or right(entry)
+
+
+def compile_filter(expression: str) -> Predicate:
+    """Create a predicate checking if an entry matches the filter expression.
+
+    Raises
+    ----------
+    FilterExpressionError
+        If the expression can't be parsed.
+    """
+    return EntryMatcher().evaluate(expression)
+
+
+def tokenize(expression: str) -> list[str]:
+    "Split a filter expression into tokens."
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = token_pattern.match(expression, position)
+        if match is None:
+            raise FilterExpressionError(f"Can't parse {expression[position:]!r}.")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
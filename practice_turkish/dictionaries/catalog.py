@@ -0,0 +1,337 @@
+from dataclasses import dataclass, field, asdict
+from typing import Iterable, Iterator, Optional, Type
+import csv
+import hashlib
+import json
+import os
+
+from practice_turkish.cache import cache_path
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import (
+    DictionaryEntry,
+    DictionaryFormatError,
+    FileDictionaryEntry,
+    CSVDictionaryEntry,
+    TurkrutDictionaryEntry,
+)
+from practice_turkish.dictionaries.compression import (
+    DECOMPRESSION_ERRORS,
+    compression_suffix,
+    open_binary,
+    open_text,
+)
+from practice_turkish.dictionaries.csvdictionary import parse_header
+from practice_turkish.dictionaries.turkrutdictionary import separator_pattern
+
+FORMATS: dict[str, Type[FileDictionaryEntry]] = {
+    "turkrut": TurkrutDictionaryEntry,
+    "csv": CSVDictionaryEntry,
+}
+
+SNIFF_SIZE = 4096
+CHUNK_SIZE = 1 << 20
+
+
+def sniff_format(path: str) -> Optional[str]:
+    """Detect the format of a dictionary file from its first bytes.
+
+    A file is considered a CSV dictionary if its first line is a valid CSV
+    header, and a turkrut dictionary if its first line is split by a dash into
+    exactly two parts. Compressed files are decompressed on the fly.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the file.
+
+    Returns
+    ----------
+    format : Optional[str]
+        A key of `FORMATS` if the format is recognized, None otherwise.
+    """
+    with open_binary(path) as f:
+        head = f.read(SNIFF_SIZE)
+    text = head.decode("utf-8", errors="ignore")
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return None
+
+    first_line = lines[0]
+    try:
+        parse_header(next(csv.reader([first_line], delimiter=";")))
+        return "csv"
+    except DictionaryFormatError:
+        pass
+    if len(separator_pattern.split(first_line)) == 2:
+        return "turkrut"
+    return None
+
+
+def detect_entry_type(path: str) -> Optional[Type[DictionaryEntry]]:
+    "Detect the type of entries of a dictionary file, None if not recognized."
+    format = sniff_format(path)
+    return None if format is None else FORMATS[format]
+
+
+@dataclass
+class CatalogEntry:
+    """A class used to represent metadata of a dictionary file.
+
+    Attributes
+    ----------
+    path : str
+        A string representing a path to the file.
+    format : str
+        A key of `FORMATS`.
+    language_a : Language
+        Language A of the dictionary.
+    language_b : Language
+        Language B of the dictionary.
+    entries : int
+        The number of entries in the dictionary.
+    sha1 : str
+        Hex digest of the content of the file.
+    mtime_ns : int
+        Modification time of the file the metadata was collected at.
+    size : int
+        Size of the file in bytes the metadata was collected at.
+    """
+
+    path: str
+    format: str
+    language_a: Language
+    language_b: Language
+    entries: int
+    sha1: str
+    mtime_ns: int
+    size: int
+
+    @property
+    def entry_type(self) -> Type[DictionaryEntry]:
+        "Type of entries of the dictionary."
+        return FORMATS[self.format]
+
+    def is_up_to_date(self, stat: os.stat_result) -> bool:
+        "Check if the metadata still describes a file with the given status."
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+    @classmethod
+    def from_file(cls, path: str) -> Optional["CatalogEntry"]:
+        """Collect metadata of a dictionary file.
+
+        Only the first bytes of the file are parsed in order to detect the
+        format and languages, the rest of it is read in binary chunks to count
+        lines which aren't blank and compute the hash. The hash is computed over the file as it is
+        stored, that is over compressed bytes for compressed files.
+
+        Parameters
+        ----------
+        path : str
+            A string representing a path to the file.
+
+        Returns
+        ----------
+        entry : Optional[CatalogEntry]
+            Metadata of the file, None if the format isn't recognized.
+        """
+        format = sniff_format(path)
+        if format is None:
+            return None
+
+        stat = os.stat(path)
+        sha1 = hashlib.sha1()
+        lines = 0
+        pending = b""
+        compressed = bool(compression_suffix(path))
+        if compressed:
+            with open(path, "rb") as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    sha1.update(chunk)
+        with open_binary(path) as f:
+            while chunk := f.read(CHUNK_SIZE):
+                if not compressed:
+                    sha1.update(chunk)
+                *complete, pending = (pending + chunk).split(b"\n")
+                lines += sum(map(bool, map(bytes.strip, complete)))
+        lines += bool(pending.strip())
+
+        if format == "csv":
+            with open_text(path) as f:
+                header = next(csv.reader(f, delimiter=";"))
+            language_a, language_b = parse_header(header)
+            entries = lines - 1
+        else:
+            language_a, language_b = Language.turkish, Language.russian
+            entries = lines
+        return cls(
+            path,
+            format,
+            language_a,
+            language_b,
+            entries,
+            sha1.hexdigest(),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+
+def default_directories() -> list[str]:
+    "Default directories of all supported formats."
+    return [type.default_directory() for type in FORMATS.values()]
+
+
+def scan_directories(directories: Iterable[str]) -> Iterator[str]:
+    "Generator yielding paths of all visible files inside the directories."
+    for directory in directories:
+        for root, subdirectories, filenames in os.walk(directory):
+            subdirectories[:] = sorted(
+                name for name in subdirectories if not name.startswith(".")
+            )
+            for filename in sorted(filenames):
+                if not filename.startswith("."):
+                    yield os.path.join(root, filename)
+
+
+@dataclass
+class Catalog:
+    """A class used to represent an index of dictionary files.
+
+    The catalog stores metadata of each dictionary found in the default
+    directories, so it's possible to list dictionaries without parsing them.
+    The index is kept in a JSON file and refreshed incrementally: a file is
+    read again only if its modification time or size changed. Files which
+    aren't dictionaries are remembered the same way, so they aren't sniffed
+    again on each refresh.
+
+    Attributes
+    ----------
+    path : str
+        A string representing a path to the index file.
+    entries : dict[str, CatalogEntry]
+        Metadata of dictionary files indexed by their paths.
+    skipped : dict[str, tuple[int, int]]
+        Modification times and sizes of other files indexed by their paths.
+
+    Methods
+    ----------
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Catalog
+        Load the catalog from the index file.
+
+    def refresh(self, directories: Optional[Iterable[str]] = None) -> bool
+        Bring the catalog up to date with files inside the directories.
+
+    def save(self) -> None
+        Write the catalog to the index file.
+    """
+
+    path: str
+    entries: dict[str, CatalogEntry] = field(default_factory=dict)
+    skipped: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "Catalog":
+        "Load the catalog from the index file, empty if it's missing or broken."
+        if path is None:
+            path = cache_path("catalog.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                index = json.load(f)
+            records = index["entries"]
+            skipped = {
+                filepath: (mtime_ns, size)
+                for filepath, mtime_ns, size in index["skipped"]
+            }
+            entries = [
+                CatalogEntry(
+                    **(
+                        record
+                        | {
+                            "language_a": Language(record["language_a"]),
+                            "language_b": Language(record["language_b"]),
+                        }
+                    )
+                )
+                for record in records
+            ]
+        except (OSError, ValueError, TypeError, KeyError):
+            return cls(path)
+        return cls(path, {entry.path: entry for entry in entries}, skipped)
+
+    def refresh(self, directories: Optional[Iterable[str]] = None) -> bool:
+        """Bring the catalog up to date with files inside the directories.
+
+        Parameters
+        ----------
+        directories : Optional[Iterable[str]]
+            Directories to scan, default directories of all formats if None.
+
+        Returns
+        ----------
+        changed : bool
+            True, if any metadata was added, updated or removed.
+        """
+        if directories is None:
+            directories = default_directories()
+
+        changed = False
+        entries: dict[str, CatalogEntry] = {}
+        skipped: dict[str, tuple[int, int]] = {}
+        for path in scan_directories(directories):
+            stat = os.stat(path)
+            stamp = stat.st_mtime_ns, stat.st_size
+            entry = self.entries.get(path)
+            if entry is not None and entry.is_up_to_date(stat):
+                entries[path] = entry
+                continue
+            if self.skipped.get(path) == stamp:
+                skipped[path] = stamp
+                continue
+            try:
+                entry = CatalogEntry.from_file(path)
+            except (
+                OSError,
+                UnicodeDecodeError,
+                DictionaryFormatError,
+                *DECOMPRESSION_ERRORS,
+            ):
+                entry = None
+            if entry is None:
+                skipped[path] = stamp
+            else:
+                entries[path] = entry
+            changed = True
+        changed |= entries.keys() != self.entries.keys()
+        changed |= skipped.keys() != self.skipped.keys()
+        self.entries = entries
+        self.skipped = skipped
+        return changed
+
+    def save(self) -> None:
+        "Write the catalog to the index file."
+        with open(self.path, mode="w", encoding="utf-8") as f:
+            index = {
+                "entries": [asdict(entry) for entry in self],
+                "skipped": [
+                    [path, mtime_ns, size]
+                    for path, (mtime_ns, size) in sorted(self.skipped.items())
+                ],
+            }
+            json.dump(index, f, ensure_ascii=False)
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(sorted(self.entries.values(), key=lambda entry: entry.path))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, path: str) -> CatalogEntry:
+        return self.entries[path]
+
+
+def load_catalog() -> Catalog:
+    "Load the catalog, refresh it and save if anything changed."
+    catalog = Catalog.load()
+    if catalog.refresh():
+        catalog.save()
+    return catalog
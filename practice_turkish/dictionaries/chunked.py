@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Iterator
+import csv
+import io
+import os
+
+from practice_turkish.dictionaries import DictionaryFormatError
+
+MIN_CHUNK_SIZE = 1 << 20
+CHUNKS_PER_PROCESS = 4
+SEPARATOR = "\x1f"
+
+Record = tuple[str, str, str, str]
+Batch = tuple[int, str, str, str, str]
+
+
+class ChunkBoundaryError(DictionaryFormatError):
+    "Raised if a CSV file can't be parsed in independent chunks."
+
+
+def split_byte_ranges(path: str, n_chunks: int) -> tuple[bytes, list[tuple[int, int]]]:
+    """Split a file after its first line into byte ranges at line boundaries.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the file.
+    n_chunks : int
+        The desired number of ranges. Fewer ranges are returned for small files.
+
+    Returns
+    ----------
+    header : bytes
+        The first line of the file.
+    ranges : list[tuple[int, int]]
+        Pairs of start (inclusive) and end (exclusive) offsets of each range.
+        Each range begins at the beginning of a line.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        start = f.tell()
+        n_chunks = max(1, min(n_chunks, (size - start) // MIN_CHUNK_SIZE))
+        step = (size - start) // n_chunks
+
+        boundaries = [start]
+        for i in range(1, n_chunks):
+            f.seek(max(start + i * step, boundaries[-1]))
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+        boundaries.append(size)
+    ranges = [
+        (begin, end) for begin, end in zip(boundaries, boundaries[1:]) if begin < end
+    ]
+    return header, ranges
+
+
+def parse_chunk(path: str, start: int, end: int) -> Batch:
+    """Parse records of a CSV dictionary within a byte range.
+
+    Used by worker processes. Instead of a list of records, each column is
+    returned as a single string with values separated by the ASCII unit
+    separator. Such a batch is a handful of objects, so it's cheap to pickle
+    and send back to the main process, where it's split with `str.split`.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the file.
+    start : int
+        Offset of the beginning of the range, which is a beginning of a line.
+    end : int
+        Offset of the end of the range, which is a beginning of a line or the
+        end of the file.
+
+    Returns
+    ----------
+    batch : tuple[int, str, str, str, str]
+        The number of records followed by the four joined columns.
+
+    Raises
+    ----------
+    ChunkBoundaryError
+        If a record spans several lines, in which case the file can't be split
+        at line boundaries, or if the text contains the separator.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    if SEPARATOR in text:
+        raise ChunkBoundaryError("The CSV file contains the unit separator.")
+
+    reader = csv.reader(io.StringIO(text, newline=None), delimiter=";")
+    columns: tuple[list[str], ...] = ([], [], [], [])
+    words_a, words_b, hints_a, hints_b = columns
+    for word_a, word_b, hint_a, hint_b in reader:
+        words_a.append(word_a)
+        words_b.append(word_b)
+        hints_a.append(hint_a)
+        hints_b.append(hint_b)
+    if reader.line_num != len(words_a):
+        raise ChunkBoundaryError("A record of the CSV file spans several lines.")
+    n, a, b, c, d = len(words_a), *(SEPARATOR.join(column) for column in columns)
+    return n, a, b, c, d
+
+
+def unpack_batch(batch: Batch) -> Iterator[Record]:
+    "Generator yielding records of a batch returned by `parse_chunk`."
+    n, *columns = batch
+    if n > 0:
+        yield from zip(*(column.split(SEPARATOR) for column in columns))
+
+
+def parse_in_parallel(path: str, processes: int) -> tuple[list[str], Iterator[Record]]:
+    """Parse a CSV dictionary splitting it into chunks parsed in parallel.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the uncompressed CSV file.
+    processes : int
+        The maximum number of worker processes.
+
+    Returns
+    ----------
+    header : list[str]
+        Column names of the CSV file.
+    records : Iterator[tuple[str, str, str, str]]
+        Records of the file in the file order, the same as produced by
+        `csv.reader`.
+
+    Raises
+    ----------
+    ChunkBoundaryError
+        If a chunk can't be parsed independently.
+    """
+    header_line, ranges = split_byte_ranges(path, processes * CHUNKS_PER_PROCESS)
+    header = next(csv.reader([header_line.decode("utf-8")], delimiter=";"))
+    if len(ranges) <= 1:
+        batches = [parse_chunk(path, start, end) for start, end in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            starts = [start for start, _ in ranges]
+            ends = [end for _, end in ranges]
+            paths = [path] * len(ranges)
+            batches = list(executor.map(parse_chunk, paths, starts, ends))
+    return header, chain.from_iterable(unpack_batch(batch) for batch in batches)
@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import IO, Any, Callable, TextIO, cast
+import bz2
+import gzip
+import lzma
+import zlib
+
+COMPRESSIONS: dict[str, Callable[..., IO[Any]]] = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+}
+
+# Errors raised while reading a corrupt or truncated compressed file, other
+# than OSError, which bz2 and gzip raise for bad headers.
+DECOMPRESSION_ERRORS = (EOFError, lzma.LZMAError, zlib.error)
+
+
+def compression_suffix(path: str) -> str:
+    "Suffix of the compression format of the file, empty string if not compressed."
+    suffix = Path(path).suffix.lower()
+    return suffix if suffix in COMPRESSIONS else ""
+
+
+def strip_compression_suffix(path: str) -> str:
+    "Remove the suffix of the compression format from the path, if any."
+    suffix = compression_suffix(path)
+    return path[: -len(suffix)] if suffix else path
+
+
+def has_extension(path: str, extension: str) -> bool:
+    """Check if the file has the extension, possibly followed by a compression suffix.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the file.
+    extension : str
+        The extension including the dot, for example ".csv".
+
+    Returns
+    ----------
+    x : bool
+        True, if the file has the extension, e.g. "words.csv" or
+        "words.csv.gz" for ".csv". False otherwise.
+    """
+    return Path(strip_compression_suffix(path)).suffix == extension
+
+
+def open_binary(path: str) -> IO[bytes]:
+    "Open the file for reading bytes, decompressing it on the fly if necessary."
+    opener = COMPRESSIONS.get(compression_suffix(path))
+    if opener is None:
+        return open(path, "rb")
+    return opener(path, "rb")
+
+
+def open_text(path: str) -> TextIO:
+    """Open a dictionary file for reading text.
+
+    Compressed files (".gz", ".xz" and ".bz2") are decompressed on the fly
+    while being read, without temporary files.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the file.
+
+    Returns
+    ----------
+    f : TextIO
+        A text stream with the UTF-8 decoded content of the file.
+    """
+    opener = COMPRESSIONS.get(compression_suffix(path))
+    if opener is None:
+        return open(path, encoding="utf-8")
+    return cast(TextIO, opener(path, "rt", encoding="utf-8"))
@@ -1,9 +1,18 @@
-from typing import Optional, Type, TypeVar, Iterable
+from typing import Any, Optional, Type, TypeVar, Iterable, Iterator, TextIO
 from dataclasses import dataclass
 import csv
+import os
 
 from practice_turkish.languages import Language
-from practice_turkish.dictionaries import DictionaryEntry, DictionaryFormatError
+from practice_turkish.profiling import profiler
+from practice_turkish.dictionaries import (
+    DictionaryEntry,
+    DictionaryFormatError,
+    FileDictionaryEntry,
+)
+from practice_turkish.dictionaries.compression import compression_suffix, open_text
+from practice_turkish.dictionaries.interning import StringPool, string_pool
+from practice_turkish.dictionaries.chunked import ChunkBoundaryError, parse_in_parallel
 
 DE = TypeVar("DE", bound="CSVDictionaryEntry")
 
@@ -16,6 +25,20 @@ def generate_query(words: Iterable[str], hint: Optional[str]) -> str:
     return query
 
 
+def merge_words(words: list[str], other: Iterable[str]) -> list[str]:
+    "Append words missing from the list, keeping the order of the list."
+    return words + [word for word in other if word not in words]
+
+
+def merge_hints(hint: Optional[str], other: Optional[str]) -> Optional[str]:
+    "Join two hints separated by a comma, if they differ."
+    if not other or hint == other:
+        return hint
+    if not hint:
+        return other
+    return f"{hint}, {other}"
+
+
 def parse_language(language: str) -> Language:
     """Parse language from a string and create an instance of Language enum.
 
@@ -68,7 +91,7 @@ def parse_header(header: list[str]) -> tuple[Language, Language]:
 
 
 @dataclass
-class CSVDictionaryEntry(DictionaryEntry):
+class CSVDictionaryEntry(FileDictionaryEntry):
     """A class used to represent entries of custom dictionary form.
 
     This form uses a CSV file format with 4 columns to store dictionaries.
@@ -119,6 +142,14 @@ class CSVDictionaryEntry(DictionaryEntry):
     def query_b(self) -> str:
         return generate_query(self.words_b, self._hint_b)
 
+    @property
+    def hint_a(self) -> Optional[str]:
+        return self._hint_a or None
+
+    @property
+    def hint_b(self) -> Optional[str]:
+        return self._hint_b or None
+
     @staticmethod
     def extension() -> str:
         return ".csv"
@@ -127,25 +158,80 @@ class CSVDictionaryEntry(DictionaryEntry):
     def default_directory() -> str:
         return "CSV"
 
+    @staticmethod
+    def header_lines() -> int:
+        return 1
+
     @classmethod
+    @profiler.timed("CSVDictionaryEntry.read_dictionary_from_file")
     def read_dictionary_from_file(
         cls: Type[DE], path: str
     ) -> tuple[list[DE], Language, Language]:
-        with open(path, encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter=";")
-            header = next(reader)
-            language_a, language_b = parse_header(header)
-
-            dictionary: list[DE] = []
-            for words_a, words_b, hint_a, hint_b in reader:
-                dictionary.append(
-                    cls(
-                        words_a.split("/"),
-                        words_b.split("/"),
-                        language_a,
-                        language_b,
-                        None if not hint_a else hint_a,
-                        None if not hint_b else hint_b,
-                    )
-                )
+        with open_text(path) as f:
+            records, language_a, language_b = cls.read_records(f)
+            dictionary = [
+                cls.from_record(record, language_a, language_b) for record in records
+            ]
+        return dictionary, language_a, language_b
+
+    @classmethod
+    def read_dictionary_from_file_in_parallel(
+        cls: Type[DE], path: str, processes: Optional[int] = None
+    ) -> tuple[list[DE], Language, Language]:
+        """Read list of entries from a file, parsing its chunks in parallel.
+
+        The file is split at line boundaries into byte ranges, each of which
+        is parsed in a worker process. The result is identical to the one of
+        `read_dictionary_from_file`, which is used as a fallback for a single
+        process, compressed files and files with records spanning several
+        lines.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes == 1 or compression_suffix(path):
+            return cls.read_dictionary_from_file(path)
+        try:
+            header, records = parse_in_parallel(path, processes)
+        except ChunkBoundaryError:
+            return cls.read_dictionary_from_file(path)
+
+        language_a, language_b = parse_header(header)
+        dictionary = [
+            cls.from_record(record, language_a, language_b) for record in records
+        ]
         return dictionary, language_a, language_b
+
+    @classmethod
+    def read_records(cls, f: TextIO) -> tuple[Iterator[Any], Language, Language]:
+        reader = csv.reader(f, delimiter=";")
+        header = next(reader)
+        language_a, language_b = parse_header(header)
+        return reader, language_a, language_b
+
+    @classmethod
+    def from_record(
+        cls: Type[DE], record: Any, language_a: Language, language_b: Language
+    ) -> DE:
+        words_a, words_b, hint_a, hint_b = record
+        pool = string_pool
+        return cls(
+            pool.intern_all(words_a.split("/")),
+            pool.intern_all(words_b.split("/")),
+            language_a,
+            language_b,
+            None if not hint_a else pool.intern(hint_a),
+            None if not hint_b else pool.intern(hint_b),
+        )
+
+    def merge(self, other: DictionaryEntry) -> None:
+        self._words_a = merge_words(self._words_a, other.words_a)
+        self._words_b = merge_words(self._words_b, other.words_b)
+        if isinstance(other, CSVDictionaryEntry):
+            self._hint_a = merge_hints(self._hint_a, other._hint_a)
+            self._hint_b = merge_hints(self._hint_b, other._hint_b)
+
+    def intern_strings(self, pool: StringPool) -> None:
+        self._words_a = pool.intern_all(self._words_a)
+        self._words_b = pool.intern_all(self._words_b)
+        self._hint_a = pool.intern_optional(self._hint_a)
+        self._hint_b = pool.intern_optional(self._hint_b)
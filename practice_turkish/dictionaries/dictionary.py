@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Type, TypeVar, Optional, Iterator, Generic
-from dataclasses import dataclass
-from random import shuffle
+from typing import Any, Type, TypeVar, Optional, Iterator, Generic, TextIO
+from dataclasses import dataclass, field
+from random import Random, shuffle, sample
 
 from rich import print
-from rich.table import Table
 
 from practice_turkish.languages import Language, PrompterInTheLanguage
+from practice_turkish.output import output
+from practice_turkish.profiling import profiler
+from practice_turkish.dictionaries.bitmap import BitmapIndex
+from practice_turkish.dictionaries.compression import open_text
+from practice_turkish.dictionaries.duplicates import Duplicate, DuplicateIndex
+from practice_turkish.dictionaries.interning import StringPool
+from practice_turkish.dictionaries.sampling import reservoir_sample
 from practice_turkish.dictionaries.telegram import (
     APIConfiguration,
     send_to_telegram,
@@ -14,8 +20,11 @@ from practice_turkish.dictionaries.telegram import (
 )
 
 DE = TypeVar("DE", bound="DictionaryEntry")
+FDE = TypeVar("FDE", bound="FileDictionaryEntry")
 D = TypeVar("D", bound="Dictionary")
 
+ANSWER_SYMBOLS = ",-"
+
 
 class DictionaryFormatError(ValueError):
     """Exception raised if dictionary file violates specification."""
@@ -48,24 +57,25 @@ class DictionaryEntry(ABC):
     words_b : set[str]
         Set of options to be considered correct when prompted to translate from
         language A to language B.
+    hint_a : Optional[str]
+        Hint shown with the query in language A, if any. Entries without
+        hints don't need to override it, nor `hint_b`.
+    hint_b : Optional[str]
+        Hint shown with the query in language B, if any.
+    has_hint : bool
+        True, if the entry has a hint in any of the languages.
 
     Methods
     ----------
-    @classmethod
-    def extension(cls) -> str
-        Returns the file extension used with dictionary of this format.
+    def intern_strings(self, pool: StringPool) -> None
+        Replace words and hints by equal strings from the pool.
 
-    @staticmethod
-    def default_directory() -> str
-        Returns a string representing the default directory dictionary of this
-        format are stored in.
-
-    @classmethod
-    def read_dictionary_from_file(cls, path: str) -> Dictionary
-        Read the dictionary of entries of the type from a file.
+    def merge(self, other: DictionaryEntry) -> None
+        Merge alternatives and hints of another entry into this one.
     """
 
-    def prompt_translation(self, a2b: bool) -> str:
+    @profiler.timed("DictionaryEntry.prompt_translation")
+    def prompt_translation(self, a2b: bool, query: Optional[str] = None) -> str:
         """Prompt the translation for the entry from the user by typing the answer in.
 
         Parameters
@@ -73,16 +83,20 @@ class DictionaryEntry(ABC):
         a2b : bool
             True, if translation should be prompted from language A to
             B language. False otherwise.
+        query : Optional[str]
+            The query to show, if formatted in advance.
 
         Returns
         ----------
         translation : str
             The string typed in by the user.
         """
-        query = self.query_a if a2b else self.query_b
+        if query is None:
+            query = self.query_a if a2b else self.query_b
         prompter = PrompterInTheLanguage(self.language_b if a2b else self.language_a)
-        return prompter.prompt(f"{query} ⇨ ", additional_symbols=",-")
+        return prompter.prompt(f"{query} ⇨ ", additional_symbols=ANSWER_SYMBOLS)
 
+    @profiler.timed("DictionaryEntry.check_translation")
     def check_translation(self, a2b: bool, translation: str) -> bool:
         """Check translation.
 
@@ -106,6 +120,23 @@ class DictionaryEntry(ABC):
         target = self.words_b if a2b else self.words_a
         return translation in target
 
+    def intern_strings(self, pool: StringPool) -> None:
+        """Replace words and hints of the entry by equal strings from the pool.
+
+        Entries created by parsers are interned already. This is necessary only
+        for entries received from another process, e.g. unpickled.
+        """
+
+    def merge(self, other: DE) -> None:
+        """Merge alternatives and hints of another entry into this one.
+
+        Raises
+        ----------
+        NotImplementedError
+            If entries of this type can't be merged.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't be merged.")
+
     def __lt__(self, other: DE) -> bool:
         """Necessary to sort"""
         return self.words_a < other.words_b
@@ -146,6 +177,65 @@ class DictionaryEntry(ABC):
         """Values to be considered correct translation to language B."""
         raise NotImplementedError
 
+    @property
+    def hint_a(self) -> Optional[str]:
+        """Hint shown with the query in language A."""
+        return None
+
+    @property
+    def hint_b(self) -> Optional[str]:
+        """Hint shown with the query in language B."""
+        return None
+
+    @property
+    def has_hint(self) -> bool:
+        """True, if the entry has a hint in any of the languages."""
+        return bool(self.hint_a or self.hint_b)
+
+
+class FileDictionaryEntry(DictionaryEntry):
+    """An ABC used to represent an entry from a dictionary stored in files.
+
+    Entries of dictionaries read from files of a concrete format subclass it,
+    while entries living only in memory subclass `DictionaryEntry` directly.
+    Each subclass should implement all the following methods along with
+    properties of `DictionaryEntry`.
+
+    Methods
+    ----------
+    @classmethod
+    def extension(cls) -> str
+        Returns the file extension used with dictionary of this format.
+
+    @staticmethod
+    def default_directory() -> str
+        Returns a string representing the default directory dictionary of this
+        format are stored in.
+
+    @staticmethod
+    def header_lines() -> int
+        Returns the number of lines before the first entry in files of this
+        format.
+
+    @classmethod
+    def read_dictionary_from_file(cls, path: str) -> Dictionary
+        Read the dictionary of entries of the type from a file.
+
+    @classmethod
+    def read_dictionary_from_file_in_parallel(cls, path: str,
+                                              processes: Optional[int] = None)
+        Read the dictionary using several processes if the format allows it.
+
+    @classmethod
+    def read_records(cls, f: TextIO) -> tuple[Iterator[Any], Language, Language]
+        Read raw records of entries from an open file without creating entries.
+
+    @classmethod
+    def from_record(cls, record: Any, language_a: Language,
+                    language_b: Language) -> DictionaryEntry
+        Create an entry from a raw record.
+    """
+
     @staticmethod
     @abstractmethod
     def extension() -> str:
@@ -158,14 +248,45 @@ class DictionaryEntry(ABC):
         """Directory name associated with this type of entries."""
         raise NotImplementedError
 
+    @staticmethod
+    def header_lines() -> int:
+        """The number of lines before the first entry in files of this type."""
+        return 0
+
     @classmethod
     @abstractmethod
     def read_dictionary_from_file(
-        cls: Type[DE], path: str
-    ) -> tuple[list[DE], Language, Language]:
+        cls: Type[FDE], path: str
+    ) -> tuple[list[FDE], Language, Language]:
         """Read list entries of this type from a file."""
         raise NotImplementedError
 
+    @classmethod
+    def read_dictionary_from_file_in_parallel(
+        cls: Type[FDE], path: str, _processes: Optional[int] = None
+    ) -> tuple[list[FDE], Language, Language]:
+        """Read list entries of this type from a file using several processes.
+
+        The base implementation is sequential and ignores the number of
+        processes: formats which can't be split into independent chunks read
+        the file with `read_dictionary_from_file`.
+        """
+        return cls.read_dictionary_from_file(path)
+
+    @classmethod
+    @abstractmethod
+    def read_records(cls, f: TextIO) -> tuple[Iterator[Any], Language, Language]:
+        """Read raw records of entries of this type from an open file."""
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def from_record(
+        cls: Type[FDE], record: Any, language_a: Language, language_b: Language
+    ) -> FDE:
+        """Create an entry of this type from a raw record."""
+        raise NotImplementedError
+
 
 @dataclass
 class Dictionary(Generic[DE]):
@@ -184,41 +305,110 @@ class Dictionary(Generic[DE]):
         Language A of the dictionary.
     language_b : Language
         Language B of the dictionary.
+    index : Optional[DuplicateIndex]
+        Index of entries used to detect duplicates, if built.
+    bitmap : Optional[BitmapIndex]
+        Index of features of entries used by filters, if built.
 
     Methods
     ----------
     @classmethod
-    def from_file(cls, path: str, T: Type[DictionaryEntry]) -> Dictionary:
+    def from_file(cls, path: str, T: Type[DictionaryEntry],
+                  processes: Optional[int] = 1) -> Dictionary:
         Reads dictionary form a file assuming the type T.
 
+    @classmethod
+    def sample_from_file(cls, path: str, T: Type[DictionaryEntry], k: int,
+                         seed: Optional[int] = None) -> Dictionary:
+        Reads k random entries from a file in one pass.
+
     def print(self, title: Optional[str] = None) -> None:
         Prints the dictionary to stdout in a from of the table.
 
     def send_to_telegram(self) -> bool:
         Send the dictionary to a telegram user via the bot.
+
+    def build_index(self) -> None:
+        Build the index of entries, so duplicates are detected on insertion.
+
+    def insert(self, entry: DictionaryEntry, merge: bool = False)
+            -> Optional[Duplicate]:
+        Insert a new entry, merging it into a duplicate if asked to.
+
+    def bitmap_index(self) -> BitmapIndex:
+        The index of features of entries, built on first use.
+
+    def filter(self, expression: str) -> Dictionary:
+        Entries matching a filter expression, e.g. "hint & !phrase".
     """
 
     entries: list[DE]
     language_a: Language
     language_b: Language
+    index: Optional[DuplicateIndex[DE]] = field(default=None, repr=False, compare=False)
+    bitmap: Optional[BitmapIndex[DE]] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_file(cls: Type[D], path: str, type: Type[DE]) -> D:
-        "Read dictionary form a file assuming the type T."
-        return cls(*type.read_dictionary_from_file(path))
+    @profiler.timed("Dictionary.from_file")
+    def from_file(
+        cls: Type[D], path: str, type: Type[DE], processes: Optional[int] = 1
+    ) -> D:
+        """Read dictionary form a file assuming the type T.
+
+        If `processes` isn't 1, the file is parsed by up to that many worker
+        processes (the number of CPUs if None), given the format supports it.
+        """
+        assert issubclass(type, FileDictionaryEntry)
+        if processes == 1:
+            dictionary = cls(*type.read_dictionary_from_file(path))
+        else:
+            dictionary = cls(
+                *type.read_dictionary_from_file_in_parallel(path, processes)
+            )
+        profiler.count("entries read", len(dictionary))
+        return dictionary
+
+    @classmethod
+    def sample_from_file(
+        cls: Type[D], path: str, type: Type[DE], k: int, seed: Optional[int] = None
+    ) -> D:
+        """Read k random entries from a file in one pass.
 
+        Raw records are sampled by reservoir sampling, and entries are created
+        only for the selected ones, so memory is proportional to k regardless
+        of the size of the file. Selected entries keep the order of the file.
+
+        Parameters
+        ----------
+        path : str
+            A string representing a path to the dictionary file.
+        type : Type[DictionaryEntry]
+            Type of entries of the dictionary, a `FileDictionaryEntry`.
+        k : int
+            The number of entries to pick. All entries are picked if the file
+            contains fewer of them.
+        seed : Optional[int]
+            Seed of the random number generator, for reproducible samples.
+        """
+        assert issubclass(type, FileDictionaryEntry)
+        with open_text(path) as f:
+            records, language_a, language_b = type.read_records(f)
+            picked = reservoir_sample(records, k, Random(seed))
+        entries = [
+            type.from_record(record, language_a, language_b) for record in picked
+        ]
+        return cls(entries, language_a, language_b)
+
+    @profiler.timed("Dictionary.print")
     def print(self, title: Optional[str] = None) -> None:
         "Print the dictionary to stdout in a from of the table."
         self.sort()
-        table = Table(title=title)
-        table.add_column(self.language_a, justify="left")
-        table.add_column(self.language_b, justify="right")
-
-        for word in self.entries:
-            table.add_row(word.query_a, word.query_b)
-
-        print(table)
+        header = (self.language_a.value, self.language_b.value)
+        rows = ((word.query_a, word.query_b) for word in self.entries)
+        output.table(title, header, rows)
+        output.flush()
 
+    @profiler.timed("Dictionary.send_to_telegram")
     def send_to_telegram(self, path: str = "config.ini") -> bool:
         """Send the dictionary to a telegram user via the bot.
 
@@ -242,14 +432,109 @@ class Dictionary(Generic[DE]):
     def sort(self) -> None:
         "Sort the dictionary with respect to the language A."
         self.entries.sort(key=lambda item: item.query_a)
+        self.bitmap = None
+
+    def build_index(self) -> None:
+        "Build the index of entries, so duplicates are detected on insertion."
+        self.index = DuplicateIndex(self.language_a, self.language_b, self.entries)
+
+    def find_duplicate(self, entry: DE) -> Optional[Duplicate[DE]]:
+        "Find an entry of the dictionary duplicated by the entry, building the index."
+        if self.index is None:
+            self.build_index()
+        assert self.index is not None
+        return self.index.find(entry)
+
+    def duplicates(self) -> list[tuple[DE, Duplicate[DE]]]:
+        "List entries duplicating one of the previous entries, in O(n)."
+        index: DuplicateIndex[DE] = DuplicateIndex(self.language_a, self.language_b)
+        found = []
+        for entry in self.entries:
+            duplicate = index.find(entry)
+            if duplicate is not None:
+                found.append((entry, duplicate))
+            index.add(entry)
+        return found
+
+    def insert(self, entry: DE, merge: bool = False) -> Optional[Duplicate[DE]]:
+        """Insert a new entry.
+
+        If the index is built, the entry is checked for duplicates first.
+        The bitmap index is dropped, since features of entries change.
+
+        Parameters
+        ----------
+        entry : DictionaryEntry
+            The entry to insert.
+        merge : bool
+            If True and the entry duplicates an existing one, its alternatives
+            and hints are merged into the existing entry instead of inserting.
 
-    def insert(self, entry: DE) -> None:
-        "Insert a new entry."
+        Returns
+        ----------
+        duplicate : Optional[Duplicate]
+            The duplicated existing entry, None if there is no duplicate or
+            the index isn't built.
+        """
+        self.bitmap = None
+        if self.index is None:
+            self.entries.append(entry)
+            return None
+
+        duplicate = self.index.find(entry)
+        if duplicate is not None and merge:
+            duplicate.entry.merge(entry)
+            self.index.remove(duplicate.entry)
+            self.index.add(duplicate.entry)
+            return duplicate
         self.entries.append(entry)
+        self.index.add(entry)
+        return duplicate
+
+    def bitmap_index(self) -> BitmapIndex[DE]:
+        """The index of features of entries, built on first use.
+
+        The index is kept until entries are inserted or reordered.
+        """
+        if self.bitmap is None:
+            self.bitmap = BitmapIndex(self.entries)
+        return self.bitmap
+
+    def filter(self: D, expression: str) -> D:
+        """Select entries matching a filter expression.
+
+        Features of entries are packed into bitsets by `BitmapIndex`, built
+        once and kept by the dictionary, so the expression is evaluated with
+        a few bitwise operations on whole bitsets. See `FilterExpression` for
+        the syntax of expressions.
+
+        Parameters
+        ----------
+        expression : str
+            The filter expression, e.g. "hint & !phrase" or "has:ğş | len:-4".
+
+        Returns
+        ----------
+        dictionary : Dictionary
+            A new dictionary with matching entries in the same order.
+
+        Raises
+        ----------
+        FilterExpressionError
+            If the expression can't be parsed.
+        """
+        index = self.bitmap_index()
+        entries = index.select(index.evaluate(expression))
+        return type(self)(entries, self.language_a, self.language_b)
 
     def shuffle(self) -> None:
         "Shuffle entries."
         shuffle(self.entries)
+        self.bitmap = None
+
+    def sample(self, k: int) -> list[DE]:
+        "Pick k distinct random entries, all of them if there are fewer."
+        return sample(self.entries, k=min(k, len(self.entries)))
 
     def __iter__(self) -> Iterator[DE]:
         return iter(self.entries)
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Generic, Iterable, Optional, TypeVar
+
+from practice_turkish.languages import Language
+
+if TYPE_CHECKING:
+    from practice_turkish.dictionaries.dictionary import DictionaryEntry
+
+DE = TypeVar("DE", bound="DictionaryEntry")
+
+Key = tuple[frozenset[str], frozenset[str]]
+
+
+def normalize_word(word: str, language: Language) -> str:
+    """Normalize a word in order to compare it with other words.
+
+    Collapses whitespace and ignores case. Dotted and dotless i of Turkish
+    alphabet are lowercased according to Turkish rules.
+
+    Parameters
+    ----------
+    word : str
+        The word to normalize.
+    language : Language
+        The language of the word.
+
+    Returns
+    ----------
+    normalized : str
+        The normalized word.
+    """
+    word = " ".join(word.split())
+    if language == Language.turkish:
+        word = word.replace("I", "ı").replace("İ", "i")
+    return word.lower()
+
+
+class DuplicateKind(str, Enum):
+    """An enum used to represent how two entries duplicate each other.
+
+    Values
+    ----------
+    EXACT
+        Both entries have the same words in both languages.
+    OVERLAP
+        Entries share at least one word in each of the languages.
+    """
+
+    EXACT = "EXACT"
+    OVERLAP = "OVERLAP"
+
+
+@dataclass
+class Duplicate(Generic[DE]):
+    """A class used to represent an entry duplicated by another one.
+
+    Attributes
+    ----------
+    kind : DuplicateKind
+        Whether the duplicate is exact or overlapping.
+    entry : DictionaryEntry
+        The existing entry, which is duplicated.
+    """
+
+    kind: DuplicateKind
+    entry: DE
+
+
+class DuplicateIndex(Generic[DE]):
+    """A class used to find duplicates of dictionary entries in O(1).
+
+    Entries are indexed by the pair of sets of their normalized words, which
+    finds exact duplicates with one lookup, and by each normalized word of
+    language A, which finds overlapping ones.
+
+    Methods
+    ----------
+    def add(self, entry: DictionaryEntry) -> None
+        Add an entry to the index.
+
+    def remove(self, entry: DictionaryEntry) -> None
+        Remove an entry from the index.
+
+    def find(self, entry: DictionaryEntry) -> Optional[Duplicate]
+        Find an indexed entry duplicated by the entry.
+    """
+
+    def __init__(
+        self, language_a: Language, language_b: Language, entries: Iterable[DE] = ()
+    ) -> None:
+        self.language_a = language_a
+        self.language_b = language_b
+        self._exact: dict[Key, dict[int, DE]] = {}
+        self._by_word_a: dict[str, dict[int, DE]] = {}
+        self._keys: dict[int, Key] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def key(self, entry: DE) -> Key:
+        "Pair of sets of normalized words of the entry."
+        words_a = frozenset(normalize_word(w, self.language_a) for w in entry.words_a)
+        words_b = frozenset(normalize_word(w, self.language_b) for w in entry.words_b)
+        return words_a, words_b
+
+    def add(self, entry: DE) -> None:
+        "Add an entry to the index."
+        key = self.key(entry)
+        self._keys[id(entry)] = key
+        self._exact.setdefault(key, {})[id(entry)] = entry
+        for word in key[0]:
+            self._by_word_a.setdefault(word, {})[id(entry)] = entry
+
+    def remove(self, entry: DE) -> None:
+        "Remove an entry from the index."
+        key = self._keys.pop(id(entry))
+        exact = self._exact[key]
+        del exact[id(entry)]
+        if not exact:
+            del self._exact[key]
+        for word in key[0]:
+            entries = self._by_word_a[word]
+            del entries[id(entry)]
+            if not entries:
+                del self._by_word_a[word]
+
+    def find(self, entry: DE) -> Optional[Duplicate[DE]]:
+        """Find an indexed entry duplicated by the entry.
+
+        Parameters
+        ----------
+        entry : DictionaryEntry
+            The entry to look for, indexed or not.
+
+        Returns
+        ----------
+        duplicate : Optional[Duplicate]
+            An exact duplicate if there is one, otherwise an overlapping one.
+            None if the entry doesn't duplicate any other indexed entry.
+        """
+        key = self.key(entry)
+        for existing in self._exact.get(key, {}).values():
+            if existing is not entry:
+                return Duplicate(DuplicateKind.EXACT, existing)
+
+        words_a, words_b = key
+        for word in words_a:
+            for candidate in self._by_word_a.get(word, {}).values():
+                if candidate is entry:
+                    continue
+                if not words_b.isdisjoint(self._keys[id(candidate)][1]):
+                    return Duplicate(DuplicateKind.OVERLAP, candidate)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,94 @@
+from random import Random
+from typing import Iterable
+
+
+class FenwickTree:
+    """A class used to draw indices with probabilities proportional to weights.
+
+    A Fenwick (binary indexed) tree keeps partial sums of weights, so both
+    changing a weight and drawing a random index take O(log n), and the tree
+    is built from n weights in O(n).
+
+    Methods
+    ----------
+    def add(self, i: int, delta: float) -> None
+        Add delta to the weight of the i-th index.
+
+    def set(self, i: int, weight: float) -> None
+        Set the weight of the i-th index.
+
+    def find(self, value: float) -> int
+        Find the index whose cumulative weight range contains the value.
+
+    def draw(self, rng: Random) -> int
+        Draw a random index.
+    """
+
+    def __init__(self, weights: Iterable[float]) -> None:
+        self._weights = [float(weight) for weight in weights]
+        n = len(self._weights)
+        self._tree = [0.0] + self._weights
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                self._tree[parent] += self._tree[i]
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+
+    def add(self, i: int, delta: float) -> None:
+        "Add delta to the weight of the i-th index."
+        self._weights[i] += delta
+        i += 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def set(self, i: int, weight: float) -> None:
+        "Set the weight of the i-th index."
+        self.add(i, weight - self._weights[i])
+
+    def prefix_sum(self, i: int) -> float:
+        "The total weight of indices from 0 up to, but not including, i."
+        total = 0.0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, value: float) -> int:
+        """Find the index whose cumulative weight range contains the value.
+
+        Parameters
+        ----------
+        value : float
+            A number from 0 to the total weight.
+
+        Returns
+        ----------
+        i : int
+            The smallest index such that the total weight of indices up to and
+            including it is greater than the value.
+        """
+        position = 0
+        step = self._top
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] <= value:
+                position = following
+                value -= self._tree[following]
+            step >>= 1
+        return min(position, len(self._weights) - 1)
+
+    def draw(self, rng: Random) -> int:
+        "Draw a random index with probability proportional to its weight."
+        return self.find(rng.random() * self.total)
+
+    @property
+    def total(self) -> float:
+        "The total weight of all indices."
+        return self.prefix_sum(len(self._weights))
+
+    def __getitem__(self, i: int) -> float:
+        return self._weights[i]
+
+    def __len__(self) -> int:
+        return len(self._weights)
@@ -0,0 +1,74 @@
+from typing import Iterable, Optional
+import sys
+
+
+class StringPool:
+    """A class used to share equal strings between dictionary entries.
+
+    Words and hints are repeated across many entries of large dictionaries,
+    but parsers create a new string object for each occurrence. The pool keeps
+    the first occurrence of each string and returns it for all the following
+    equal strings, so duplicates can be garbage collected.
+
+    Attributes
+    ----------
+    hits : int
+        The number of repeated occurrences of strings already in the pool.
+    saved_bytes : int
+        The total size of repeated occurrences, that is the memory which would
+        be taken by separate copies of them.
+
+    Methods
+    ----------
+    def intern(self, s: str) -> str
+        Return the string from the pool equal to s.
+
+    def intern_all(self, strings: Iterable[str]) -> list[str]
+        Intern each string of an iterable.
+
+    def describe(self) -> str
+        Describe the memory saved by the pool in one line.
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self.hits = 0
+        self.saved_bytes = 0
+
+    def intern(self, s: str) -> str:
+        "Return the string from the pool equal to s, adding s if there is none."
+        pooled = self._strings.get(s)
+        if pooled is None:
+            self._strings[s] = s
+            return s
+        self.hits += 1
+        self.saved_bytes += sys.getsizeof(pooled)
+        return pooled
+
+    def intern_optional(self, s: Optional[str]) -> Optional[str]:
+        "Intern the string unless it's None."
+        return None if s is None else self.intern(s)
+
+    def intern_all(self, strings: Iterable[str]) -> list[str]:
+        "Intern each string of an iterable."
+        intern = self.intern
+        return [intern(s) for s in strings]
+
+    def describe(self) -> str:
+        "Describe the memory saved by the pool in one line."
+        return (
+            f"{len(self)} unique strings, {self.hits} duplicates interned, "
+            f"{self.saved_bytes / 2**20:.1f} MiB saved"
+        )
+
+    def clear(self) -> None:
+        "Forget all pooled strings and reset the statistics."
+        self._strings.clear()
+        self.hits = 0
+        self.saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+string_pool = StringPool()
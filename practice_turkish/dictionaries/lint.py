@@ -0,0 +1,407 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable, Iterator, Optional
+import csv
+import os
+
+from practice_turkish.languages import Language, alphabet
+from practice_turkish.dictionaries import DictionaryFormatError
+from practice_turkish.dictionaries.catalog import sniff_format, scan_directories
+from practice_turkish.dictionaries.compression import (
+    DECOMPRESSION_ERRORS,
+    has_extension,
+    open_binary,
+)
+from practice_turkish.dictionaries.csvdictionary import parse_language
+from practice_turkish.dictionaries.dictionary import ANSWER_SYMBOLS
+from practice_turkish.dictionaries.duplicates import Key, normalize_word
+from practice_turkish.dictionaries.turkrutdictionary import separator_pattern
+
+EXTENSIONS = {".csv": "csv", ".txt": "turkrut"}
+
+
+class ProblemKind(str, Enum):
+    """An enum used to represent kinds of problems found in dictionary files.
+
+    Values
+    ----------
+    ENCODING
+        The file isn't valid UTF-8.
+    BAD_COLUMNS
+        A line doesn't have the columns required by the format.
+    UNKNOWN_LANGUAGE
+        A language in the header isn't a value of `Language` enum.
+    EMPTY_ALTERNATIVE
+        One of alternative translations is empty.
+    UNBALANCED_PARENTHESES
+        A parenthesis isn't closed or opened.
+    INVALID_SYMBOL
+        A word contains a symbol which can't be typed in the language.
+    DUPLICATE
+        The entry duplicates an entry of a previous line.
+    """
+
+    ENCODING = "ENCODING"
+    BAD_COLUMNS = "BAD_COLUMNS"
+    UNKNOWN_LANGUAGE = "UNKNOWN_LANGUAGE"
+    EMPTY_ALTERNATIVE = "EMPTY_ALTERNATIVE"
+    UNBALANCED_PARENTHESES = "UNBALANCED_PARENTHESES"
+    INVALID_SYMBOL = "INVALID_SYMBOL"
+    DUPLICATE = "DUPLICATE"
+
+
+@dataclass
+class Problem:
+    """A class used to represent a problem found in a dictionary file.
+
+    Attributes
+    ----------
+    path : str
+        A string representing a path to the file.
+    line : int
+        The number of the line, starting from 1.
+    column : int
+        The number of the symbol within the line, starting from 1.
+    kind : ProblemKind
+        The kind of the problem.
+    message : str
+        Human readable description of the problem.
+    """
+
+    path: str
+    line: int
+    column: int
+    kind: ProblemKind
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}: {self.kind.name} {self.message}"
+
+
+def lint_format(path: str) -> Optional[str]:
+    "Format of a dictionary file by its extension or content, None if unknown."
+    for extension, format in EXTENSIONS.items():
+        if has_extension(path, extension):
+            return format
+    return sniff_format(path)
+
+
+def field_columns(line: str, row: list[str]) -> list[int]:
+    "Columns where fields of a row parsed from a line of CSV file start."
+    columns = []
+    position = 0
+    for value in row:
+        if line.startswith('"', position):
+            position += 1
+        columns.append(position + 1)
+        found = line.find(value, position)
+        position = (found if found >= 0 else position) + len(value)
+        separator = line.find(";", position)
+        position = separator + 1 if separator >= 0 else len(line)
+    return columns
+
+
+def check_parentheses(text: str) -> Iterator[tuple[int, str]]:
+    "Generator yielding offsets of unbalanced parentheses in the text."
+    if "(" not in text and ")" not in text:
+        return
+    opened: list[int] = []
+    for i, symbol in enumerate(text):
+        if symbol == "(":
+            opened.append(i)
+        elif symbol == ")":
+            if opened:
+                opened.pop()
+            else:
+                yield i, "closing parenthesis without an opening one"
+    for i in opened:
+        yield i, "parenthesis isn't closed"
+
+
+def check_words(
+    words: list[str], separator: str, symbols: Optional[frozenset[str]]
+) -> Iterator[tuple[int, ProblemKind, str]]:
+    """Generator yielding problems of alternative translations.
+
+    Parameters
+    ----------
+    words : list[str]
+        Alternative translations split by the separator.
+    separator : str
+        The separator of alternatives.
+    symbols : Optional[frozenset[str]]
+        Symbols which can be typed in the language, None if unknown.
+
+    Yields
+    ----------
+    offset : int
+        The offset of the problem within the text of alternatives.
+    kind : ProblemKind
+        The kind of the problem.
+    message : str
+        Human readable description of the problem.
+    """
+    offset = 0
+    for word in words:
+        if not word.strip():
+            yield offset, ProblemKind.EMPTY_ALTERNATIVE, "empty alternative"
+        elif symbols is not None and not symbols.issuperset(word):
+            invalid = ((i, s) for i, s in enumerate(word) if s not in symbols)
+            found = next(invalid, None)
+            if found is not None:
+                i, symbol = found
+                message = f"symbol {symbol!r} can't be typed in {word.strip()!r}"
+                yield offset + i, ProblemKind.INVALID_SYMBOL, message
+        offset += len(word) + len(separator)
+
+
+def strip_hint(part: str) -> tuple[str, int]:
+    """Blank out the hint in parenthesis of a side of a turkrut line.
+
+    Returns
+    ----------
+    words : str
+        Alternative translations of the side.
+    offset : int
+        The offset of the words within the side.
+    """
+    opening, closing = part.find("("), part.rfind(")")
+    if 0 <= opening < closing:
+        part = part[:opening] + " " * (closing - opening + 1) + part[closing + 1 :]
+    stripped = part.lstrip()
+    return stripped.rstrip(), len(part) - len(stripped)
+
+
+class FileLinter:
+    """A class used to collect problems of one dictionary file.
+
+    Words of valid lines are indexed the same way `DuplicateIndex` indexes
+    entries in order to find duplicates of previous lines, but without
+    creating entries, which would take most of the time of linting.
+
+    Methods
+    ----------
+    def lint_csv(self, lines: list[str]) -> None
+        Check lines of a CSV dictionary.
+
+    def lint_turkrut(self, lines: list[str]) -> None
+        Check lines of a turkrut dictionary.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.problems: list[Problem] = []
+        self.languages: Optional[tuple[Language, Language]] = None
+        self.exact: dict[Key, int] = {}
+        self.by_word_a: dict[str, list[tuple[frozenset[str], int]]] = {}
+
+    def report(self, line: int, column: int, kind: ProblemKind, message: str) -> None:
+        "Add a problem found at the line and the column of the file."
+        self.problems.append(Problem(self.path, line, column, kind, message))
+
+    def check_duplicate(
+        self, words_a: list[str], words_b: list[str], line: int
+    ) -> None:
+        "Report words of a line if they duplicate words of a previous line."
+        if self.languages is None:
+            return
+        language_a, language_b = self.languages
+        key_a = frozenset(normalize_word(word, language_a) for word in words_a)
+        key_b = frozenset(normalize_word(word, language_b) for word in words_b)
+
+        previous = self.exact.get((key_a, key_b))
+        if previous is not None:
+            message = f"duplicates the entry of line {previous}"
+            self.report(line, 1, ProblemKind.DUPLICATE, message)
+            return
+        self.exact[key_a, key_b] = line
+
+        overlapping = None
+        for word in key_a:
+            lines = self.by_word_a.setdefault(word, [])
+            if overlapping is None:
+                overlapping = next(
+                    (n for other, n in lines if not key_b.isdisjoint(other)), None
+                )
+            lines.append((key_b, line))
+        if overlapping is not None:
+            message = f"overlaps the entry of line {overlapping}"
+            self.report(line, 1, ProblemKind.DUPLICATE, message)
+
+    def lint_csv(self, lines: list[str]) -> None:
+        "Check lines of a CSV dictionary."
+        reader = csv.reader(lines, delimiter=";")
+        header = next(reader, None)
+        if header is None:
+            self.report(1, 1, ProblemKind.BAD_COLUMNS, "the header is missing")
+            return
+        columns = field_columns(lines[0], header)
+        if len(header) != 4:
+            message = f"the header has {len(header)} columns instead of 4"
+            self.report(1, 1, ProblemKind.BAD_COLUMNS, message)
+        languages: list[Language] = []
+        symbols: list[Optional[frozenset[str]]] = [None, None]
+        for i, name in enumerate(header[:2]):
+            try:
+                language = parse_language(name)
+            except DictionaryFormatError:
+                message = f"language {name!r} isn't supported"
+                self.report(1, columns[i], ProblemKind.UNKNOWN_LANGUAGE, message)
+                continue
+            languages.append(language)
+            symbols[i] = alphabet(language, ANSWER_SYMBOLS)
+        if len(languages) == 2:
+            self.languages = languages[0], languages[1]
+
+        for row in reader:
+            line_number = reader.line_num
+            if len(row) != 4:
+                message = f"{len(row)} columns instead of 4"
+                self.report(line_number, 1, ProblemKind.BAD_COLUMNS, message)
+                continue
+
+            words = row[0].split("/"), row[1].split("/")
+            problems = [
+                (i, offset, ProblemKind.UNBALANCED_PARENTHESES, message)
+                for i, value in enumerate(row)
+                for offset, message in check_parentheses(value)
+            ]
+            problems.extend(
+                (i, offset, kind, message)
+                for i in (0, 1)
+                for offset, kind, message in check_words(words[i], "/", symbols[i])
+            )
+            if problems:
+                columns = field_columns(lines[line_number - 1], row)
+                problems.sort(key=lambda problem: (problem[0], problem[1]))
+                for i, offset, kind, message in problems:
+                    self.report(line_number, columns[i] + offset, kind, message)
+            if all(problem[2] != ProblemKind.EMPTY_ALTERNATIVE for problem in problems):
+                self.check_duplicate(*words, line_number)
+
+    def lint_turkrut(self, lines: list[str]) -> None:
+        "Check lines of a turkrut dictionary."
+        self.languages = Language.turkish, Language.russian
+        sides = (
+            alphabet(Language.turkish, ANSWER_SYMBOLS),
+            alphabet(Language.russian, ANSWER_SYMBOLS),
+        )
+        for line_number, line in enumerate(lines, 1):
+            separators = list(separator_pattern.finditer(line))
+            if len(separators) != 1:
+                column = separators[1].start() + 1 if separators else 1
+                if separators:
+                    message = f"{len(separators)} dashes instead of one"
+                else:
+                    message = "no dash separating Turkish and Russian"
+                self.report(line_number, column, ProblemKind.BAD_COLUMNS, message)
+                continue
+
+            middle = separators[0]
+            parts = ((0, line[: middle.start()]), (middle.end(), line[middle.end() :]))
+            valid = True
+            words: list[list[str]] = []
+            for (start, part), symbols in zip(parts, sides):
+                for offset, message in check_parentheses(part):
+                    column = start + offset + 1
+                    kind = ProblemKind.UNBALANCED_PARENTHESES
+                    self.report(line_number, column, kind, message)
+                    valid = False
+                words_part, words_offset = strip_hint(part)
+                words.append(words_part.split(", "))
+                for offset, kind, message in check_words(words[-1], ", ", symbols):
+                    column = start + words_offset + offset + 1
+                    self.report(line_number, column, kind, message)
+                    valid = valid and kind != ProblemKind.EMPTY_ALTERNATIVE
+
+            if valid:
+                self.check_duplicate(words[0], words[1], line_number)
+
+
+def lint_file(path: str) -> list[Problem]:
+    """Find all problems of a dictionary file.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the file, possibly compressed.
+
+    Returns
+    ----------
+    problems : list[Problem]
+        Problems in the order of lines. Empty list if the file is valid.
+    """
+    linter = FileLinter(path)
+    try:
+        with open_binary(path) as f:
+            content = f.read()
+    except (OSError, *DECOMPRESSION_ERRORS) as error:
+        linter.report(1, 1, ProblemKind.ENCODING, f"can't be read: {error}")
+        return linter.problems
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError as error:
+        line = content.count(b"\n", 0, error.start) + 1
+        column = error.start - content.rfind(b"\n", 0, error.start)
+        linter.report(line, column, ProblemKind.ENCODING, "invalid UTF-8")
+        return linter.problems
+
+    lines = text.splitlines()
+    if lint_format(path) == "csv":
+        linter.lint_csv(lines)
+    else:
+        linter.lint_turkrut(lines)
+    return linter.problems
+
+
+def find_dictionary_files(paths: Iterable[str]) -> list[str]:
+    """Expand directories into dictionary files inside them.
+
+    Files inside directories are kept only if their format is recognized,
+    explicitly given files are always kept.
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for filepath in scan_directories([path]):
+            if lint_format(filepath) is not None:
+                files.append(filepath)
+    return files
+
+
+def lint_files(
+    paths: list[str], processes: Optional[int] = None
+) -> Iterator[tuple[str, list[Problem]]]:
+    """Generator yielding problems of each file, validating files in parallel.
+
+    Files are distributed among worker processes in batches, results are
+    yielded in the order of the paths.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Paths to dictionary files.
+    processes : Optional[int]
+        The number of worker processes, the number of CPUs by default. Files
+        are validated in this process if it's 1 or there are few files.
+
+    Yields
+    ----------
+    path : str
+        A path to a dictionary file.
+    problems : list[Problem]
+        Problems of the file.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1 or len(paths) < 2 * processes:
+        for path in paths:
+            yield path, lint_file(path)
+        return
+
+    chunksize = max(1, len(paths) // (processes * 8))
+    with ProcessPoolExecutor(processes) as executor:
+        yield from zip(paths, executor.map(lint_file, paths, chunksize=chunksize))
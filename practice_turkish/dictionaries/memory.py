@@ -0,0 +1,264 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Iterable, Type
+import gc
+import sys
+import tracemalloc
+
+from practice_turkish.dictionaries.dictionary import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.interning import string_pool
+from practice_turkish.dictionaries.shared import SharedDictionary
+from practice_turkish.dictionaries.watch import WatchedDictionary
+
+N_SITES = 5
+
+# Objects shared by the whole program, never counted.
+SHARED_TYPES = (type, ModuleType, FunctionType, Enum, type(None), bool)
+
+
+class SizeWalker:
+    """A class used to sum sizes of objects and everything they refer to.
+
+    Sizes are taken by `sys.getsizeof`. Each object is counted once, by the
+    first walk reaching it, so strings shared by entries through the string
+    pool are counted once, and indexes aren't charged for entries they refer
+    to, given entries are walked first. Counted objects are kept alive by
+    the walker, so temporary objects can't reuse identifiers of counted ones.
+
+    Methods
+    ----------
+    def shallow(self, *objects: Any) -> int
+        Total size of objects not counted before, without objects they refer to.
+
+    def size(self, *objects: Any) -> int
+        Total size of objects not counted before and objects they refer to.
+    """
+
+    def __init__(self) -> None:
+        self.seen: set[int] = set()
+        self._counted: list[Any] = []
+
+    def shallow(self, *objects: Any) -> int:
+        "Total size of objects not counted before, without objects they refer to."
+        total = 0
+        for obj in objects:
+            if id(obj) not in self.seen and not isinstance(obj, SHARED_TYPES):
+                self.seen.add(id(obj))
+                self._counted.append(obj)
+                total += sys.getsizeof(obj)
+        return total
+
+    def size(self, *objects: Any) -> int:
+        "Total size of objects not counted before and objects they refer to."
+        total = 0
+        stack = list(objects)
+        while stack:
+            obj = stack.pop()
+            if id(obj) in self.seen or isinstance(obj, SHARED_TYPES):
+                continue
+            self.seen.add(id(obj))
+            self._counted.append(obj)
+            total += sys.getsizeof(obj)
+            if isinstance(obj, (str, bytes, bytearray, int, float)):
+                continue
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            else:
+                attributes = getattr(obj, "__dict__", None)
+                if attributes is not None:
+                    stack.append(attributes)
+                for name in getattr(type(obj), "__slots__", ()):
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+        return total
+
+
+@dataclass
+class MemoryReport:
+    """A class used to represent memory taken by a dictionary loaded one way.
+
+    Attributes
+    ----------
+    backend : str
+        The way the dictionary is loaded, e.g. "list" or "shared".
+    n_entries : int
+        The number of entries.
+    traced_bytes : int
+        Memory allocated by loading and still held, by `tracemalloc`.
+    peak_bytes : int
+        The peak of memory allocated while loading, by `tracemalloc`.
+    components : dict[str, int]
+        Sizes of parts of the dictionary in bytes, by `sys.getsizeof` walks.
+    sites : list[tuple[str, int]]
+        Lines of code allocating the most of the held memory.
+    """
+
+    backend: str
+    n_entries: int
+    traced_bytes: int = 0
+    peak_bytes: int = 0
+    components: dict[str, int] = field(default_factory=dict)
+    sites: list[tuple[str, int]] = field(default_factory=list)
+
+    def per_entry(self, n_bytes: int) -> float:
+        "Bytes per entry."
+        return n_bytes / max(self.n_entries, 1)
+
+    def to_json(self) -> dict[str, Any]:
+        "The report as a JSON object, with sizes per entry."
+        return {
+            "backend": self.backend,
+            "entries": self.n_entries,
+            "traced_bytes": self.traced_bytes,
+            "peak_bytes": self.peak_bytes,
+            "traced_bytes_per_entry": round(self.per_entry(self.traced_bytes), 1),
+            "components": self.components,
+            "components_per_entry": {
+                name: round(self.per_entry(size), 1)
+                for name, size in self.components.items()
+            },
+            "sites": [{"site": site, "bytes": size} for site, size in self.sites],
+        }
+
+
+def entry_components(
+    entries: Iterable[DictionaryEntry], walker: SizeWalker
+) -> dict[str, int]:
+    """Sizes of entries split by their attributes.
+
+    Attributes are classified by their names and values: hints, containers
+    of words and the words in them, and other strings, e.g. queries.
+
+    Returns
+    ----------
+    components : dict[str, int]
+        Sizes of "entry objects", "word containers", "words", "hints" and
+        "other strings" in bytes.
+    """
+    components = dict.fromkeys(
+        ["entry objects", "word containers", "words", "hints", "other strings"], 0
+    )
+    for entry in entries:
+        attributes = vars(entry)
+        components["entry objects"] += walker.shallow(entry, attributes)
+        for name, value in attributes.items():
+            if "hint" in name:
+                components["hints"] += walker.size(value)
+            elif isinstance(value, (list, set, frozenset, tuple)):
+                components["word containers"] += walker.shallow(value)
+                components["words"] += walker.size(*value)
+            else:
+                components["other strings"] += walker.size(value)
+    return components
+
+
+def dictionary_components(dictionary: Dictionary[Any]) -> dict[str, int]:
+    """Sizes of parts of a dictionary and of indexes built over it.
+
+    Returns
+    ----------
+    components : dict[str, int]
+        Sizes of the entries split by `entry_components`, the list of
+        entries, the string pool, the duplicate and the bitmap indexes, and
+        the index of lines of a watched dictionary, in bytes.
+    """
+    walker = SizeWalker()
+    components = entry_components(dictionary.entries, walker)
+    components["entry list"] = walker.shallow(dictionary.entries)
+    components["string pool"] = walker.size(string_pool)
+    if isinstance(dictionary, WatchedDictionary):
+        components["line index"] = walker.size(dictionary.source)
+    dictionary.build_index()
+    components["duplicate index"] = walker.size(dictionary.index)
+    dictionary.index = None
+    components["bitmap index"] = walker.size(dictionary.bitmap_index())
+    return components
+
+
+def trace(load: Callable[[], Any]) -> tuple[Any, int, int, list[tuple[str, int]]]:
+    """Load something, tracing memory allocations.
+
+    Returns
+    ----------
+    loaded : Any
+        The result of `load`.
+    traced : int
+        Memory allocated by loading and still held in bytes.
+    peak : int
+        The peak of memory allocated while loading in bytes.
+    sites : list[tuple[str, int]]
+        Lines of code allocating the most of the held memory.
+    """
+    gc.collect()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        loaded = load()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+    differences = after.compare_to(before, "lineno")[:N_SITES]
+    sites = [
+        (f"{d.traceback[0].filename}:{d.traceback[0].lineno}", d.size_diff)
+        for d in differences
+    ]
+    return loaded, current - base, peak - base, sites
+
+
+def report_backends(path: str, type: Type[DictionaryEntry]) -> list[MemoryReport]:
+    """Load a dictionary file each available way and account its memory.
+
+    Backends are: "list", entries in a list as `Dictionary.from_file` reads
+    them; "watched", a `WatchedDictionary` keeping an index of lines; and
+    "shared", a `SharedDictionary` exported into shared memory, which is
+    outside the heap and reported as the "shared block". The string pool
+    is cleared before each backend, so each one is measured from scratch.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the dictionary file.
+    type : Type[DictionaryEntry]
+        Type of entries of the file.
+
+    Returns
+    ----------
+    reports : list[MemoryReport]
+        A report for each backend.
+    """
+    backends: dict[str, Callable[[], Dictionary[Any]]] = {
+        "list": lambda: Dictionary.from_file(path, type),
+        "watched": lambda: WatchedDictionary.watch(path, type),
+    }
+    reports = []
+    for name, load in backends.items():
+        string_pool.clear()
+        dictionary, traced, peak, sites = trace(load)
+        report = MemoryReport(name, len(dictionary), traced, peak, sites=sites)
+        report.components = dictionary_components(dictionary)
+        reports.append(report)
+        del dictionary
+
+    string_pool.clear()
+    dictionary = Dictionary.from_file(path, type)
+    shared, traced, peak, sites = trace(lambda: SharedDictionary.export(dictionary))
+    try:
+        report = MemoryReport("shared", len(shared), traced, peak, sites=sites)
+        report.components = {"shared block": shared.memory.size}
+        reports.append(report)
+    finally:
+        shared.close()
+        shared.unlink()
+    string_pool.clear()
+    return reports
@@ -0,0 +1,289 @@
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import accumulate
+from typing import Generic, Iterable, Iterator, Optional, Sequence, Type
+import os
+import random
+
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import (
+    Dictionary,
+    DictionaryEntry,
+    DictionaryFormatError,
+)
+from practice_turkish.dictionaries.dictionary import DE
+from practice_turkish.dictionaries.catalog import detect_entry_type, scan_directories
+from practice_turkish.dictionaries.interning import string_pool
+
+Source = tuple[str, Type[DictionaryEntry], Optional[float]]
+
+
+def parse_source(spec: str) -> tuple[str, Optional[float]]:
+    """Split a command line specification of a dictionary into path and weight.
+
+    The specification is either a path or a path followed by "=" and a weight,
+    for example "CSV/verbs.csv=2".
+
+    Parameters
+    ----------
+    spec : str
+        The specification typed in by the user.
+
+    Returns
+    ----------
+    path : str
+        A string representing a path to a file or a directory.
+    weight : Optional[float]
+        The weight if given, None otherwise.
+    """
+    path, separator, weight = spec.rpartition("=")
+    if separator:
+        try:
+            return path, float(weight)
+        except ValueError:
+            pass
+    return spec, None
+
+
+def resolve_sources(specs: Iterable[str]) -> list[Source]:
+    """Resolve specifications of dictionaries into files and their types.
+
+    Directories are expanded into all dictionary files inside them, files of
+    unknown format are skipped. A weight given for a directory applies to each
+    file inside it.
+
+    Parameters
+    ----------
+    specs : Iterable[str]
+        Specifications of files or directories, see `parse_source`.
+
+    Returns
+    ----------
+    sources : list[tuple[str, Type[DictionaryEntry], Optional[float]]]
+        Paths to dictionary files, types of their entries and weights.
+
+    Raises
+    ----------
+    DictionaryFormatError
+        If the format of an explicitly given file isn't recognized.
+    """
+    sources: list[Source] = []
+    for spec in specs:
+        path, weight = parse_source(spec)
+        if os.path.isdir(path):
+            for filepath in scan_directories([path]):
+                entry_type = detect_entry_type(filepath)
+                if entry_type is not None:
+                    sources.append((filepath, entry_type, weight))
+            continue
+
+        entry_type = detect_entry_type(path)
+        if entry_type is None:
+            raise DictionaryFormatError(f"Unknown format of the file {path}.")
+        sources.append((path, entry_type, weight))
+    return sources
+
+
+def load_dictionary(
+    path: str,
+    type: Type[DictionaryEntry],
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Dictionary[DictionaryEntry]:
+    """Load a dictionary, or only a random sample of its entries.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the dictionary file.
+    type : Type[DictionaryEntry]
+        Type of entries of the dictionary.
+    sample : Optional[int]
+        If given, only this number of random entries is loaded.
+    seed : Optional[int]
+        Seed of the random number generator used to sample entries.
+    """
+    if sample is None:
+        return Dictionary.from_file(path, type)
+    return Dictionary.sample_from_file(path, type, sample, seed)
+
+
+def load_dictionaries(
+    sources: Sequence[tuple[str, Type[DictionaryEntry]]],
+    processes: Optional[int] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> list[Dictionary[DictionaryEntry]]:
+    """Load several dictionaries in parallel.
+
+    Each file is parsed by `load_dictionary` in a separate process, so the
+    total time is close to the time of parsing the largest file. A single
+    file is read by this process, unless `processes` is given: then it's split
+    into chunks parsed in parallel, if its format allows it.
+    Strings of entries received from worker processes are interned through
+    the pool of this process, so equal words and hints of different files
+    share memory.
+
+    Parameters
+    ----------
+    sources : Sequence[tuple[str, Type[DictionaryEntry]]]
+        Paths to dictionary files and types of their entries.
+    processes : Optional[int]
+        The maximum number of worker processes, the number of CPUs by default.
+        A single file is parsed in parallel only if it's given.
+    sample : Optional[int]
+        If given, only this number of random entries is loaded from each file.
+    seed : Optional[int]
+        Seed of the random number generator used to sample entries.
+
+    Returns
+    ----------
+    dictionaries : list[Dictionary]
+        Loaded dictionaries in the same order as sources.
+    """
+    load = partial(load_dictionary, sample=sample, seed=seed)
+    if len(sources) == 1 and sample is None:
+        path, type = sources[0]
+        return [Dictionary.from_file(path, type, processes or 1)]
+    if len(sources) <= 1 or processes == 1:
+        return [load(path, type) for path, type in sources]
+
+    paths = [path for path, _ in sources]
+    types = [type for _, type in sources]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        dictionaries = list(executor.map(load, paths, types))
+    for dictionary in dictionaries:
+        for entry in dictionary:
+            entry.intern_strings(string_pool)
+    return dictionaries
+
+
+class DictionaryMixture(Generic[DE]):
+    """A class used to practice several dictionaries in one session.
+
+    Questions are drawn from the dictionaries by weighted sampling with
+    replacement: first a dictionary is picked with a probability proportional
+    to its weight, then an entry is picked uniformly from it. Entries are never
+    copied into a single list, so drawing a question costs O(log k) for k
+    dictionaries.
+
+    Attributes
+    ----------
+    dictionaries : list[Dictionary]
+        Dictionaries of the session. All of them share the same languages.
+    weights : list[float]
+        Weights of the dictionaries.
+    n_questions : int
+        The number of questions drawn by iterating over the mixture.
+
+    Methods
+    ----------
+    def draw(self) -> DictionaryEntry
+        Draw a random entry.
+
+    def sample(self, k: int) -> list[DictionaryEntry]
+        Draw k distinct random entries.
+    """
+
+    def __init__(
+        self,
+        dictionaries: Sequence[Dictionary[DE]],
+        weights: Optional[Sequence[Optional[float]]] = None,
+        n_questions: Optional[int] = None,
+    ) -> None:
+        """Create a mixture of dictionaries.
+
+        Parameters
+        ----------
+        dictionaries : Sequence[Dictionary]
+            Dictionaries to practice.
+        weights : Optional[Sequence[Optional[float]]]
+            Weights of the dictionaries. A missing weight defaults to the size
+            of the dictionary, which makes every entry equally likely.
+        n_questions : Optional[int]
+            The number of questions in the session, the total number of entries
+            by default.
+
+        Raises
+        ----------
+        DictionaryFormatError
+            If a weight isn't positive, dictionaries have different languages
+            or all of them are empty.
+        """
+        if weights is None:
+            weights = [None] * len(dictionaries)
+        if any(weight is not None and weight <= 0 for weight in weights):
+            raise DictionaryFormatError("Weights of dictionaries must be positive.")
+        weighted = [
+            (dictionary, float(len(dictionary)) if weight is None else weight)
+            for dictionary, weight in zip(dictionaries, weights)
+            if dictionary
+        ]
+        if not weighted:
+            raise DictionaryFormatError("All dictionaries are empty.")
+        languages = {(d.language_a, d.language_b) for d, _ in weighted}
+        if len(languages) != 1:
+            raise DictionaryFormatError("Dictionaries have different languages.")
+
+        self.dictionaries = [dictionary for dictionary, _ in weighted]
+        self.weights = [weight for _, weight in weighted]
+        self._cumulative = list(accumulate(self.weights))
+        self.n_questions = (
+            sum(len(dictionary) for dictionary in self.dictionaries)
+            if n_questions is None
+            else n_questions
+        )
+
+    @property
+    def language_a(self) -> Language:
+        "Language A of the dictionaries."
+        return self.dictionaries[0].language_a
+
+    @property
+    def language_b(self) -> Language:
+        "Language B of the dictionaries."
+        return self.dictionaries[0].language_b
+
+    def draw(self) -> DE:
+        "Draw a random entry."
+        total = self._cumulative[-1]
+        i = bisect_right(self._cumulative, random.random() * total)
+        dictionary = self.dictionaries[min(i, len(self.dictionaries) - 1)]
+        return dictionary[random.randrange(len(dictionary))]
+
+    def sample(self, k: int) -> list[DE]:
+        """Draw k distinct random entries, all of them if there are fewer.
+
+        First the number of entries of each dictionary is drawn: a dictionary
+        is picked by its weight k times, and it isn't picked anymore once all
+        its entries are. Then entries are sampled without replacement within
+        each dictionary, so no draw is wasted on an entry drawn before.
+        """
+        sizes = [len(dictionary) for dictionary in self.dictionaries]
+        k = min(k, sum(sizes))
+        counts = [0] * len(sizes)
+        available = list(range(len(sizes)))
+        cumulative = self._cumulative
+        for _ in range(k):
+            j = bisect_right(cumulative, random.random() * cumulative[-1])
+            j = min(j, len(available) - 1)
+            i = available[j]
+            counts[i] += 1
+            if counts[i] == sizes[i]:
+                del available[j]
+                cumulative = list(accumulate(self.weights[i] for i in available))
+        entries = [
+            entry
+            for dictionary, count in zip(self.dictionaries, counts)
+            for entry in random.sample(dictionary.entries, count)
+        ]
+        random.shuffle(entries)
+        return entries
+
+    def __iter__(self) -> Iterator[DE]:
+        for _ in range(self.n_questions):
+            yield self.draw()
+
+    def __len__(self) -> int:
+        return self.n_questions
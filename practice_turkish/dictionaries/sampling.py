@@ -0,0 +1,56 @@
+from itertools import islice
+from math import exp, floor, log, log1p
+from random import Random
+from typing import Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+def _uniform(rng: Random) -> float:
+    "Draw a random number from the open interval (0, 1)."
+    while (u := rng.random()) == 0.0:
+        pass
+    return u
+
+
+def reservoir_sample(items: Iterable[T], k: int, rng: Random) -> list[T]:
+    """Pick k random items from an iterable in one pass.
+
+    Implements reservoir sampling with geometric jumps (algorithm L): after the
+    reservoir is filled, the number of items to skip before the next
+    replacement is drawn directly, so only O(k log(n/k)) random numbers are
+    generated for n items. Items are consumed one by one and never stored
+    unless selected.
+
+    Parameters
+    ----------
+    items : Iterable
+        Items to sample from.
+    k : int
+        The number of items to pick.
+    rng : Random
+        The random number generator.
+
+    Returns
+    ----------
+    sample : list
+        Selected items in the order they appeared in the iterable. All items,
+        if there are fewer than k of them.
+    """
+    if k <= 0:
+        return []
+
+    iterator = enumerate(items)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) == k:
+        w = exp(log(_uniform(rng)) / k)
+        while True:
+            skip = floor(log(_uniform(rng)) / log1p(-w))
+            item = next(islice(iterator, skip, None), None)
+            if item is None:
+                break
+            reservoir[rng.randrange(k)] = item
+            w *= exp(log(_uniform(rng)) / k)
+
+    reservoir.sort(key=lambda indexed: indexed[0])
+    return [item for _, item in reservoir]
@@ -0,0 +1,368 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterator, Optional
+import pickle
+
+from practice_turkish.cache import cache_path
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.catalog import Catalog
+from practice_turkish.dictionaries.duplicates import normalize_word
+
+INDEX_VERSION = 1
+
+
+def trigrams(term: str) -> set[str]:
+    "Trigrams of a term padded with '$' on both sides."
+    padded = f"${term}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Compute Levenshtein distance between two strings, up to a limit.
+
+    Parameters
+    ----------
+    a, b : str
+        Strings to compare.
+    limit : int
+        The computation stops as soon as the distance is known to exceed it.
+
+    Returns
+    ----------
+    distance : int
+        The edit distance, or `limit + 1` if it's greater than the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def entry_terms(entry: DictionaryEntry) -> Iterator[tuple[Language, str]]:
+    "Generator yielding alternatives of an entry and separate words of phrases."
+    for language, words in (
+        (entry.language_a, entry.words_a),
+        (entry.language_b, entry.words_b),
+    ):
+        for word in words:
+            yield language, word
+            for token in word.split():
+                yield language, token
+
+
+class MatchKind(str, Enum):
+    """An enum used to represent how a term matched a query.
+
+    Values
+    ----------
+    EXACT
+        The term is equal to the query.
+    SUBSTRING
+        The query is a part of the term.
+    FUZZY
+        The term differs from the query by a few typos.
+    """
+
+    EXACT = "EXACT"
+    SUBSTRING = "SUBSTRING"
+    FUZZY = "FUZZY"
+
+
+@dataclass
+class SearchResult:
+    """A class used to represent an entry found by a search.
+
+    Attributes
+    ----------
+    path : str
+        A string representing a path to the dictionary file.
+    offset : int
+        The index of the entry within the dictionary.
+    query_a : str
+        The entry in language A.
+    query_b : str
+        The entry in language B.
+    term : str
+        The indexed term matching the query.
+    kind : MatchKind
+        How the term matched the query.
+    distance : int
+        Edit distance between the term and the query, 0 unless fuzzy.
+    """
+
+    path: str
+    offset: int
+    query_a: str
+    query_b: str
+    term: str
+    kind: MatchKind
+    distance: int = 0
+
+
+@dataclass
+class IndexedFile:
+    """A class used to represent a dictionary file within the search index.
+
+    Attributes
+    ----------
+    sha1 : str
+        Hex digest of the content of the file when it was indexed.
+    entries : list[tuple[str, str]]
+        Queries of both languages of each entry, shown in search results.
+    terms : set[str]
+        Normalized terms occurring in the file.
+    """
+
+    sha1: str
+    entries: list[tuple[str, str]]
+    terms: set[str] = field(default_factory=set)
+
+
+class SearchIndex:
+    """A class used to find dictionary entries containing a word.
+
+    The index consists of an inverted index mapping each normalized term to
+    the entries it occurs in, grouped by file, and a trigram index mapping
+    each trigram to terms containing it. The latter is used for substring and
+    typo-tolerant search. The index is updated incrementally: only files whose
+    hash changed are indexed again.
+
+    Methods
+    ----------
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> SearchIndex
+        Load the index from a file.
+
+    def update(self, catalog: Catalog) -> tuple[int, int]
+        Bring the index up to date with files of the catalog.
+
+    def save(self) -> None
+        Write the index to the file.
+
+    def search(self, query: str, limit: int = 20, fuzzy: bool = True)
+            -> list[SearchResult]
+        Find entries matching the query.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.files: dict[str, IndexedFile] = {}
+        self.postings: dict[str, dict[str, list[int]]] = {}
+        self.trigrams: dict[str, set[str]] = {}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "SearchIndex":
+        "Load the index from a file, empty if it's missing or outdated."
+        if path is None:
+            path = cache_path("search.pickle")
+        index = cls(path)
+        try:
+            with open(path, "rb") as f:
+                version, files, postings, trigrams_ = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return index
+        if version == INDEX_VERSION:
+            index.files, index.postings, index.trigrams = files, postings, trigrams_
+        return index
+
+    def save(self) -> None:
+        "Write the index to the file."
+        with open(self.path, "wb") as f:
+            state = (INDEX_VERSION, self.files, self.postings, self.trigrams)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def update(self, catalog: Catalog) -> tuple[int, int]:
+        """Bring the index up to date with files of the catalog.
+
+        Files which can't be parsed are skipped.
+
+        Parameters
+        ----------
+        catalog : Catalog
+            An up to date catalog of dictionary files.
+
+        Returns
+        ----------
+        indexed : int
+            The number of new or changed files, which were indexed.
+        removed : int
+            The number of files removed from the index.
+        """
+        removed = 0
+        for path in list(self.files):
+            if path not in catalog.entries:
+                self.remove_file(path)
+                removed += 1
+
+        indexed = 0
+        for entry in catalog:
+            indexed_file = self.files.get(entry.path)
+            if indexed_file is not None and indexed_file.sha1 == entry.sha1:
+                continue
+            try:
+                dictionary = Dictionary.from_file(entry.path, entry.entry_type)
+            except (ValueError, UnicodeDecodeError):
+                continue
+            self.add_file(entry.path, entry.sha1, dictionary)
+            indexed += 1
+        return indexed, removed
+
+    def add_file(
+        self, path: str, sha1: str, dictionary: Dictionary[DictionaryEntry]
+    ) -> None:
+        "Index entries of a dictionary, replacing the file if it's indexed."
+        if path in self.files:
+            self.remove_file(path)
+
+        indexed_file = IndexedFile(
+            sha1, [(entry.query_a, entry.query_b) for entry in dictionary]
+        )
+        for offset, entry in enumerate(dictionary):
+            for language, term in entry_terms(entry):
+                normalized = normalize_word(term, language)
+                if not normalized:
+                    continue
+                offsets = self.postings.setdefault(normalized, {}).setdefault(path, [])
+                if not offsets or offsets[-1] != offset:
+                    offsets.append(offset)
+                if normalized not in indexed_file.terms:
+                    indexed_file.terms.add(normalized)
+                    for trigram in trigrams(normalized):
+                        self.trigrams.setdefault(trigram, set()).add(normalized)
+        self.files[path] = indexed_file
+
+    def remove_file(self, path: str) -> None:
+        "Remove entries of a dictionary file from the index."
+        indexed_file = self.files.pop(path)
+        for term in indexed_file.terms:
+            files = self.postings[term]
+            del files[path]
+            if files:
+                continue
+            del self.postings[term]
+            for trigram in trigrams(term):
+                terms = self.trigrams[trigram]
+                terms.discard(term)
+                if not terms:
+                    del self.trigrams[trigram]
+
+    def _substring_terms(self, query: str) -> list[str]:
+        """Terms containing the query, shorter terms first.
+
+        Queries shorter than a trigram match only terms starting with them.
+        """
+        if len(query) < 3:
+            candidates: set[str] = set()
+            for gram, terms in self.trigrams.items():
+                if gram.startswith(f"${query}"):
+                    candidates |= terms
+        else:
+            grams = [query[i : i + 3] for i in range(len(query) - 2)]
+            sets = sorted((self.trigrams.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*sets)
+        return sorted((term for term in candidates if query in term), key=len)
+
+    def _fuzzy_terms(self, query: str, max_distance: int) -> list[tuple[str, int]]:
+        """Terms within the edit distance from the query, closer terms first.
+
+        An edit changes at most 3 trigrams of a term, so a term within the
+        distance shares all but `3 * max_distance` trigrams with the query.
+        Candidates are taken from the rarest trigrams of the query and
+        filtered by length and the number of shared trigrams before their
+        edit distance is computed.
+        """
+        grams = sorted(
+            (self.trigrams.get(gram, set()) for gram in trigrams(query)), key=len
+        )
+        required = len(grams) - 3 * max_distance
+        candidates: set[str] = set()
+        for terms in grams[: len(grams) - max(required, 1) + 1]:
+            candidates |= terms
+
+        found = []
+        for term in candidates:
+            if abs(len(term) - len(query)) > max_distance:
+                continue
+            if sum(term in terms for terms in grams) < required:
+                continue
+            distance = edit_distance(query, term, max_distance)
+            if 0 < distance <= max_distance:
+                found.append((term, distance))
+        found.sort(key=lambda match: match[1])
+        return found
+
+    def _matching_terms(
+        self, query: str, fuzzy: bool
+    ) -> Iterator[tuple[str, MatchKind, int]]:
+        "Generator yielding terms matching the query, better matches first."
+        normalized = " ".join(query.split()).lower()
+        alternatives = {normalized, normalize_word(query, Language.turkish)}
+        for alternative in alternatives:
+            if alternative in self.postings:
+                yield alternative, MatchKind.EXACT, 0
+        for alternative in alternatives:
+            for term in self._substring_terms(alternative):
+                yield term, MatchKind.SUBSTRING, 0
+        if fuzzy:
+            max_distance = 1 if len(normalized) < 8 else 2
+            for term, distance in self._fuzzy_terms(normalized, max_distance):
+                yield term, MatchKind.FUZZY, distance
+
+    def search(
+        self, query: str, limit: int = 20, fuzzy: bool = True
+    ) -> list[SearchResult]:
+        """Find entries matching the query.
+
+        Entries containing the query as a term go first, then entries with
+        terms containing the query, then entries with terms differing from
+        the query by a few typos. Worse matches are looked for only if there
+        are not enough better ones.
+
+        Parameters
+        ----------
+        query : str
+            A word or a part of it.
+        limit : int
+            The maximum number of results.
+        fuzzy : bool
+            True, if terms with typos should be considered.
+
+        Returns
+        ----------
+        results : list[SearchResult]
+            Found entries, each entry at most once.
+        """
+        results: list[SearchResult] = []
+        if not query.strip() or limit <= 0:
+            return results
+
+        seen: set[tuple[str, int]] = set()
+        for term, kind, distance in self._matching_terms(query, fuzzy):
+            for path, offsets in self.postings[term].items():
+                entries = self.files[path].entries
+                for offset in offsets:
+                    if (path, offset) in seen:
+                        continue
+                    seen.add((path, offset))
+                    query_a, query_b = entries[offset]
+                    results.append(
+                        SearchResult(
+                            path, offset, query_a, query_b, term, kind, distance
+                        )
+                    )
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def __len__(self) -> int:
+        return sum(len(indexed_file.entries) for indexed_file in self.files.values())
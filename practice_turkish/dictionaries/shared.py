@@ -0,0 +1,290 @@
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from random import sample
+from typing import Any, Iterator, Optional
+
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+
+MAGIC = 0x50545344
+VERSION = 1
+NO_STRING = 0xFFFFFFFF
+HEADER_FIELDS = 8
+ENTRY_FIELDS = 8
+ITEM_SIZE = array("I").itemsize
+
+languages = list(Language)
+
+
+class StringTable:
+    """A class used to collect unique strings into one UTF-8 blob.
+
+    Strings are identified by their index, the i-th string is the slice of
+    the blob between the i-th and the (i+1)-th offsets.
+    """
+
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+        self.offsets = array("I", [0])
+        self.blob = bytearray()
+
+    def add(self, s: Optional[str]) -> int:
+        "The identifier of the string, NO_STRING for None."
+        if s is None:
+            return NO_STRING
+        identifier = self.ids.get(s)
+        if identifier is None:
+            identifier = self.ids[s] = len(self.ids)
+            self.blob += s.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return identifier
+
+
+def pack(dictionary: Dictionary) -> tuple[array, array, array, array, bytes]:
+    """Pack entries of a dictionary into flat arrays.
+
+    Parameters
+    ----------
+    dictionary : Dictionary
+        The dictionary to pack.
+
+    Returns
+    ----------
+    header : array
+        Magic number, version, numbers of entries, strings and words,
+        languages and the size of the blob.
+    entries : array
+        For each entry: bounds of its words in language A and in language B
+        in the words array, identifiers of hints and queries.
+    words : array
+        Identifiers of words of all entries.
+    offsets : array
+        Offsets of strings in the blob.
+    blob : bytes
+        Unique strings encoded in UTF-8 one after another.
+    """
+    strings = StringTable()
+    entries = array("I")
+    words = array("I")
+    for entry in dictionary:
+        bounds = [len(words)]
+        words.extend(map(strings.add, entry.words_a))
+        bounds.append(len(words))
+        bounds.append(len(words))
+        words.extend(map(strings.add, entry.words_b))
+        bounds.append(len(words))
+        entries.extend(bounds)
+        entries.extend(map(strings.add, (entry.hint_a, entry.hint_b)))
+        entries.extend(map(strings.add, (entry.query_a, entry.query_b)))
+    header = array(
+        "I",
+        [
+            MAGIC,
+            VERSION,
+            len(dictionary),
+            len(strings.ids),
+            len(words),
+            languages.index(dictionary.language_a),
+            languages.index(dictionary.language_b),
+            len(strings.blob),
+        ],
+    )
+    return header, entries, words, strings.offsets, bytes(strings.blob)
+
+
+class SharedDictionary:
+    """A class used to share a dictionary between processes without copies.
+
+    The dictionary is exported once into a block of shared memory: arrays of
+    32-bit integers describing entries, followed by all unique strings
+    encoded in UTF-8. Other processes attach to the block by its name and
+    read entries through `SharedEntry` views created on access, so any number
+    of workers costs about one copy of the data. Views are read-only.
+
+    Attributes
+    ----------
+    name : str
+        The name of the block of shared memory to attach to.
+    language_a : Language
+        Language A of the dictionary.
+    language_b : Language
+        Language B of the dictionary.
+
+    Methods
+    ----------
+    @classmethod
+    def export(cls, dictionary: Dictionary,
+               name: Optional[str] = None) -> SharedDictionary
+        Copy a dictionary into a new block of shared memory.
+
+    @classmethod
+    def attach(cls, name: str) -> SharedDictionary
+        Attach to a dictionary exported by another process.
+
+    def sample(self, k: int) -> list[SharedEntry]
+        Pick k distinct random entries.
+
+    def close(self) -> None
+        Release the block in this process.
+
+    def unlink(self) -> None
+        Free the block, called by the exporting process once workers finish.
+    """
+
+    def __init__(self, memory: SharedMemory) -> None:
+        self.memory = memory
+        self.name = memory.name
+        buffer = memory.buf
+        header = buffer[: HEADER_FIELDS * ITEM_SIZE].cast("I")
+        fields = header.tolist()
+        header.release()
+        if len(fields) != HEADER_FIELDS or fields[:2] != [MAGIC, VERSION]:
+            raise ValueError(f"{memory.name} doesn't hold a shared dictionary.")
+        n_entries, n_strings, n_words, a, b, blob_size = fields[2:]
+        self.language_a, self.language_b = languages[a], languages[b]
+
+        self._views: list[memoryview] = []
+        position = HEADER_FIELDS * ITEM_SIZE
+        sizes = [n_entries * ENTRY_FIELDS, n_words, n_strings + 1]
+        for size in sizes:
+            end = position + size * ITEM_SIZE
+            self._views.append(buffer[position:end].cast("I"))
+            position = end
+        self._views.append(buffer[position : position + blob_size])
+        self._entries, self._words, self._offsets, self._blob = self._views
+        self._n = n_entries
+
+    @classmethod
+    def export(
+        cls, dictionary: Dictionary, name: Optional[str] = None
+    ) -> "SharedDictionary":
+        """Copy a dictionary into a new block of shared memory.
+
+        Parameters
+        ----------
+        dictionary : Dictionary
+            The dictionary to export, any format.
+        name : Optional[str]
+            The name of the block, a random one by default.
+
+        Returns
+        ----------
+        shared : SharedDictionary
+            The dictionary in shared memory. Pass its `name` to workers.
+        """
+        *arrays, blob = pack(dictionary)
+        chunks = [part.tobytes() for part in arrays] + [blob]
+        memory = SharedMemory(name=name, create=True, size=sum(map(len, chunks)))
+        position = 0
+        for chunk in chunks:
+            memory.buf[position : position + len(chunk)] = chunk
+            position += len(chunk)
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedDictionary":
+        "Attach to a dictionary exported by another process."
+        return cls(SharedMemory(name=name))
+
+    def string(self, identifier: int) -> Optional[str]:
+        "Decode a string from the blob, None for NO_STRING."
+        if identifier == NO_STRING:
+            return None
+        offsets = self._offsets
+        return str(self._blob[offsets[identifier] : offsets[identifier + 1]], "utf-8")
+
+    def field(self, index: int, i: int) -> int:
+        "The i-th field of the index-th entry."
+        return self._entries[index * ENTRY_FIELDS + i]
+
+    def words(self, start: int, end: int) -> set[str]:
+        "Decode words between bounds of the words array."
+        return {self.string(identifier) or "" for identifier in self._words[start:end]}
+
+    def sample(self, k: int) -> list["SharedEntry"]:
+        "Pick k distinct random entries, all of them if there are fewer."
+        return [self[i] for i in sample(range(self._n), k=min(k, self._n))]
+
+    def close(self) -> None:
+        "Release the block in this process, entries can't be read afterwards."
+        for view in self._views:
+            view.release()
+        self.memory.close()
+
+    def unlink(self) -> None:
+        "Free the block, called by the exporting process once workers finish."
+        self.memory.unlink()
+
+    def __enter__(self) -> "SharedDictionary":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> "SharedEntry":
+        if not -self._n <= index < self._n:
+            raise IndexError("SharedDictionary index out of range")
+        return SharedEntry(self, index % self._n)
+
+    def __iter__(self) -> Iterator["SharedEntry"]:
+        return (SharedEntry(self, i) for i in range(self._n))
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class SharedEntry(DictionaryEntry):
+    """A class used to represent a read-only view of an entry in shared memory.
+
+    Views hold only the dictionary and the index, strings are decoded when
+    properties are read. For meaning of the properties, see the parent ABC.
+    """
+
+    def __init__(self, shared: SharedDictionary, index: int) -> None:
+        self.shared = shared
+        self.index = index
+
+    @property
+    def language_a(self) -> Language:
+        return self.shared.language_a
+
+    @property
+    def language_b(self) -> Language:
+        return self.shared.language_b
+
+    @property
+    def words_a(self) -> set[str]:
+        field = self.shared.field
+        return self.shared.words(field(self.index, 0), field(self.index, 1))
+
+    @property
+    def words_b(self) -> set[str]:
+        field = self.shared.field
+        return self.shared.words(field(self.index, 2), field(self.index, 3))
+
+    @property
+    def hint_a(self) -> Optional[str]:
+        return self.shared.string(self.shared.field(self.index, 4))
+
+    @property
+    def hint_b(self) -> Optional[str]:
+        return self.shared.string(self.shared.field(self.index, 5))
+
+    @property
+    def query_a(self) -> str:
+        return self.shared.string(self.shared.field(self.index, 6)) or ""
+
+    @property
+    def query_b(self) -> str:
+        return self.shared.string(self.shared.field(self.index, 7)) or ""
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SharedEntry):
+            return self.shared is other.shared and self.index == other.index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.shared.name, self.index))
+
+    def __repr__(self) -> str:
+        return f"SharedEntry({self.query_a!r}, {self.query_b!r})"
@@ -1,21 +1,31 @@
 import re
-from typing import Type, Optional, TypeVar
+from typing import Any, Type, Optional, TypeVar, Iterator, TextIO
 from dataclasses import dataclass
 
 from practice_turkish.languages import Language
-from practice_turkish.dictionaries import DictionaryEntry
+from practice_turkish.profiling import profiler
+from practice_turkish.dictionaries import DictionaryEntry, FileDictionaryEntry
+from practice_turkish.dictionaries.csvdictionary import merge_hints
 from practice_turkish.dictionaries.parse import inside_parenthesis
+from practice_turkish.dictionaries.compression import open_text
+from practice_turkish.dictionaries.interning import StringPool, string_pool
 
 T = TypeVar("T", bound="TurkrutDictionaryEntry")
 
+separator_pattern = re.compile("-|—|–")
 
-def extract_words_and_hint(s: str) -> tuple[set[str], str]:
+
+def extract_words_and_hint(
+    s: str, pool: StringPool = string_pool
+) -> tuple[set[str], str]:
     """Extracts words and hint for one language
 
     Parameters
     ----------
     s : str
         A part of a turkrut dictionary line to one side of the middle dash.
+    pool : StringPool
+        The pool words and hints are interned through.
 
     Returns
     ----------
@@ -26,12 +36,53 @@ def extract_words_and_hint(s: str) -> tuple[set[str], str]:
     """
     hint = inside_parenthesis(s)
     words_part = s.replace(f"({hint})", "").strip()
-    words = set(words_part.split(", "))
-    return words, hint
+    words = set(pool.intern_all(words_part.split(", ")))
+    return words, pool.intern(hint)
+
+
+def merge_part(
+    query: str,
+    words: set[str],
+    hint: Optional[str],
+    other_words: set[str],
+    other_hint: Optional[str],
+) -> tuple[str, set[str], Optional[str]]:
+    """Merge words and a hint of another entry into one side of a line.
+
+    Parameters
+    ----------
+    query : str
+        The side of the line, e.g. "kitap (isim)".
+    words : set[str]
+        Words of the side.
+    hint : Optional[str]
+        Hint of the side, if any.
+    other_words : set[str]
+        Words of the other entry in the same language.
+    other_hint : Optional[str]
+        Hint of the other entry in the same language, if any.
+
+    Returns
+    ----------
+    query : str
+        The side with missing words appended after its words, e.g.
+        "kitap, defter (isim)".
+    words : set[str]
+        Words of both entries.
+    hint : Optional[str]
+        Hints of both entries, see `merge_hints`.
+    """
+    words_part = query.replace(f"({hint})", "").strip() if hint else query
+    added = [word for word in sorted(other_words) if word not in words]
+    hint = merge_hints(hint, other_hint)
+    query = ", ".join([words_part, *added])
+    if hint:
+        query += f" ({hint})"
+    return query, words | set(added), hint
 
 
 @dataclass
-class TurkrutDictionaryEntry(DictionaryEntry):
+class TurkrutDictionaryEntry(FileDictionaryEntry):
     """A class used to represent a dictionary entry from turkrut.ru.
 
     The structure:
@@ -73,6 +124,14 @@ class TurkrutDictionaryEntry(DictionaryEntry):
     def words_b(self) -> set[str]:
         return self._russian_words
 
+    @property
+    def hint_a(self) -> Optional[str]:
+        return self._turkish_hint or None
+
+    @property
+    def hint_b(self) -> Optional[str]:
+        return self._russian_hint or None
+
     @staticmethod
     def extension() -> str:
         return ".txt"
@@ -95,19 +154,52 @@ class TurkrutDictionaryEntry(DictionaryEntry):
         item : TurkrutDictionaryItem
             An entry representing the line
         """
-        tk, ru = re.split("-|—|–", line)
+        tk, ru = separator_pattern.split(line)
         tk, ru = tk.strip(), ru.strip()
         tk_words, tk_hint = extract_words_and_hint(tk)
         ru_words, ru_hint = extract_words_and_hint(ru)
         return cls(tk, ru, tk_words, ru_words, tk_hint, ru_hint)
 
+    def merge(self, other: DictionaryEntry) -> None:
+        self._turkish, self._turkish_words, self._turkish_hint = merge_part(
+            self._turkish,
+            self._turkish_words,
+            self._turkish_hint,
+            other.words_a,
+            other.hint_a,
+        )
+        self._russian, self._russian_words, self._russian_hint = merge_part(
+            self._russian,
+            self._russian_words,
+            self._russian_hint,
+            other.words_b,
+            other.hint_b,
+        )
+
+    def intern_strings(self, pool: StringPool) -> None:
+        self._turkish_words = set(pool.intern_all(self._turkish_words))
+        self._russian_words = set(pool.intern_all(self._russian_words))
+        self._turkish_hint = pool.intern_optional(self._turkish_hint)
+        self._russian_hint = pool.intern_optional(self._russian_hint)
+
     @classmethod
+    @profiler.timed("TurkrutDictionaryEntry.read_dictionary_from_file")
     def read_dictionary_from_file(
         cls: Type[T], path: str
     ) -> tuple[list[T], Language, Language]:
-        with open(path, encoding="utf-8") as f:
+        with open_text(path) as f:
             return (
                 [cls.from_line(line) for line in f],
                 Language.turkish,
                 Language.russian,
             )
+
+    @classmethod
+    def read_records(cls, f: TextIO) -> tuple[Iterator[Any], Language, Language]:
+        return iter(f), Language.turkish, Language.russian
+
+    @classmethod
+    def from_record(
+        cls: Type[T], record: Any, language_a: Language, language_b: Language
+    ) -> T:
+        return cls.from_line(record)
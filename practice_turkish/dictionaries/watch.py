@@ -0,0 +1,438 @@
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Generic, Iterable, Optional, Type, TypeVar, cast
+import csv
+import io
+import os
+
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries.bitmap import compile_filter
+from practice_turkish.dictionaries.compression import open_text
+from practice_turkish.dictionaries.interning import string_pool
+from practice_turkish.dictionaries.dictionary import (
+    Dictionary,
+    DictionaryEntry,
+    DictionaryFormatError,
+    FileDictionaryEntry,
+)
+
+DE = TypeVar("DE", bound=DictionaryEntry)
+
+# Changed ranges longer than this are matched by hashes only, since diffing
+# them line by line takes quadratic time.
+MAX_DIFF_LINES = 5_000
+
+
+@dataclass
+class Changes(Generic[DE]):
+    """A class used to represent changes of a dictionary file.
+
+    Attributes
+    ----------
+    added : list[DictionaryEntry]
+        Entries of new lines.
+    removed : list[DictionaryEntry]
+        Entries of deleted lines.
+    modified : list[tuple[DictionaryEntry, DictionaryEntry]]
+        Old and new entries of edited lines.
+    invalid : list[int]
+        Numbers of changed lines which can't be parsed, counting from 1.
+    """
+
+    added: list[DE] = field(default_factory=list)
+    removed: list[DE] = field(default_factory=list)
+    modified: list[tuple[DE, DE]] = field(default_factory=list)
+    invalid: list[int] = field(default_factory=list)
+
+    def apply(self, entries: Iterable[DE]) -> list[DE]:
+        "Entries without removed ones, with modified ones replaced and added ones last."
+        removed = {id(entry) for entry in self.removed}
+        replaced = {id(old): new for old, new in self.modified}
+        merged = [replaced.get(id(e), e) for e in entries if id(e) not in removed]
+        merged.extend(self.added)
+        return merged
+
+    def describe(self) -> str:
+        "Numbers of added, removed and modified entries."
+        counts = [
+            (len(self.added), "added"),
+            (len(self.removed), "removed"),
+            (len(self.modified), "modified"),
+        ]
+        return ", ".join(f"{n} {what}" for n, what in counts if n) or "no entries"
+
+
+# For each new line the old line it is equal to, None if it's changed; old
+# lines without equal new lines; and pairs of old and new lines replacing them.
+Matching = tuple[list[Optional[int]], list[int], list[tuple[int, int]]]
+
+
+def trim_common_ends(old: list[int], new: list[int]) -> tuple[int, int, int]:
+    """Find the changed ranges of two lists of hashes of lines.
+
+    Returns
+    ----------
+    start : int
+        The length of the common beginning.
+    old_end : int
+        The end of the changed range of the old list.
+    new_end : int
+        The end of the changed range of the new list.
+    """
+    start = 0
+    end = min(len(old), len(new))
+    while start < end and old[start] == new[start]:
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+def match_by_diff(old: list[int], new: list[int]) -> Matching:
+    """Match lines by a diff of their hashes, pairing replaced lines.
+
+    The diff keeps lines in order, so lines moved past others are matched
+    by hashes afterwards, to keep their entries. See `Matching`.
+    """
+    sources: list[Optional[int]] = [None] * len(new)
+    blocks: list[tuple[range, range]] = []
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            sources[j1:j2] = range(i1, i2)
+        else:
+            blocks.append((range(i1, i2), range(j1, j2)))
+
+    by_hash: dict[int, list[int]] = {}
+    for old_lines, _ in reversed(blocks):
+        for i in reversed(old_lines):
+            by_hash.setdefault(old[i], []).append(i)
+    moved = set()
+    for _, new_lines in blocks:
+        for j in new_lines:
+            matches = by_hash.get(new[j])
+            if matches:
+                sources[j] = matches.pop()
+                moved.add(sources[j])
+
+    removed: list[int] = []
+    pairs: list[tuple[int, int]] = []
+    for old_lines, new_lines in blocks:
+        old_left = [i for i in old_lines if i not in moved]
+        removed.extend(old_left)
+        pairs.extend(zip(old_left, [j for j in new_lines if sources[j] is None]))
+    return sources, removed, pairs
+
+
+def match_by_hash(old: list[int], new: list[int]) -> Matching:
+    "Match lines with equal hashes in linear time, no lines are paired."
+    by_hash: dict[int, list[int]] = {}
+    for i in reversed(range(len(old))):
+        by_hash.setdefault(old[i], []).append(i)
+    sources: list[Optional[int]] = []
+    for h in new:
+        matches = by_hash.get(h)
+        sources.append(matches.pop() if matches else None)
+    removed = sorted(i for matches in by_hash.values() for i in matches)
+    return sources, removed, []
+
+
+def collect_changes(
+    old_entries: list[Optional[DE]],
+    entries: list[Optional[DE]],
+    unparsed: list[int],
+    removed: list[int],
+    pairs: list[tuple[int, int]],
+) -> Changes[DE]:
+    """Classify entries of changed lines.
+
+    Parameters
+    ----------
+    old_entries : list[Optional[DictionaryEntry]]
+        Entries of the old changed range, None for blank and invalid lines.
+    entries : list[Optional[DictionaryEntry]]
+        Entries of the new changed range.
+    unparsed : list[int]
+        New lines without equal old lines.
+    removed : list[int]
+        Old lines without equal new lines.
+    pairs : list[tuple[int, int]]
+        Old and new lines replacing them.
+
+    Returns
+    ----------
+    changes : Changes
+        Pairs of valid lines are modified entries, other new lines are added
+        and other old lines are removed.
+    """
+    changes: Changes[DE] = Changes()
+    paired_old, paired_new = set(), set()
+    for i, j in pairs:
+        old_entry, new_entry = old_entries[i], entries[j]
+        if old_entry is not None and new_entry is not None:
+            changes.modified.append((old_entry, new_entry))
+            paired_old.add(i)
+            paired_new.add(j)
+    for i in removed:
+        old_entry = old_entries[i]
+        if i not in paired_old and old_entry is not None:
+            changes.removed.append(old_entry)
+    for j in unparsed:
+        new_entry = entries[j]
+        if j not in paired_new and new_entry is not None:
+            changes.added.append(new_entry)
+    return changes
+
+
+class FileLines(Generic[DE]):
+    """A class used to keep entries of a dictionary file by its lines.
+
+    Each line is kept as its hash and its entry. When the file changes, its
+    lines are hashed again, and only lines with new hashes are parsed: the
+    unchanged beginning and end of the file are skipped, lines in between
+    are matched to old lines by hashes, so moved lines keep their entries.
+    Records spanning several lines aren't supported, such lines are invalid.
+
+    Attributes
+    ----------
+    path : str
+        A string representing a path to the file.
+    type : Type[DictionaryEntry]
+        Type of entries of the file, a `FileDictionaryEntry`.
+    language_a : Language
+        Language A of the file.
+    language_b : Language
+        Language B of the file.
+
+    Methods
+    ----------
+    def changed(self) -> bool
+        Check the modification time and the size of the file.
+
+    def update(self) -> Changes
+        Read the file and parse changed lines.
+    """
+
+    def __init__(self, path: str, type: Type[DE]) -> None:
+        self.path = path
+        self.type = type
+        self.language_a = Language.turkish
+        self.language_b = Language.russian
+        self._header: Optional[str] = None
+        self._hashes: list[int] = []
+        self._entries: list[Optional[DE]] = []
+        self._stamp = (0, -1)
+
+    @property
+    def format(self) -> Type[FileDictionaryEntry]:
+        "Type of entries of the file, which reads and parses its lines."
+        assert issubclass(self.type, FileDictionaryEntry)
+        return self.type
+
+    @property
+    def entries(self) -> list[DE]:
+        "Entries of valid lines in the order of the file."
+        return [entry for entry in self._entries if entry is not None]
+
+    def stamp(self) -> tuple[int, int]:
+        "The modification time in nanoseconds and the size of the file."
+        status = os.stat(self.path)
+        return status.st_mtime_ns, status.st_size
+
+    def changed(self) -> bool:
+        "True, if the file was modified since it was read."
+        return self.stamp() != self._stamp
+
+    def update(self) -> Changes[DE]:
+        """Read the file and parse lines changed since it was read last time.
+
+        Returns
+        ----------
+        changes : Changes
+            Added, removed and modified entries. Everything is added when the
+            file is read for the first time or its header changes.
+        """
+        self._stamp = self.stamp()
+        with open_text(self.path) as f:
+            lines = f.read().splitlines()
+        n_header = self.format.header_lines()
+        header = "".join(line + "\n" for line in lines[:n_header])
+        lines = lines[n_header:]
+        hashes = list(map(hash, lines))
+
+        if header != self._header:
+            self._header = header
+            self.language_a, self.language_b = self.read_languages()
+            previous = self.entries
+            self._hashes, self._entries = hashes, self.parse(lines)
+            invalid = self.invalid_lines(lines, range(len(lines)))
+            return Changes(self.entries, previous, invalid=invalid)
+
+        old = self._hashes
+        start, old_end, new_end = trim_common_ends(old, hashes)
+        old_range, new_range = old[start:old_end], hashes[start:new_end]
+        if len(old_range) + len(new_range) <= MAX_DIFF_LINES:
+            sources, removed, pairs = match_by_diff(old_range, new_range)
+        else:
+            sources, removed, pairs = match_by_hash(old_range, new_range)
+
+        old_entries = self._entries[start:old_end]
+        entries = [None if i is None else old_entries[i] for i in sources]
+        unparsed = [j for j, i in enumerate(sources) if i is None]
+        parsed = self.parse([lines[start + j] for j in unparsed])
+        for j, entry in zip(unparsed, parsed):
+            entries[j] = entry
+        changes = collect_changes(old_entries, entries, unparsed, removed, pairs)
+
+        self._hashes = hashes
+        self._entries[start:old_end] = entries
+        changes.invalid = self.invalid_lines(lines, [start + j for j in unparsed])
+        return changes
+
+    def read_languages(self) -> tuple[Language, Language]:
+        "Languages of the file according to its header."
+        try:
+            _, language_a, language_b = self.format.read_records(
+                io.StringIO(self._header or "")
+            )
+        except (StopIteration, csv.Error) as error:
+            raise DictionaryFormatError(f"{self.path} has no valid header.") from error
+        return language_a, language_b
+
+    def parse(self, lines: list[str]) -> list[Optional[DE]]:
+        "An entry for each line, None for blank lines and lines with errors."
+        if not lines:
+            return []
+        text = (self._header or "") + "".join(line + "\n" for line in lines)
+        try:
+            records = list(self.format.read_records(io.StringIO(text))[0])
+        except (csv.Error, ValueError):
+            records = []
+        if len(records) != len(lines):
+            # Unbalanced quotes join lines into one record, parse them apart.
+            if len(lines) == 1:
+                return [None]
+            return [entry for line in lines for entry in self.parse([line])]
+        return [self.create(line, record) for line, record in zip(lines, records)]
+
+    def create(self, line: str, record: object) -> Optional[DE]:
+        "The entry of a record, None if the line is blank or invalid."
+        if not line.strip():
+            return None
+        try:
+            entry = self.format.from_record(record, self.language_a, self.language_b)
+        except ValueError:
+            return None
+        return cast(DE, entry)
+
+    def invalid_lines(self, lines: list[str], indices: Iterable[int]) -> list[int]:
+        "Numbers of lines which aren't blank but have no entries."
+        offset = self.format.header_lines() + 1
+        return [
+            i + offset for i in indices if self._entries[i] is None and lines[i].strip()
+        ]
+
+
+@dataclass
+class WatchedDictionary(Dictionary[DE]):
+    """A class used to represent a dictionary following changes of its file.
+
+    `refresh` checks whether the file was modified and merges changed lines
+    into the dictionary, without parsing the rest of the file again. A
+    filtered watched dictionary applies the filter to new entries too.
+
+    Attributes
+    ----------
+    source : Optional[FileLines]
+        Entries of the file by its lines.
+    expression : Optional[str]
+        The filter expression new entries should match, if any.
+
+    Methods
+    ----------
+    @classmethod
+    def watch(cls, path: str, type: Type[DictionaryEntry]) -> WatchedDictionary
+        Read a dictionary file and keep following it.
+
+    def refresh(self) -> Optional[Changes]
+        Merge changes of the file into the dictionary.
+    """
+
+    source: Optional[FileLines[DE]] = field(default=None, repr=False, compare=False)
+    expression: Optional[str] = None
+
+    @classmethod
+    def watch(cls, path: str, type: Type[DE]) -> "WatchedDictionary[DE]":
+        """Read a dictionary file and keep following it.
+
+        Raises
+        ----------
+        DictionaryFormatError
+            If the file has lines which can't be parsed.
+        """
+        source = FileLines(path, type)
+        changes = source.update()
+        if changes.invalid:
+            lines = ", ".join(map(str, changes.invalid[:5]))
+            raise DictionaryFormatError(f"{path}: can't parse lines {lines}.")
+        return cls(changes.added, source.language_a, source.language_b, source=source)
+
+    def filter(self, expression: str) -> "WatchedDictionary[DE]":
+        filtered = super().filter(expression)
+        filtered.source = self.source
+        if self.expression is not None:
+            expression = f"({self.expression}) & ({expression})"
+        filtered.expression = expression
+        return filtered
+
+    def refresh(self) -> Optional[Changes[DE]]:
+        """Merge changes of the file into the dictionary.
+
+        Added entries are appended, removed ones are dropped, and modified
+        ones are replaced in place. The string pool is cleared first, so it
+        doesn't keep strings of entries dropped by earlier refreshes.
+
+        Returns
+        ----------
+        changes : Optional[Changes]
+            Changes of entries of the dictionary, None if the file wasn't
+            modified.
+        """
+        if self.source is None or not self.source.changed():
+            return None
+        string_pool.clear()
+        changes = self.source.update()
+        self.language_a = self.source.language_a
+        self.language_b = self.source.language_b
+        if self.expression is not None:
+            changes = self.select(changes)
+        self.entries[:] = changes.apply(self.entries)
+        self.index = None
+        self.bitmap = None
+        return changes
+
+    def select(self, changes: Changes[DE]) -> Changes[DE]:
+        """Changes of entries matching the filter expression.
+
+        Only added and modified entries are checked, one by one, rather than
+        indexing the whole dictionary again.
+        """
+        assert self.expression is not None
+        matches = compile_filter(self.expression)
+        candidates = changes.added + [new for _, new in changes.modified]
+        matching = {id(entry) for entry in candidates if matches(entry)}
+        present = {id(entry) for entry in self.entries}
+        selected: Changes[DE] = Changes(invalid=changes.invalid)
+        selected.added = [entry for entry in changes.added if id(entry) in matching]
+        selected.removed = [entry for entry in changes.removed if id(entry) in present]
+        for old, new in changes.modified:
+            if id(new) not in matching:
+                if id(old) in present:
+                    selected.removed.append(old)
+            elif id(old) in present:
+                selected.modified.append((old, new))
+            else:
+                selected.added.append(new)
+        return selected
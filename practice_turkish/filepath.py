@@ -14,6 +14,12 @@ from practice_turkish.dictionaries import (
     CSVDictionaryEntry,
     TurkrutDictionaryEntry,
 )
+from practice_turkish.dictionaries.compression import has_extension
+from practice_turkish.dictionaries.catalog import (
+    CatalogEntry,
+    detect_entry_type,
+    load_catalog,
+)
 
 
 class ExtensionFilePathCompleter(FilePathCompleter):
@@ -31,7 +37,9 @@ class ExtensionFilePathCompleter(FilePathCompleter):
         True, if completions should contain only directories, False by default.
     extension : Optional[str]
         If given, all files with extensions differing from specified will be
-        filtered from completions. By default (None) no filtering is performed.
+        filtered from completions. Compressed files with the extension followed
+        by ".gz", ".xz" or ".bz2" are kept. By default (None) no filtering is
+        performed.
     """
 
     def __init__(
@@ -56,7 +64,7 @@ class ExtensionFilePathCompleter(FilePathCompleter):
                 continue
             path = Path(document.current_line, filename)
             if self.extension is not None:
-                if path.is_file() and path.suffix != self.extension:
+                if path.is_file() and not has_extension(str(path), self.extension):
                     continue
             yield completion
 
@@ -76,7 +84,8 @@ def prompt_filepath(
     is_file : bool
         True, if the path should lead to an existing file.
     extension : Optional[str]
-        The extension of the filepath to be prompted.
+        The extension of the filepath to be prompted. Compressed variants of
+        the extension are accepted as well.
     directory : Optional[str]
         A string representing a path to a directory, inside of which the path
         should lead to.
@@ -116,5 +125,55 @@ def prompt_dictionary_type() -> Type[DictionaryEntry]:
     ).execute()
 
 
+def describe_catalog_entry(entry: CatalogEntry, width: int = 0) -> str:
+    "Describe a dictionary file from the catalog in one line."
+    return (
+        f"{entry.path.ljust(width)}  {entry.format:7}  "
+        f"{entry.language_a.name} → {entry.language_b.name}, {entry.entries} entries"
+    )
+
+
+def prompt_dictionary_file(message: str) -> tuple[str, Type[DictionaryEntry]]:
+    """Prompt a dictionary file and detect its type.
+
+    Lists dictionaries from the catalog of default directories along with
+    their metadata. If the user picks another file, its path is prompted and
+    the format is detected from the content of the file. The type of the
+    dictionary is prompted only if the format isn't recognized.
+
+    Parameters
+    ----------
+    message : str
+        A text to be printed before the prompt.
+
+    Returns
+    ----------
+    path : str
+        A string representing a path to the dictionary file.
+    T : A subclass of DictionaryEntry class
+        Type of entries of the dictionary.
+    """
+    catalog = load_catalog()
+    if catalog:
+        width = max(len(entry.path) for entry in catalog)
+        choices = [
+            Choice(
+                value=(entry.path, entry.entry_type),
+                name=describe_catalog_entry(entry, width),
+            )
+            for entry in catalog
+        ]
+        choices.append(Choice(value=None, name="Another file..."))
+        picked = inquirer.select(message=message, choices=choices).execute()
+        if picked is not None:
+            return picked
+
+    path = prompt_filepath(message=message, is_file=True)
+    dictionary_entry_type = detect_entry_type(path)
+    if dictionary_entry_type is None:
+        dictionary_entry_type = prompt_dictionary_type()
+    return path, dictionary_entry_type
+
+
 if __name__ == "__main__":
     print(prompt_filepath("> ", extension=".txt", is_file=True))
@@ -3,4 +3,5 @@ from practice_turkish.languages.languages import (
     prompt_language,
     PrompterInTheLanguage,
     prompt_way_of_translation,
+    alphabet,
 )
@@ -0,0 +1,278 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from itertools import product
+from random import Random
+from typing import Iterable, Iterator, Optional
+
+from practice_turkish.languages.morphology import (
+    HARMONY_CLASSES,
+    VOWELS,
+    end_kind,
+    harmony_class,
+    lowercase,
+    realize,
+)
+
+ENDS = ("vowel", "voiced", "voiceless")
+
+# Placeholder of the aorist suffix, which is "(A)r" or "(I)r" depending on
+# the verb.
+AORIST = "*r"
+WIDE_AORIST = "(A)r"
+NARROW_AORIST = "(I)r"
+
+# Monosyllabic verbs taking the narrow aorist, e.g. "gelir", unlike "yapar".
+NARROW_AORIST_VERBS = frozenset(
+    "al bil bul dur gel gör kal ol öl san var vur ver".split()
+)
+# Verbs softening the final "t" before vowels, e.g. "gidiyor".
+SOFTENING_VERBS = frozenset(["git", "et", "tat", "güt"])
+softened = {"p": "b", "ç": "c", "t": "d", "k": "ğ"}
+
+
+class PartOfSpeech(str, Enum):
+    """An enum used to represent parts of speech inflected in drills."""
+
+    NOUN = "NOUN"
+    VERB = "VERB"
+
+
+@dataclass(frozen=True)
+class Form:
+    """A class used to represent an inflected form drilled.
+
+    Attributes
+    ----------
+    name : str
+        The name shown to the user, e.g. "plural, locative".
+    part_of_speech : PartOfSpeech
+        The part of speech the form is made of.
+    chain : tuple[str, ...]
+        Suffix templates, see `realize`.
+    """
+
+    name: str
+    part_of_speech: PartOfSpeech
+    chain: tuple[str, ...]
+
+
+NOUN, VERB = PartOfSpeech.NOUN, PartOfSpeech.VERB
+forms = [
+    Form("plural", NOUN, ("lAr",)),
+    Form("accusative", NOUN, ("(y)I",)),
+    Form("dative", NOUN, ("(y)A",)),
+    Form("locative", NOUN, ("DA",)),
+    Form("ablative", NOUN, ("DAn",)),
+    Form("genitive", NOUN, ("(n)In",)),
+    Form("instrumental", NOUN, ("(y)lA",)),
+    Form("my", NOUN, ("(I)m",)),
+    Form("your", NOUN, ("(I)n",)),
+    Form("his/her", NOUN, ("(s)I",)),
+    Form("our", NOUN, ("(I)mIz",)),
+    Form("your (plural)", NOUN, ("(I)nIz",)),
+    Form("their", NOUN, ("lArI",)),
+    Form("plural, locative", NOUN, ("lAr", "DA")),
+    Form("plural, ablative", NOUN, ("lAr", "DAn")),
+    Form("my, dative", NOUN, ("(I)m", "(y)A")),
+    Form("his/her, locative", NOUN, ("(s)I", "nDA")),
+    Form("our, ablative", NOUN, ("(I)mIz", "DAn")),
+    Form("present, I", VERB, ("~Iyor", "(y)Im")),
+    Form("present, they", VERB, ("~Iyor", "lAr")),
+    Form("past, I", VERB, ("DI", "m")),
+    Form("past, you", VERB, ("DI", "n")),
+    Form("past, we", VERB, ("DI", "k")),
+    Form("reported past, he/she", VERB, ("mIş",)),
+    Form("future, I", VERB, ("(y)AcAk", "(y)Im")),
+    Form("future, you (plural)", VERB, ("(y)AcAk", "sInIz")),
+    Form("aorist, I", VERB, (AORIST, "(y)Im")),
+    Form("aorist, he/she", VERB, (AORIST,)),
+    Form("negative present, I", VERB, ("mA", "~Iyor", "(y)Im")),
+    Form("negative past, he/she", VERB, ("mA", "DI")),
+    Form("necessity, I", VERB, ("mAlI", "(y)Im")),
+    Form("conditional, we", VERB, ("sA", "k")),
+    Form("imperative, you (plural)", VERB, ("(y)In",)),
+    Form("let's", VERB, ("(y)AlIm",)),
+]
+
+
+@lru_cache(maxsize=None)
+def suffix_table() -> dict[tuple[str, ...], tuple[tuple[str, bool], ...]]:
+    """Spellings of suffixes of each form, computed once.
+
+    Returns
+    ----------
+    table : dict[tuple[str, ...], tuple[tuple[str, bool], ...]]
+        For each chain of suffix templates, the result of `realize` after
+        stems of each harmony class and kind of the last letter, indexed by
+        `context`. Chains with the aorist are spelled with both aorists.
+    """
+    chains = set()
+    for form in forms:
+        for aorist in (WIDE_AORIST, NARROW_AORIST):
+            chains.add(tuple(aorist if t == AORIST else t for t in form.chain))
+    return {
+        chain: tuple(
+            realize(chain, vowel_class, end)
+            for vowel_class, end in product(HARMONY_CLASSES, ENDS)
+        )
+        for chain in chains
+    }
+
+
+def context(stem: str) -> int:
+    "The index of the harmony class and the kind of the last letter of a stem."
+    return HARMONY_CLASSES.index(harmony_class(stem)) * len(ENDS) + ENDS.index(
+        end_kind(stem)
+    )
+
+
+@dataclass
+class InflectionTable:
+    """A class used to represent precomputed forms of a Turkish word.
+
+    The stem, its harmony class and the suffixes following it are looked up
+    once, when the table is built, so drawing and checking forms take a
+    dictionary lookup.
+
+    Attributes
+    ----------
+    word : str
+        The word as written in the dictionary, e.g. "ev" or "gitmek".
+    part_of_speech : PartOfSpeech
+        VERB, if the word is an infinitive, NOUN otherwise.
+    forms : dict[str, str]
+        Inflected words by names of their forms, e.g. "evlerde" for
+        "plural, locative".
+
+    Methods
+    ----------
+    @classmethod
+    def build(cls, word: str) -> Optional[InflectionTable]
+        Inflect a word in each form of its part of speech.
+
+    def check(self, name: str, answer: str) -> bool
+        Check an answer.
+    """
+
+    word: str
+    part_of_speech: PartOfSpeech
+    forms: dict[str, str]
+
+    @classmethod
+    def build(cls, word: str) -> Optional["InflectionTable"]:
+        """Inflect a word in each form of its part of speech.
+
+        Only the last word of a phrase is inflected, e.g. "yardım etmek"
+        gives "yardım ediyorum". Irregular words are inflected as regular
+        ones, e.g. "demek" gives "deyiyorum" rather than "diyorum".
+
+        Parameters
+        ----------
+        word : str
+            A Turkish word or phrase.
+
+        Returns
+        ----------
+        table : Optional[InflectionTable]
+            The table, None if the last word has no vowels or isn't made of
+            letters.
+        """
+        words = lowercase(word).split()
+        if not words:
+            return None
+        head = "".join(w + " " for w in words[:-1])
+        stem = words[-1]
+        part_of_speech = NOUN
+        if stem.endswith(("mak", "mek")) and len(stem) > 3:
+            stem = stem[:-3]
+            part_of_speech = VERB
+        if not stem.isalpha() or not harmony_class(stem):
+            return None
+
+        if part_of_speech is VERB:
+            soft = stem[:-1] + "d" if stem in SOFTENING_VERBS else stem
+            n_vowels = sum(letter in VOWELS for letter in stem)
+            narrow = n_vowels > 1 or stem in NARROW_AORIST_VERBS
+            aorist = NARROW_AORIST if narrow else WIDE_AORIST
+        else:
+            soft = stem
+            if stem.endswith("nk"):
+                soft = stem[:-1] + "g"
+            elif sum(letter in VOWELS for letter in stem) > 1 and stem[-1] in "pçk":
+                soft = stem[:-1] + softened[stem[-1]]
+            aorist = WIDE_AORIST
+
+        table = suffix_table()
+        i = context(stem)
+        # A suffix dropping the last vowel of the stem harmonizes with the
+        # vowel before it, e.g. "söylüyor".
+        j = HARMONY_CLASSES.index(harmony_class(stem[:-1]) or harmony_class(stem))
+        j *= len(ENDS)
+        inflected = {}
+        for form in forms:
+            if form.part_of_speech is not part_of_speech:
+                continue
+            chain = tuple(aorist if t == AORIST else t for t in form.chain)
+            suffix, dropped = table[chain][i]
+            if dropped:
+                suffix, _ = table[chain][j]
+                base = stem[:-1]
+            elif suffix[0] in VOWELS:
+                base = soft
+            else:
+                base = stem
+            inflected[form.name] = head + base + suffix
+        return cls(word, part_of_speech, inflected)
+
+    def check(self, name: str, answer: str) -> bool:
+        "Check if an answer is the word in the form, ignoring case and spaces."
+        return lowercase(" ".join(answer.split())) == self.forms[name]
+
+
+def build_tables(words: Iterable[str]) -> list[InflectionTable]:
+    "Inflection tables of distinct words, skipping ones which can't be inflected."
+    tables = (InflectionTable.build(word) for word in dict.fromkeys(words))
+    return [table for table in tables if table is not None]
+
+
+def drill(
+    tables: list[InflectionTable], rng: Optional[Random] = None
+) -> Iterator[tuple[InflectionTable, str]]:
+    """Generator drawing random words and forms endlessly.
+
+    Parameters
+    ----------
+    tables : list[InflectionTable]
+        Tables of drilled words, not empty.
+    rng : Optional[Random]
+        The random number generator, a new one by default.
+
+    Yields
+    ----------
+    table : InflectionTable
+        The table of the word.
+    name : str
+        The name of the form, the right answer is `table.forms[name]`.
+    """
+    rng = Random() if rng is None else rng
+    names = [list(table.forms) for table in tables]
+    while True:
+        i = rng.randrange(len(tables))
+        yield tables[i], rng.choice(names[i])
+
+
+def check_answers(answers: Iterable[tuple[InflectionTable, str, str]]) -> list[bool]:
+    """Check many answers at once.
+
+    Parameters
+    ----------
+    answers : Iterable[tuple[InflectionTable, str, str]]
+        Tables of words, names of forms and answers.
+
+    Returns
+    ----------
+    verdicts : list[bool]
+        True for each right answer.
+    """
+    return [table.check(name, answer) for table, name, answer in answers]
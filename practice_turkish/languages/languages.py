@@ -4,9 +4,9 @@ from typing import Any
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 
-from practice_turkish.languages.turkishinput import prompt_turkish
-from practice_turkish.languages.russianinput import prompt_russian
-from practice_turkish.languages.englishinput import prompt_english
+from practice_turkish.languages.turkishinput import prompt_turkish, TurkishValidator
+from practice_turkish.languages.russianinput import prompt_russian, RussianValidator
+from practice_turkish.languages.englishinput import prompt_english, EnglishValidator
 
 
 class Language(str, Enum):
@@ -52,6 +52,30 @@ language_map = {
     Language.english: "English",
 }
 
+validator_map = {
+    Language.turkish: TurkishValidator,
+    Language.russian: RussianValidator,
+    Language.english: EnglishValidator,
+}
+
+
+def alphabet(language: Language, additional_symbols: str = "") -> frozenset[str]:
+    """Symbols the user is allowed to type in when answering in the language.
+
+    Parameters
+    ----------
+    language : Language
+        A value of `Language` enum.
+    additional_symbols : str
+        Symbols allowed in addition to the alphabet of the language.
+
+    Returns
+    ----------
+    symbols : frozenset[str]
+        Valid symbols of the validator of the language and additional symbols.
+    """
+    return frozenset(validator_map[language].valid_symbols | set(additional_symbols))
+
 
 def prompt_language(message: str) -> Language:
     """Prompt a language from the user by picking from values of `Language` enum.
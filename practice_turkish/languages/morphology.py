@@ -0,0 +1,311 @@
+from functools import lru_cache
+from itertools import product
+from typing import Iterable, Iterator
+
+VOWELS = "aıoueiöü"
+BACK_VOWELS = "aıou"
+FRONT_VOWELS = "eiöü"
+VOICELESS = "fstkçşhp"
+
+# Harmony classes are named by their wide vowel: the last vowel of a word
+# decides whether the archiphoneme A is "a" or "e", and I is "ı", "u", "i"
+# or "ü".
+HARMONY_CLASSES = "aoeö"
+vowel_classes = {
+    "a": "a",
+    "ı": "a",
+    "â": "a",
+    "o": "o",
+    "u": "o",
+    "e": "e",
+    "i": "e",
+    "î": "e",
+    "ö": "ö",
+    "ü": "ö",
+}
+wide_vowels = {"a": "a", "o": "a", "e": "e", "ö": "e"}
+narrow_vowels = {"a": "ı", "o": "u", "e": "i", "ö": "ü"}
+
+# Consonants softened before vowels and the ones they are softened from.
+unmutated = {"b": "p", "c": "ç", "d": "t", "ğ": "k", "g": "k"}
+
+MIN_STEM_LENGTH = 2
+
+# Suffix templates. "A" and "I" are vowels following vowel harmony, "D" and
+# "C" are "t" and "ç" after voiceless consonants, "d" and "c" otherwise.
+# A letter in parenthesis is a buffer: a consonant is kept only after a
+# vowel, a vowel only after a consonant. "~" drops the preceding vowel.
+PLURAL = ["lAr"]
+POSSESSIVES = ["(I)m", "(I)n", "(I)mIz", "(I)nIz"]
+THIRD_POSSESSIVES = ["(s)I", "lArI"]
+CASES = ["(y)I", "(y)A", "DA", "DAn", "(n)In", "(y)lA"]
+# Cases after possessives of the third person take the pronominal "n".
+PRONOMINAL_CASES = ["nI", "nA", "nDA", "nDAn", "nIn", "(y)lA"]
+COPULAS = ["(y)Im", "sIn", "(y)Iz", "sInIz", "lAr", "DIr"]
+
+NEGATIVE = ["mA"]
+TENSES = ["~Iyor", "mIş", "(y)AcAk", "(A)r", "(I)r", "mAlI"]
+PERSONS = ["(y)Im", "sIn", "(y)Iz", "sInIz", "lAr"]
+PAST = ["DI", "sA"]
+PAST_PERSONS = ["m", "n", "k", "nIz", "lAr"]
+NEGATIVE_AORISTS = ["mAz", "mAm", "mAyIz", "mAzsIn", "mAzsInIz", "mAzlAr"]
+MOODS = ["(y)In", "(y)InIz", "sIn", "sInlAr", "(y)AyIm", "(y)AlIm"]
+VERBAL_FORMS = ["mAk", "mAktA", "(y)Ip", "(y)ArAk", "(y)IncA", "(y)An"]
+
+
+def harmony_class(word: str) -> str:
+    "The harmony class of the last vowel of the word, empty if there is none."
+    for letter in reversed(word):
+        vowel_class = vowel_classes.get(letter)
+        if vowel_class is not None:
+            return vowel_class
+    return ""
+
+
+def end_kind(word: str) -> str:
+    "'vowel', 'voiceless' or 'voiced', depending on the last letter of the word."
+    if word[-1] in VOWELS:
+        return "vowel"
+    return "voiceless" if word[-1] in VOICELESS else "voiced"
+
+
+def realize(chain: Iterable[str], vowel_class: str, end: str) -> tuple[str, bool]:
+    """Spell a chain of suffix templates after a stem.
+
+    Parameters
+    ----------
+    chain : Iterable[str]
+        Suffix templates in the order they follow the stem.
+    vowel_class : str
+        The harmony class of the last vowel of the stem.
+    end : str
+        The kind of the last letter of the stem, see `end_kind`.
+
+    Returns
+    ----------
+    suffix : str
+        The spelled suffixes.
+    dropped : bool
+        True, if the last vowel of the stem is dropped, e.g. "başla" and
+        "~Iyor" give "ıyor" to be written after "başl".
+    """
+    letters: list[str] = []
+    dropped = False
+    for template in chain:
+        if template.startswith("~"):
+            template = template[1:]
+            if letters and letters[-1] in VOWELS:
+                letters.pop()
+            elif not letters and end == "vowel":
+                dropped = True
+        start = len(letters)
+        i = 0
+        while i < len(template):
+            symbol = template[i]
+            optional = symbol == "("
+            if optional:
+                symbol = template[i + 1]
+                i += 3
+            else:
+                i += 1
+            current = _current(letters, vowel_class, end, dropped)
+            if symbol == "A":
+                symbol = wide_vowels[current[0]]
+            elif symbol == "I":
+                symbol = narrow_vowels[current[0]]
+            elif symbol == "D":
+                symbol = "t" if current[1] == "voiceless" else "d"
+            elif symbol == "C":
+                symbol = "ç" if current[1] == "voiceless" else "c"
+            if optional and (symbol in VOWELS) == (current[1] == "vowel"):
+                continue
+            if len(letters) == start and symbol in VOWELS and start > 1:
+                # "k" closing a suffix of several letters softens before a vowel.
+                if letters[-1] == "k":
+                    letters[-1] = "ğ"
+            letters.append(symbol)
+    return "".join(letters), dropped
+
+
+def _current(
+    letters: list[str], vowel_class: str, end: str, dropped: bool
+) -> tuple[str, str]:
+    "The harmony class and the kind of the last letter written so far."
+    suffix = "".join(letters)
+    current_class = harmony_class(suffix) or vowel_class
+    if suffix:
+        return current_class, end_kind(suffix)
+    return current_class, "voiced" if dropped else end
+
+
+def noun_chains() -> Iterator[tuple[str, ...]]:
+    "Generator yielding chains of suffixes of nouns."
+    for plural in [(), *[(s,) for s in PLURAL]]:
+        possessives: list[tuple[tuple[str, ...], list[str]]] = [((), CASES)]
+        possessives += [((s,), CASES) for s in POSSESSIVES]
+        possessives += [((s,), PRONOMINAL_CASES) for s in THIRD_POSSESSIVES]
+        for possessive, cases in possessives:
+            for case in [(), *[(s,) for s in cases]]:
+                for copula in [(), *[(s,) for s in COPULAS]]:
+                    yield plural + possessive + case + copula
+
+
+def verb_chains() -> Iterator[tuple[str, ...]]:
+    "Generator yielding chains of suffixes of verbs."
+    for negative in [(), *[(s,) for s in NEGATIVE]]:
+        for tense in TENSES:
+            for person in [(), *[(s,) for s in PERSONS]]:
+                yield negative + (tense,) + person
+            for past, person in product(PAST, [(), *[(s,) for s in PAST_PERSONS]]):
+                yield negative + (tense, past) + person
+        for past, person in product(PAST, [(), *[(s,) for s in PAST_PERSONS]]):
+            yield negative + (past,) + person
+        for mood in MOODS:
+            yield negative + (mood,)
+        for form in VERBAL_FORMS:
+            yield negative + (form,)
+    for aorist in NEGATIVE_AORISTS:
+        yield (aorist,)
+
+
+class SuffixAutomaton:
+    """A class used to strip Turkish inflectional suffixes off words.
+
+    Every chain of suffixes of nouns and verbs is spelled after stems of each
+    harmony class and each kind of the last letter, see `realize`, and the
+    spellings are compiled into one deterministic automaton reading words
+    from the end. Its accepting states keep harmony classes and kinds of
+    the last letter of stems the spelled suffix may follow, so a word is
+    stripped in one pass over its letters, and a stem is accepted only if
+    the suffix is spelled as the stem requires.
+
+    Stripping is a heuristic: a word ending like a suffix, e.g. "kalem" as
+    "kale" with a possessive, is stripped too.
+
+    Methods
+    ----------
+    def stems(self, word: str) -> set[str]
+        Possible stems of a word, the word itself included.
+    """
+
+    def __init__(self, chains: Iterable[tuple[str, ...]]) -> None:
+        self._edges: list[dict[str, int]] = [{}]
+        self._accepted: dict[int, set[tuple[str, str, bool]]] = {}
+        for chain in set(chains):
+            for vowel_class, end in product(
+                HARMONY_CLASSES, ["vowel", "voiced", "voiceless"]
+            ):
+                suffix, dropped = realize(chain, vowel_class, end)
+                if not suffix:
+                    continue
+                ends = ["voiced", "voiceless"] if dropped else [end]
+                state = self._add(suffix)
+                accepted = self._accepted.setdefault(state, set())
+                accepted.update((vowel_class, e, dropped) for e in ends)
+
+    def _add(self, suffix: str) -> int:
+        "Add the path reading the suffix from the end, return its last state."
+        state = 0
+        for letter in reversed(suffix):
+            edges = self._edges[state]
+            following = edges.get(letter)
+            if following is None:
+                following = edges[letter] = len(self._edges)
+                self._edges.append({})
+            state = following
+        return state
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def stems(self, word: str) -> set[str]:
+        """Possible stems of a word.
+
+        Parameters
+        ----------
+        word : str
+            A lowercase Turkish word.
+
+        Returns
+        ----------
+        stems : set[str]
+            The word, and each stem the word is the stem followed by
+            suffixes of, with softened final consonants restored, e.g.
+            "kitab" and "kitap" for "kitabı".
+        """
+        stems = {word}
+        state = 0
+        for i in range(len(word) - 1, MIN_STEM_LENGTH - 1, -1):
+            following = self._edges[state].get(word[i])
+            if following is None:
+                break
+            state = following
+            accepted = self._accepted.get(state)
+            if accepted is None:
+                continue
+            stem = word[:i]
+            vowel_class = harmony_class(stem)
+            if not vowel_class:
+                continue
+            end = end_kind(stem)
+            if (vowel_class, end, False) in accepted:
+                stems.add(stem)
+                if stem[-1] in unmutated:
+                    stems.add(stem[:-1] + unmutated[stem[-1]])
+            if (vowel_class, end, True) in accepted:
+                vowels = BACK_VOWELS if vowel_class in "ao" else FRONT_VOWELS
+                stems.update(stem + vowel for vowel in vowels)
+        return stems
+
+
+@lru_cache(maxsize=None)
+def suffix_automaton() -> SuffixAutomaton:
+    "The automaton stripping suffixes of nouns and verbs, compiled on first use."
+    return SuffixAutomaton([*noun_chains(), *verb_chains()])
+
+
+def lowercase(word: str) -> str:
+    "Lowercase a Turkish word, keeping dotted and dotless i apart."
+    return word.replace("I", "ı").replace("İ", "i").lower()
+
+
+@lru_cache(maxsize=65_536)
+def lemmas(phrase: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Split a phrase into its words before the last one and stems of the last.
+
+    Returns
+    ----------
+    head : tuple[str, ...]
+        Lowercase words before the last one.
+    stems : frozenset[str]
+        Possible stems of the last word, see `SuffixAutomaton.stems`.
+    """
+    words = lowercase(phrase).split()
+    if not words:
+        return (), frozenset()
+    return tuple(words[:-1]), frozenset(suffix_automaton().stems(words[-1]))
+
+
+def same_lemma(answer: str, word: str) -> bool:
+    """Check if an answer is the word in another form.
+
+    Phrases are compared word by word: the last words may differ by
+    inflectional suffixes, other words must be the same.
+
+    Parameters
+    ----------
+    answer : str
+        A Turkish word or phrase, typically typed in by the user.
+    word : str
+        A Turkish word or phrase, typically from the dictionary, e.g. "ev" or
+        "gitmek".
+
+    Returns
+    ----------
+    x : bool
+        True, if the answer and the word have a common stem, e.g. "evlerde"
+        and "ev", or "gidiyorum" and "gitmek".
+    """
+    head_a, stems_a = lemmas(answer)
+    head_b, stems_b = lemmas(word)
+    return head_a == head_b and not stems_a.isdisjoint(stems_b)
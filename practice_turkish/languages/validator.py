@@ -16,7 +16,7 @@ class SymbolValidator(Validator, ABC):
 
     def __init__(self, additional_symbols: str = "") -> None:
         super().__init__()
-        self.valid_symbols |= set(list(additional_symbols))
+        self.valid_symbols = self.valid_symbols | set(additional_symbols)
 
     def validate(self, document: Document) -> None:
         """Check if all typed in symbols are permissible.
@@ -0,0 +1,67 @@
+from typing import Optional
+import time
+
+from rich import print
+from rich.markup import escape
+import typer
+
+from practice_turkish.dictionaries.catalog import default_directories
+from practice_turkish.dictionaries.lint import find_dictionary_files, lint_files
+
+
+def lint(
+    paths: Optional[list[str]] = typer.Argument(
+        None,
+        help="Dictionary files or directories, 'CSV' and 'turkrut' by default.",
+        show_default=False,
+    ),
+    processes: Optional[int] = typer.Option(
+        None, "--processes", help="Number of worker processes, all CPUs by default."
+    ),
+) -> None:
+    """Check dictionary files and report every problem found.
+
+    Reports malformed lines, unknown languages, empty alternatives, unbalanced
+    parentheses, duplicated entries and words containing symbols which can't
+    be typed in their language, each with the file, line and column. Files are
+    checked in parallel. Exits with code 1 if any problem is found.
+
+    Parameters
+    ----------
+    paths : Optional[list[str]]
+        Dictionary files or directories with them, default directories of all
+        formats if not given.
+    processes : Optional[int]
+        The number of worker processes, the number of CPUs by default.
+    """
+    start = time.perf_counter()
+    files = find_dictionary_files(paths or default_directories())
+    n_problems = n_bad_files = 0
+    for _, problems in lint_files(files, processes):
+        if not problems:
+            continue
+        n_bad_files += 1
+        n_problems += len(problems)
+        for problem in problems:
+            print(
+                f"[bold]{escape(problem.path)}[/bold]:{problem.line}:{problem.column}: "
+                f"[red]{problem.kind.name}[/red] {escape(problem.message)}"
+            )
+    elapsed = time.perf_counter() - start
+
+    color = "red" if n_problems else "green"
+    print(
+        f"Checked {len(files)} files in {elapsed:.2f} s, found "
+        f"[{color}]{n_problems}[/{color}] problems in {n_bad_files} files."
+    )
+    if n_problems:
+        raise typer.Exit(code=1)
+
+
+def main() -> None:
+    """If open as a script, run lint function."""
+    typer.run(lint)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from InquirerPy.base.control import Choice
 
 from practice_turkish.languages import Language, PrompterInTheLanguage, prompt_language
 from practice_turkish.dictionaries import Dictionary, CSVDictionaryEntry
+from practice_turkish.dictionaries.duplicates import Duplicate, DuplicateKind
 from practice_turkish.filepath import prompt_filepath
 from practice_turkish.dictionaries.parse import inside_parenthesis
 
@@ -27,6 +28,14 @@ class WritingMode(str, Enum):
     OVERWRITE = "OVERWRITE"
 
 
+class DuplicateAction(str, Enum):
+    """Enum used to represent what to do with a duplicated entry."""
+
+    MERGE = "MERGE"
+    ADD = "ADD"
+    SKIP = "SKIP"
+
+
 prompt_text = Template(
     """Type in the word or words in [green]$language[/green].
 Text inside parenthesis would be considered as a hint.
@@ -199,19 +208,71 @@ def prompt_dictionary_entry(
     return CSVDictionaryEntry(words_a, words_b, language_a, language_b, hint_a, hint_b)
 
 
+def prompt_duplicate_action(
+    entry: CSVDictionaryEntry, duplicate: Duplicate[CSVDictionaryEntry]
+) -> DuplicateAction:
+    """Prompt the user to choose what to do with an entry duplicating another one.
+
+    Parameters
+    ----------
+    entry : CSVDictionaryEntry
+        The entry typed in by the user.
+    duplicate : Duplicate[CSVDictionaryEntry]
+        The existing entry duplicated by the new one.
+
+    Returns
+    ----------
+    action : DuplicateAction
+        DuplicateAction.MERGE, DuplicateAction.ADD or DuplicateAction.SKIP.
+    """
+    existing = duplicate.entry
+    kind = "the same as" if duplicate.kind == DuplicateKind.EXACT else "overlaps with"
+    print(
+        f"[yellow]{entry.query_a} — {entry.query_b}[/yellow] {kind} "
+        f"[green]{existing.query_a} — {existing.query_b}[/green]."
+    )
+    return inquirer.select(
+        message="The entry is already in the dictionary. Do you want to",
+        choices=[
+            Choice(
+                value=DuplicateAction.MERGE,
+                name="Merge alternatives and hints into the existing entry.",
+            ),
+            Choice(value=DuplicateAction.SKIP, name="Skip the new entry."),
+            Choice(value=DuplicateAction.ADD, name="Add it anyway."),
+        ],
+    ).execute()
+
+
 def prompt_dictionary(dictionary: CSVDict) -> None:
     """Prompts user to type in all dictionary entries.
 
+    Each entry is checked against the index of the dictionary. If it
+    duplicates an existing entry, the user is prompted to merge, skip or add
+    it anyway.
+
     Parameters
     ----------
     dictionary: Dictionary[CSVDictionaryEntry]
         A dictionary to fill in with entries.
     """
+    if dictionary.index is None:
+        dictionary.build_index()
     while True:
         entry = prompt_dictionary_entry(dictionary.language_a, dictionary.language_b)
         if entry is None:
             return
-        dictionary.insert(entry)
+        duplicate = dictionary.find_duplicate(entry)
+        if duplicate is None:
+            dictionary.insert(entry)
+            continue
+        match prompt_duplicate_action(entry, duplicate):
+            case DuplicateAction.MERGE:
+                dictionary.insert(entry, merge=True)
+            case DuplicateAction.ADD:
+                dictionary.insert(entry)
+            case DuplicateAction.SKIP:
+                pass
 
 
 def write_dictionary(dictionary: CSVDict, path: str) -> None:
@@ -232,8 +293,8 @@ def write_dictionary(dictionary: CSVDict, path: str) -> None:
         for item in sorted(dictionary):
             writer.writerow(
                 {
-                    la.name: "/".join(item.words_a),
-                    lb.name: "/".join(item.words_b),
+                    la.name: "/".join(item._words_a),
+                    lb.name: "/".join(item._words_b),
                     f"{la} hint": item._hint_a,
                     f"{lb} hint": item._hint_b,
                 }
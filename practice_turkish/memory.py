@@ -0,0 +1,168 @@
+from typing import Any, Optional
+import json
+import platform
+
+from rich import print
+from rich.markup import escape
+from rich.table import Table
+import typer
+
+from practice_turkish.cache import cache_path
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.catalog import detect_entry_type
+from practice_turkish.dictionaries.memory import (
+    MemoryReport,
+    SizeWalker,
+    report_backends,
+    trace,
+)
+from practice_turkish.server import SessionStore
+
+
+def report_sessions(
+    dictionary: Dictionary[DictionaryEntry], n_sessions: int, n_questions: int
+) -> dict[str, Any]:
+    """Account memory taken by server sessions practicing a dictionary.
+
+    Parameters
+    ----------
+    dictionary : Dictionary
+        The practiced dictionary, shared by the sessions.
+    n_sessions : int
+        The number of sessions started.
+    n_questions : int
+        The number of questions of each session.
+
+    Returns
+    ----------
+    report : dict[str, Any]
+        Memory held by the sessions according to `tracemalloc` and to a
+        `sys.getsizeof` walk skipping the shared dictionary, in total and
+        per session.
+    """
+    store = SessionStore()
+
+    def start() -> None:
+        for seed in range(n_sessions):
+            store.create(dictionary, True, n_questions, seed)
+
+    _, traced, peak, sites = trace(start)
+    walker = SizeWalker()
+    walker.seen.add(id(dictionary))
+    walked = walker.size(store.sessions)
+    per_session = max(n_sessions, 1)
+    return {
+        "sessions": n_sessions,
+        "questions": n_questions,
+        "traced_bytes": traced,
+        "peak_bytes": peak,
+        "walked_bytes": walked,
+        "traced_bytes_per_session": round(traced / per_session, 1),
+        "walked_bytes_per_session": round(walked / per_session, 1),
+        "sites": [{"site": site, "bytes": size} for site, size in sites],
+    }
+
+
+def print_reports(reports: list[MemoryReport]) -> None:
+    "Print a table of components of each backend in bytes per entry."
+    table = Table(title="Bytes per entry")
+    table.add_column("component", justify="left")
+    for report in reports:
+        table.add_column(report.backend, justify="right")
+    components = list(
+        dict.fromkeys(name for report in reports for name in report.components)
+    )
+    for name in components:
+        cells = [
+            f"{report.per_entry(report.components[name]):.1f}"
+            if name in report.components
+            else "-"
+            for report in reports
+        ]
+        table.add_row(name, *cells)
+    table.add_row(
+        "[bold]traced[/bold]",
+        *[
+            f"[bold]{report.per_entry(report.traced_bytes):.1f}[/bold]"
+            for report in reports
+        ],
+    )
+    table.add_row(
+        "peak",
+        *[f"{report.per_entry(report.peak_bytes):.1f}" for report in reports],
+    )
+    print(table)
+
+
+def memory(
+    path: str = typer.Argument(..., help="The dictionary file to measure."),
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="The JSON report, 'memory.json' in the cache directory by default.",
+        show_default=False,
+    ),
+    sessions: int = typer.Option(
+        1_000, "--sessions", help="Number of server sessions measured."
+    ),
+    questions: int = typer.Option(
+        20, "--questions", help="Number of questions of each session."
+    ),
+) -> None:
+    """Report memory taken by a dictionary loaded each way and by sessions.
+
+    The dictionary is loaded as a list of entries, as a watched dictionary
+    and into shared memory. For each way the memory held after loading and
+    the peak while loading are traced by `tracemalloc`, and the entries,
+    their words, hints and strings, the string pool and indexes are sized
+    by `sys.getsizeof` walks. Then server sessions practicing the dictionary
+    are started and measured. Sizes per entry are printed, the full report
+    with lines of code allocating the most is written as JSON.
+
+    Parameters
+    ----------
+    path : str
+        A string representing a path to the dictionary file.
+    output : Optional[str]
+        A path to write the JSON report to.
+    sessions : int
+        The number of server sessions measured.
+    questions : int
+        The number of questions of each session.
+    """
+    type = detect_entry_type(path)
+    if type is None:
+        print(f"[red]The format of {escape(path)} isn't recognized.[/red]")
+        raise typer.Exit(code=2)
+
+    reports = report_backends(path, type)
+    print_reports(reports)
+
+    dictionary = Dictionary.from_file(path, type)
+    session_report = report_sessions(dictionary, sessions, questions)
+    print(
+        f"{sessions} sessions of {questions} questions take "
+        f"{session_report['traced_bytes_per_session']:.0f} bytes per session."
+    )
+
+    if output is None:
+        output = cache_path("memory.json")
+    report = {
+        "path": path,
+        "python": platform.python_version(),
+        "backends": [report.to_json() for report in reports],
+        "sessions": session_report,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"The report is written to {escape(output)}.")
+
+
+def main() -> None:
+    """If open as a script, run memory function."""
+    typer.run(memory)
+
+
+if __name__ == "__main__":
+    main()
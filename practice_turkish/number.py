@@ -1,14 +1,20 @@
 import random
 from enum import Enum
-from functools import partial
-from typing import Optional, Callable
+from functools import lru_cache, partial
+from typing import Iterable, Optional, Callable
 
-from rich import print
 import typer
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 
 from practice_turkish.languages import Language, PrompterInTheLanguage
+from practice_turkish.languages.morphology import (
+    VOWELS,
+    end_kind,
+    harmony_class,
+    realize,
+)
+from practice_turkish.output import output
 
 
 class Difficulty(str, Enum):
@@ -18,8 +24,21 @@ class Difficulty(str, Enum):
     TENS = "TENS"
     BASIC = "BASIC"
     ADVANCED = "ADVANCED"
+    ORDINALS = "ORDINALS"
+    DISTRIBUTIVES = "DISTRIBUTIVES"
+    FRACTIONS = "FRACTIONS"
+    DECIMALS = "DECIMALS"
+    PERCENTAGES = "PERCENTAGES"
 
 
+# Difficulties drawing whole numbers, spelled by `spell_number`.
+cardinal_difficulties = (
+    Difficulty.DIGITS,
+    Difficulty.TENS,
+    Difficulty.BASIC,
+    Difficulty.ADVANCED,
+)
+
 TEN = 10
 ONE_HUNDRED = 100
 ONE_THOUSAND = 1_000
@@ -59,6 +78,17 @@ more = {
     ONE_BILLION: "milyar",
 }
 
+# Suffixes of numerals, see `realize`.
+ORDINAL = "(I)ncI"
+DISTRIBUTIVE = "(ş)Ar"
+LOCATIVE = "DA"
+
+COMMA = "virgül"
+PERCENT = "yüzde"
+
+# Numerals softening the final consonant before vowels, e.g. "dördüncü".
+softened_numerals = {"dört": "dörd"}
+
 
 def spell_small_number(number: int, dismiss_one: bool = False) -> str:
     """Spell a positive integer number lesser than 1000 in turkish.
@@ -94,12 +124,18 @@ def spell_small_number(number: int, dismiss_one: bool = False) -> str:
             hundred = digits[n_hundreds] + " yüz"
     ten = tens[n_tens * 10]
     one = digits[n_ones] if n_ones > 0 else ""
-    return f"{hundred} {ten} {one}".strip()
+    return " ".join(part for part in (hundred, ten, one) if part)
+
+
+# Spellings of numbers lesser than 1000, looked up by `spell_number`.
+small_spellings = tuple(spell_small_number(n) for n in range(ONE_THOUSAND))
 
 
 def spell_number(number: int) -> str:
     """Spell a positive integer number lesser than 10^12 in turkish.
 
+    Spellings of groups of three digits are looked up in `small_spellings`.
+
     Parameters
     ----------
     number : int
@@ -122,16 +158,337 @@ def spell_number(number: int) -> str:
 
     parts = []
     if n_billions:
-        parts.append(f"{spell_small_number(n_billions)} milyar".strip())
+        parts.append(f"{small_spellings[n_billions]} milyar")
 
     if n_millions:
-        parts.append(f"{spell_small_number(n_millions)} milyon".strip())
+        parts.append(f"{small_spellings[n_millions]} milyon")
 
     if n_thousands:
-        parts.append(f"{spell_small_number(n_thousands, True)} bin".strip())
+        parts.append(
+            "bin" if n_thousands == 1 else f"{small_spellings[n_thousands]} bin"
+        )
+
+    if reminder:
+        parts.append(small_spellings[reminder])
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=None)
+def inflect_numeral(word: str, suffix: str) -> str:
+    """Add a suffix to a numeral following vowel harmony.
+
+    Parameters
+    ----------
+    word : str
+        A numeral of one word, e.g. "dört".
+    suffix : str
+        A suffix template, e.g. `ORDINAL`.
+
+    Returns
+    ----------
+    inflected : str
+        The numeral with the suffix, e.g. "dördüncü".
+    """
+    spelled, _ = realize((suffix,), harmony_class(word), end_kind(word))
+    if spelled[0] in VOWELS:
+        word = softened_numerals.get(word, word)
+    return word + spelled
+
+
+def inflect_last(spelling: str, suffix: str) -> str:
+    "Add a suffix to the last word of a spelled number."
+    head, separator, last = spelling.rpartition(" ")
+    return head + separator + inflect_numeral(last, suffix)
+
+
+@lru_cache(maxsize=None)
+def numeral_words() -> dict[str, int]:
+    "Values of numerals of one word, e.g. 4 for 'dört' and 100 for 'yüz'."
+    return {word: value for value, word in (digits | tens | more).items() if word}
+
+
+@lru_cache(maxsize=None)
+def uninflected(suffix: str) -> dict[str, str]:
+    "Numerals of one word by their forms with the suffix."
+    return {inflect_numeral(word, suffix): word for word in numeral_words()}
+
+
+def spell_ordinal(number: int) -> str:
+    """Spell an ordinal number in turkish, e.g. "yirmi üçüncü" for 23.
+
+    Parameters
+    ----------
+    number : int
+        A positive integer number lesser than 10^12.
+
+    Returns
+    ----------
+    spelling : str
+        A line of text with spelling of the ordinal number.
+    """
+    return inflect_last(spell_number(number), ORDINAL)
+
+
+def spell_distributive(number: int) -> str:
+    """Spell a distributive number in turkish, e.g. "ikişer" for 2, "two each".
+
+    Parameters
+    ----------
+    number : int
+        A positive integer number lesser than 10^12.
+
+    Returns
+    ----------
+    spelling : str
+        A line of text with spelling of the distributive number.
+    """
+    return inflect_last(spell_number(number), DISTRIBUTIVE)
+
+
+def spell_fraction(numerator: int, denominator: int) -> str:
+    """Spell a fraction in turkish, e.g. "dörtte üç" for 3/4.
+
+    The denominator goes first in the locative case, followed by the
+    numerator.
+
+    Parameters
+    ----------
+    numerator : int
+        A non-negative integer number lesser than 10^12.
+    denominator : int
+        A positive integer number lesser than 10^12.
+
+    Returns
+    ----------
+    spelling : str
+        A line of text with spelling of the fraction.
+    """
+    if denominator == 0:
+        raise ValueError("Zero denominator")
+    over = inflect_last(spell_number(denominator), LOCATIVE)
+    return f"{over} {spell_number(numerator)}"
+
+
+def spell_decimal(number: str) -> str:
+    """Spell a decimal fraction in turkish, e.g. "üç virgül sıfır beş" for 3,05.
+
+    Digits after the comma are read as a number, each leading zero read
+    as "sıfır".
+
+    Parameters
+    ----------
+    number : str
+        A non-negative decimal fraction written with a comma, e.g. "3,05".
+        A number without a comma is spelled as an integer.
+
+    Returns
+    ----------
+    spelling : str
+        A line of text with spelling of the decimal fraction.
+    """
+    integer, comma, fraction = number.partition(",")
+    if not integer.isdigit() or (comma and not fraction.isdigit()):
+        raise ValueError(f"{number!r} isn't a decimal fraction.")
+    spelling = spell_number(int(integer))
+    if not comma:
+        return spelling
+    significant = fraction.lstrip("0")
+    zeros = [digits[0]] * (len(fraction) - len(significant))
+    if significant:
+        zeros.append(spell_number(int(significant)))
+    return f"{spelling} {COMMA} {' '.join(zeros)}"
+
+
+def spell_percentage(number: str) -> str:
+    """Spell a percentage in turkish, e.g. "yüzde kırk beş" for %45.
+
+    Parameters
+    ----------
+    number : str
+        The number of percents, an integer or a decimal fraction written
+        with a comma.
+
+    Returns
+    ----------
+    spelling : str
+        A line of text with spelling of the percentage.
+    """
+    return f"{PERCENT} {spell_decimal(number)}"
+
+
+def read_number(spelling: str) -> int:
+    """Read a number spelled in turkish, the inverse of `spell_number`.
+
+    Parameters
+    ----------
+    spelling : str
+        A line of text with spelling of a number.
+
+    Returns
+    ----------
+    number : int
+        The number.
+
+    Raises
+    ----------
+    ValueError
+        If a word isn't a numeral.
+    """
+    words = numeral_words()
+    total = current = 0
+    for word in spelling.split():
+        if word == digits[0]:
+            continue
+        value = words.get(word)
+        if value is None:
+            raise ValueError(f"{word!r} isn't a numeral.")
+        if value == ONE_HUNDRED:
+            current = (current or 1) * ONE_HUNDRED
+        elif value >= ONE_THOUSAND:
+            total += (current or 1) * value
+            current = 0
+        else:
+            current += value
+    return total + current
+
+
+def read_inflected(spelling: str, suffix: str) -> int:
+    "Read a number spelled with a suffix on its last word."
+    head, _, last = spelling.rpartition(" ")
+    word = uninflected(suffix).get(last)
+    if word is None:
+        raise ValueError(f"{last!r} isn't a numeral with the suffix {suffix}.")
+    return read_number(f"{head} {word}")
+
+
+def read_ordinal(spelling: str) -> int:
+    "Read an ordinal number spelled in turkish, the inverse of `spell_ordinal`."
+    return read_inflected(spelling, ORDINAL)
+
+
+def read_distributive(spelling: str) -> int:
+    "Read a distributive number, the inverse of `spell_distributive`."
+    return read_inflected(spelling, DISTRIBUTIVE)
+
+
+def read_fraction(spelling: str) -> tuple[int, int]:
+    "Read a fraction spelled in turkish, the inverse of `spell_fraction`."
+    words = spelling.split()
+    locatives = uninflected(LOCATIVE)
+    for i, word in enumerate(words):
+        if word in locatives:
+            denominator = read_inflected(" ".join(words[: i + 1]), LOCATIVE)
+            return read_number(" ".join(words[i + 1 :])), denominator
+    raise ValueError(f"{spelling!r} has no denominator.")
+
+
+def read_decimal(spelling: str) -> str:
+    "Read a decimal fraction spelled in turkish, the inverse of `spell_decimal`."
+    integer, comma, fraction = spelling.partition(f" {COMMA} ")
+    number = str(read_number(integer))
+    if not comma:
+        return number
+    words = fraction.split()
+    n_zeros = 0
+    while n_zeros < len(words) and words[n_zeros] == digits[0]:
+        n_zeros += 1
+    significant = words[n_zeros:]
+    digits_after = "0" * n_zeros + (
+        str(read_number(" ".join(significant))) if significant else ""
+    )
+    return f"{number},{digits_after}"
+
+
+def read_percentage(spelling: str) -> str:
+    "Read a percentage spelled in turkish, the inverse of `spell_percentage`."
+    return read_decimal(spelling.removeprefix(PERCENT + " "))
+
+
+def spell_many(
+    values: Iterable[int], speller: Callable[[int], str] = spell_number
+) -> list[str]:
+    """Spell many numbers at once.
+
+    Parameters
+    ----------
+    values : Iterable[int]
+        Numbers to spell.
+    speller : Callable[[int], str]
+        The function spelling a number, e.g. `spell_ordinal`.
+
+    Returns
+    ----------
+    spellings : list[str]
+        Spellings in the order of the numbers.
+    """
+    return list(map(speller, values))
+
+
+def read_many(
+    spellings: Iterable[str], reader: Callable[[str], int] = read_number
+) -> list[int]:
+    """Read many spelled numbers at once, e.g. to check round trips.
+
+    Parameters
+    ----------
+    spellings : Iterable[str]
+        Spelled numbers.
+    reader : Callable[[str], int]
+        The function reading a number, e.g. `read_ordinal`.
+
+    Returns
+    ----------
+    numbers : list[int]
+        Numbers in the order of the spellings.
+    """
+    return list(map(reader, spellings))
 
-    parts.append(spell_small_number(reminder))
-    return " ".join(parts).strip()
+
+def random_cardinal(draw: Callable[[], int]) -> tuple[str, str]:
+    "A number drawn by the function, as shown to the user, and its spelling."
+    number = draw()
+    return f"{number:10_}", spell_number(number)
+
+
+def random_ordinal() -> tuple[str, str]:
+    "A random ordinal number, as shown to the user, and its spelling."
+    number = random.randrange(1, ONE_THOUSAND + 1)
+    return f"{number}. (ordinal)", spell_ordinal(number)
+
+
+def random_distributive() -> tuple[str, str]:
+    "A random distributive number, as shown to the user, and its spelling."
+    number = random.randrange(1, ONE_HUNDRED + 1)
+    return f"{number} each", spell_distributive(number)
+
+
+def random_fraction() -> tuple[str, str]:
+    "A random fraction, as shown to the user, and its spelling."
+    denominator = random.randrange(2, ONE_HUNDRED + 1)
+    numerator = random.randrange(1, denominator)
+    return f"{numerator}/{denominator}", spell_fraction(numerator, denominator)
+
+
+def random_decimal() -> str:
+    "A random decimal fraction with one or two digits after the comma."
+    n_digits = random.randint(1, 2)
+    fraction = str(random.randrange(10**n_digits)).zfill(n_digits)
+    return f"{random.randrange(ONE_HUNDRED)},{fraction}"
+
+
+def random_decimal_spelling() -> tuple[str, str]:
+    "A random decimal fraction, as shown to the user, and its spelling."
+    number = random_decimal()
+    return number, spell_decimal(number)
+
+
+def random_percentage() -> tuple[str, str]:
+    "A random percentage, as shown to the user, and its spelling."
+    if random.random() < 0.5:
+        number = str(random.randrange(ONE_HUNDRED + 1))
+    else:
+        number = random_decimal()
+    return f"%{number}", spell_percentage(number)
 
 
 def prompt_difficulty() -> Difficulty:
@@ -149,14 +506,79 @@ def prompt_difficulty() -> Difficulty:
             Choice(value=Difficulty.TENS, name="tens"),
             Choice(value=Difficulty.BASIC, name="basic"),
             Choice(value=Difficulty.ADVANCED, name="advanced"),
+            Choice(value=Difficulty.ORDINALS, name="ordinals"),
+            Choice(value=Difficulty.DISTRIBUTIVES, name="distributives"),
+            Choice(value=Difficulty.FRACTIONS, name="fractions"),
+            Choice(value=Difficulty.DECIMALS, name="decimals"),
+            Choice(value=Difficulty.PERCENTAGES, name="percentages"),
         ],
     ).execute()
 
 
+def practice_numeral(
+    shown: str, correct_answer: str, prompter: PrompterInTheLanguage
+) -> Optional[bool]:
+    """Prompt the spelling of a numeral and tell the user whether it's correct.
+
+    Parameters
+    ----------
+    shown : str
+        The numeral as shown to the user, e.g. "3/4".
+    correct_answer : str
+        The spelling of the numeral.
+    prompter : PrompterInTheLanguage
+        The prompter in Turkish.
+
+    Returns
+    ----------
+    is_correct : Optional[bool]
+        True, if the spelling is correct, None if the user escaped.
+    """
+    output.line(
+        "Spell ",
+        (shown, "yellow"),
+        ". Press ",
+        ("enter", "blue"),
+        " to escape.",
+    )
+    output.flush()
+    user_answer = prompter.prompt()
+    if not user_answer:
+        return None
+    if user_answer.split() == correct_answer.split():
+        output.line(("Correct!", "green"))
+        return True
+    output.line(("Incorrect!", "red"), " Right answer:\n> ", (correct_answer, "green"))
+    return False
+
+
+def practice_number(number: int, prompter: PrompterInTheLanguage) -> Optional[bool]:
+    """Prompt the spelling of a number and tell the user whether it's correct.
+
+    Parameters
+    ----------
+    number : int
+        The number to spell.
+    prompter : PrompterInTheLanguage
+        The prompter in Turkish.
+
+    Returns
+    ----------
+    is_correct : Optional[bool]
+        True, if the spelling is correct, None if the user escaped.
+    """
+    return practice_numeral(f"{number:10_}", spell_number(number), prompter)
+
+
 def numbers(
     difficulty: Optional[Difficulty] = typer.Option(
         None, "--difficulty", help="Difficulty"
-    )
+    ),
+    plain: Optional[bool] = typer.Option(
+        None,
+        "--plain/--rich",
+        help="Write feedback as plain text. Default when output isn't a terminal.",
+    ),
 ) -> None:
     """Practice session for numbers.
 
@@ -164,11 +586,18 @@ def numbers(
     ----------
     difficulty : Optional[Difficulty]
         A value from `Difficulty` enum. Prompted from user if None.
+    plain : Optional[bool]
+        True, if feedback should be written as plain text through a buffer,
+        False to render it with rich. Chosen by whether stdout is a terminal
+        if None.
     """
+    if plain is not None:
+        output.use(plain)
     if difficulty is None:
         difficulty = prompt_difficulty()
 
-    number_generator: Callable
+    number_generator: partial[int]
+    numeral_generator: Callable[[], tuple[str, str]]
     match difficulty:
         case difficulty.DIGITS:
             number_generator = partial(random.choice, list(digits.keys()))
@@ -180,23 +609,22 @@ def numbers(
             )
         case difficulty.ADVANCED:
             number_generator = partial(random.randrange, 10**12)
+        case difficulty.ORDINALS:
+            numeral_generator = random_ordinal
+        case difficulty.DISTRIBUTIVES:
+            numeral_generator = random_distributive
+        case difficulty.FRACTIONS:
+            numeral_generator = random_fraction
+        case difficulty.DECIMALS:
+            numeral_generator = random_decimal_spelling
+        case difficulty.PERCENTAGES:
+            numeral_generator = random_percentage
+    if difficulty in cardinal_difficulties:
+        numeral_generator = partial(random_cardinal, number_generator)
 
     prompter = PrompterInTheLanguage(Language.turkish)
-    while True:
-        number = number_generator()
-        correct_answer = spell_number(number)
-        print(
-            f"Spell [yellow]{number:10_}[/yellow]. Press [blue]enter[/blue] to escape."
-        )
-        user_answer = prompter.prompt()
-        if not user_answer:
-            return
-        if user_answer.split() == correct_answer.split():
-            print("[green]Correct![/green]")
-        else:
-            print(
-                f"[red]Incorrect![/red] Right answer:\n> [green]{correct_answer}[/green]"
-            )
+    while practice_numeral(*numeral_generator(), prompter) is not None:
+        pass
 
 
 def main() -> None:
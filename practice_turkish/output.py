@@ -0,0 +1,265 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, TextIO, Union
+import atexit
+import os
+import sys
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+from rich import get_console
+
+BUFFER_SIZE = 64 * 1024
+
+# A piece of a line: either plain text, or text with a style, e.g. "green".
+Segment = Union[str, tuple[str, str]]
+
+ansi_codes = {
+    "bold": "1",
+    "red": "31",
+    "green": "32",
+    "yellow": "33",
+    "blue": "34",
+}
+
+
+class Backend(ABC):
+    """An ABC used to represent a way to show text to the user.
+
+    Methods
+    ----------
+    def line(self, *segments: Segment, end: str = "\\n") -> None
+        Write a line assembled from segments.
+
+    def table(self, title: Optional[str], header: tuple[str, str],
+              rows: Iterable[tuple[str, str]]) -> None
+        Write a table of two columns.
+
+    def flush(self) -> None
+        Show everything written so far.
+    """
+
+    @abstractmethod
+    def line(self, *segments: Segment, end: str = "\n") -> None:
+        "Write a line assembled from segments."
+        raise NotImplementedError
+
+    @abstractmethod
+    def table(
+        self,
+        title: Optional[str],
+        header: tuple[str, str],
+        rows: Iterable[tuple[str, str]],
+    ) -> None:
+        "Write a table of two columns, the first aligned left, the second right."
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        "Show everything written so far."
+
+
+class RichBackend(Backend):
+    """A class used to render text with rich.
+
+    Segments are assembled into `rich.text.Text` directly, so no markup is
+    parsed, but rich still measures, wraps and styles every line.
+    """
+
+    def __init__(self, console: Optional[Console] = None) -> None:
+        self.console = get_console() if console is None else console
+
+    def line(self, *segments: Segment, end: str = "\n") -> None:
+        self.console.print(Text.assemble(*segments), end=end)
+
+    def table(
+        self,
+        title: Optional[str],
+        header: tuple[str, str],
+        rows: Iterable[tuple[str, str]],
+    ) -> None:
+        table = Table(title=title)
+        table.add_column(header[0], justify="left")
+        table.add_column(header[1], justify="right")
+        for row in rows:
+            table.add_row(*row)
+        self.console.print(table)
+
+
+class PlainBackend(Backend):
+    """A class used to write pre-formatted text through one buffer.
+
+    Lines are formatted with plain string operations, optionally colored with
+    ANSI escape codes, and collected in memory. The buffer is written to the
+    stream in one call when it's flushed or grows over `buffer_size`.
+    Sessions flush it before waiting for the user.
+
+    Attributes
+    ----------
+    stream : TextIO
+        The stream to write to, stdout by default.
+    color : bool
+        True, if styles are written as ANSI escape codes.
+    buffer_size : int
+        The number of characters buffered before writing them.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        color: bool = False,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        self.stream = sys.stdout if stream is None else stream
+        self.color = color
+        self.buffer_size = buffer_size
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        "Add text to the buffer, writing the buffer if it's full."
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def style(self, text: str, style: str) -> str:
+        "Wrap text into ANSI escape codes of the style, if colors are on."
+        if not self.color:
+            return text
+        codes = ";".join(
+            ansi_codes[name] for name in style.split() if name in ansi_codes
+        )
+        return f"\x1b[{codes}m{text}\x1b[0m" if codes else text
+
+    def line(self, *segments: Segment, end: str = "\n") -> None:
+        parts = [
+            segment if isinstance(segment, str) else self.style(*segment)
+            for segment in segments
+        ]
+        parts.append(end)
+        self.write("".join(parts))
+
+    def table(
+        self,
+        title: Optional[str],
+        header: tuple[str, str],
+        rows: Iterable[tuple[str, str]],
+    ) -> None:
+        rows = list(rows)
+        width_a = max([len(header[0])] + [len(a) for a, _ in rows])
+        width_b = max([len(header[1])] + [len(b) for _, b in rows])
+        lines = []
+        if title is not None:
+            lines.append(title.center(width_a + width_b + 3).rstrip())
+        lines.append(
+            self.style(f"{header[0]:<{width_a}} | {header[1]:>{width_b}}", "bold")
+        )
+        lines.append(f"{'-' * width_a}-+-{'-' * width_b}")
+        lines.extend(f"{a:<{width_a}} | {b:>{width_b}}" for a, b in rows)
+        lines.append("")
+        self.write("\n".join(lines))
+
+    def flush(self) -> None:
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        self.stream.flush()
+
+
+def choose_backend(plain: Optional[bool] = None) -> Backend:
+    """Create the backend showing text to the user.
+
+    Parameters
+    ----------
+    plain : Optional[bool]
+        True for the plain backend, False for rich. If None, the plain
+        backend is chosen when stdout isn't a terminal, e.g. piped to a file.
+
+    Returns
+    ----------
+    backend : Backend
+        The backend. The plain one colors text only if stdout is a terminal
+        and the NO_COLOR environment variable isn't set.
+    """
+    is_terminal = sys.stdout.isatty()
+    if plain is None:
+        plain = not is_terminal
+    if not plain:
+        return RichBackend()
+    return PlainBackend(color=is_terminal and "NO_COLOR" not in os.environ)
+
+
+class Output:
+    """A class used to show feedback of sessions with the chosen backend.
+
+    The backend is chosen on the first use, see `choose_backend`, unless it's
+    chosen explicitly with `use`. Buffered text is flushed at exit.
+
+    Methods
+    ----------
+    def use(self, plain: Optional[bool] = None) -> None
+        Choose the backend.
+
+    def redirect(self, backend: Backend) -> ContextManager[Backend]
+        Use another backend inside a with statement.
+
+    def line(self, *segments: Segment, end: str = "\\n") -> None
+        Write a line, e.g. `output.line(("Correct!", "green"))`.
+
+    def table(self, title: Optional[str], header: tuple[str, str],
+              rows: Iterable[tuple[str, str]]) -> None
+        Write a table of two columns.
+
+    def flush(self) -> None
+        Show everything written so far, called before waiting for the user.
+    """
+
+    def __init__(self) -> None:
+        self._backend: Optional[Backend] = None
+        atexit.register(self.flush)
+
+    @property
+    def backend(self) -> Backend:
+        "The current backend."
+        if self._backend is None:
+            self._backend = choose_backend()
+        return self._backend
+
+    def use(self, plain: Optional[bool] = None) -> None:
+        "Choose the backend, see `choose_backend`."
+        self.flush()
+        self._backend = choose_backend(plain)
+
+    @contextmanager
+    def redirect(self, backend: Backend) -> Iterator[Backend]:
+        "Use another backend inside a with statement, e.g. in benchmarks."
+        self.flush()
+        previous, self._backend = self._backend, backend
+        try:
+            yield backend
+        finally:
+            backend.flush()
+            self._backend = previous
+
+    def line(self, *segments: Segment, end: str = "\n") -> None:
+        "Write a line assembled from segments."
+        self.backend.line(*segments, end=end)
+
+    def table(
+        self,
+        title: Optional[str],
+        header: tuple[str, str],
+        rows: Iterable[tuple[str, str]],
+    ) -> None:
+        "Write a table of two columns, the first aligned left, the second right."
+        self.backend.table(title, header, rows)
+
+    def flush(self) -> None:
+        "Show everything written so far."
+        if self._backend is not None:
+            self._backend.flush()
+
+
+output = Output()
@@ -1,16 +1,44 @@
+from typing import Optional
+
 import typer
 
 from practice_turkish.translation import translation
 from practice_turkish.make_csv import make_dictionary as make_csv
 from practice_turkish.number import numbers
+from practice_turkish.suffixes import suffixes
+from practice_turkish.search import search
+from practice_turkish.lint import lint
+from practice_turkish.convert import convert
+from practice_turkish.serve import serve
+from practice_turkish.memory import memory
+from practice_turkish.output import output
+
+
+def configure(
+    plain: Optional[bool] = typer.Option(
+        None,
+        "--plain/--rich",
+        help="Write feedback as plain text. Default when output isn't a terminal.",
+    )
+) -> None:
+    "Apply options shared by all commands."
+    if plain is not None:
+        output.use(plain)
 
 
 def main() -> None:
     "Create Typer application and run it."
     app = typer.Typer()
+    app.callback()(configure)
     app.command(help="Practice translation")(translation)
     app.command(help="Create a new CSV dictionary")(make_csv)
     app.command(help="Practice numbers")(numbers)
+    app.command(help="Practice suffixes of Turkish words")(suffixes)
+    app.command(help="Find which dictionaries contain a word")(search)
+    app.command(help="Check dictionary files for problems")(lint)
+    app.command(help="Convert turkrut dictionaries into CSV dictionaries")(convert)
+    app.command(help="Serve practice sessions to many learners")(serve)
+    app.command(help="Report memory taken by dictionaries and sessions")(memory)
     app()
 
 
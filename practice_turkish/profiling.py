@@ -0,0 +1,218 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Iterator, ParamSpec, TypeVar
+import json
+import os
+import threading
+import time
+
+from rich import print
+from rich.table import Table
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class Span:
+    """A class used to represent one timed call of a phase.
+
+    Attributes
+    ----------
+    name : str
+        The name of the phase.
+    start : int
+        The moment the phase started, in nanoseconds of `time.perf_counter_ns`.
+    duration : int
+        The duration of the phase in nanoseconds.
+    thread : int
+        The identifier of the thread the phase ran in.
+    """
+
+    name: str
+    start: int
+    duration: int
+    thread: int
+
+
+@dataclass
+class Profiler:
+    """A class used to collect named timers and counters of a session.
+
+    Disabled profilers record nothing: a timed function costs one attribute
+    check on top of the call, so instrumentation stays in the code for good.
+    Spans and counters are kept in memory and written at exit, either as a
+    Chrome trace (open it in chrome://tracing or https://ui.perfetto.dev) or
+    as a summary table.
+
+    Attributes
+    ----------
+    enabled : bool
+        True, if timers and counters are recorded.
+    spans : list[Span]
+        Recorded calls of timed phases in the order they finished.
+    counters : dict[str, int]
+        Current values of counters.
+
+    Methods
+    ----------
+    def enable(self) -> None
+        Start recording timers and counters.
+
+    def timer(self, name: str) -> ContextManager[None]
+        Time the body of a with statement as a phase.
+
+    def timed(self, name: str) -> Callable
+        Decorator timing each call of a function as a phase.
+
+    def count(self, name: str, n: int = 1) -> None
+        Add n to a counter.
+
+    def write_trace(self, path: str) -> None
+        Write recorded spans and counters as a Chrome trace.
+
+    def print_summary(self) -> None
+        Print total and mean duration of each phase and values of counters.
+
+    def report(self, path: str) -> None
+        Write the trace and print the summary.
+    """
+
+    enabled: bool = False
+    spans: list[Span] = field(default_factory=list)
+    counters: dict[str, int] = field(default_factory=dict)
+    _counter_events: list[tuple[str, int, int]] = field(
+        default_factory=list, repr=False
+    )
+    _origin: int = field(default_factory=time.perf_counter_ns, repr=False)
+
+    def enable(self) -> None:
+        "Start recording timers and counters."
+        self.enabled = True
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        "Time the body of a with statement as a phase."
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            self.spans.append(Span(name, start, duration, threading.get_ident()))
+
+    def timed(self, name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Decorator timing each call of a function as a phase.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase, e.g. "Dictionary.print".
+
+        Returns
+        ----------
+        decorator : Callable
+            The decorator wrapping a function.
+        """
+
+        def decorator(function: Callable[P, R]) -> Callable[P, R]:
+            @wraps(function)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    duration = time.perf_counter_ns() - start
+                    span = Span(name, start, duration, threading.get_ident())
+                    self.spans.append(span)
+
+            return wrapper
+
+        return decorator
+
+    def count(self, name: str, n: int = 1) -> None:
+        "Add n to a counter."
+        if not self.enabled:
+            return
+        value = self.counters.get(name, 0) + n
+        self.counters[name] = value
+        self._counter_events.append((name, time.perf_counter_ns(), value))
+
+    def trace(self) -> dict:
+        """Recorded spans and counters in the Chrome trace event format.
+
+        Returns
+        ----------
+        trace : dict
+            The object with "traceEvents", timestamps are in microseconds
+            since the profiler was created.
+        """
+        pid = os.getpid()
+        events: list[dict] = [
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": (span.start - self._origin) / 1000,
+                "dur": span.duration / 1000,
+                "pid": pid,
+                "tid": span.thread,
+            }
+            for span in self.spans
+        ]
+        events += [
+            {
+                "name": name,
+                "ph": "C",
+                "ts": (moment - self._origin) / 1000,
+                "pid": pid,
+                "args": {"value": value},
+            }
+            for name, moment, value in self._counter_events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: str) -> None:
+        "Write recorded spans and counters as a Chrome trace."
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f)
+
+    def print_summary(self) -> None:
+        "Print total and mean duration of each phase and values of counters."
+        durations: defaultdict[str, list[int]] = defaultdict(list)
+        for span in self.spans:
+            durations[span.name].append(span.duration)
+
+        table = Table(title="Profile")
+        table.add_column("Phase", justify="left", overflow="fold")
+        table.add_column("Calls", justify="right")
+        table.add_column("Total, ms", justify="right")
+        table.add_column("Mean, ms", justify="right")
+        table.add_column("Max, ms", justify="right")
+        phases = sorted(durations.items(), key=lambda item: -sum(item[1]))
+        for name, values in phases:
+            total = sum(values)
+            table.add_row(
+                name,
+                str(len(values)),
+                f"{total / 1e6:.2f}",
+                f"{total / len(values) / 1e6:.3f}",
+                f"{max(values) / 1e6:.3f}",
+            )
+        for name, value in self.counters.items():
+            table.add_row(name, str(value), "", "", "")
+        print(table)
+
+    def report(self, path: str) -> None:
+        "Write the trace to the path and print the summary."
+        self.write_trace(path)
+        self.print_summary()
+        print(f"Trace written to [yellow]{path}[/yellow].")
+
+
+profiler = Profiler()
@@ -0,0 +1,115 @@
+from typing import Optional
+import hashlib
+import os
+import time
+
+from rich import print
+from rich.table import Table
+import typer
+
+from practice_turkish.cache import cache_path
+from practice_turkish.dictionaries.catalog import Catalog
+from practice_turkish.dictionaries.searchindex import SearchIndex, MatchKind
+
+
+def index_paths(directories: Optional[list[str]]) -> tuple[str, str]:
+    """Paths of the catalog and the search index of directories.
+
+    Default directories share the catalog with the dictionary picker. Other
+    sets of directories get their own catalog and index, so searching them
+    doesn't drop default dictionaries from the shared ones.
+
+    Returns
+    ----------
+    catalog : str
+        A string representing a path to the catalog file.
+    index : str
+        A string representing a path to the search index file.
+    """
+    if not directories:
+        return cache_path("catalog.json"), cache_path("search.pickle")
+    key = "\n".join(sorted({os.path.abspath(d) for d in directories}))
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return (
+        cache_path("search", f"{digest}.json"),
+        cache_path("search", f"{digest}.pickle"),
+    )
+
+
+def search(
+    query: str = typer.Argument(..., help="A word or a part of it to look up."),
+    limit: int = typer.Option(20, "--limit", help="Maximum number of results."),
+    fuzzy: bool = typer.Option(
+        True, "--fuzzy/--no-fuzzy", help="Find words with typos as well."
+    ),
+    directories: Optional[list[str]] = typer.Option(
+        None,
+        "--directory",
+        help="Directories with dictionaries, 'CSV' and 'turkrut' by default.",
+    ),
+) -> None:
+    """Find which dictionaries contain a word.
+
+    Keeps an index of all dictionaries in the cache directory, a separate one
+    for each set of directories given. Before each search, the index is
+    updated with new and changed files only.
+
+    Parameters
+    ----------
+    query : str
+        A word or a part of it.
+    limit : int
+        The maximum number of results, default is 20.
+    fuzzy : bool
+        True, if words differing from the query by a few typos should be found
+        as well.
+    directories : Optional[list[str]]
+        Directories with dictionaries, default directories of all formats if
+        not given.
+    """
+    catalog_path, index_path = index_paths(directories)
+    catalog = Catalog.load(catalog_path)
+    if catalog.refresh(directories or None):
+        catalog.save()
+    index = SearchIndex.load(index_path)
+    indexed, removed = index.update(catalog)
+    if indexed or removed:
+        index.save()
+        print(f"Indexed [yellow]{indexed}[/yellow] files, removed {removed}.")
+
+    start = time.perf_counter()
+    results = index.search(query, limit, fuzzy)
+    elapsed = time.perf_counter() - start
+
+    colors = {
+        MatchKind.EXACT: "green",
+        MatchKind.SUBSTRING: "yellow",
+        MatchKind.FUZZY: "red",
+    }
+    table = Table(title=f'Search results for "{query}"')
+    table.add_column("File", justify="left")
+    table.add_column("#", justify="right")
+    table.add_column("Entry", justify="left")
+    table.add_column("Translation", justify="left")
+    for result in results:
+        color = colors[result.kind]
+        table.add_row(
+            result.path,
+            str(result.offset + 1),
+            f"[{color}]{result.query_a}[/{color}]",
+            result.query_b,
+        )
+    print(table)
+    print(
+        f"Found [green]{len(results)}[/green] entries among {len(index)} "
+        f"in {elapsed * 1000:.1f} ms."
+    )
+
+
+def main() -> None:
+    """If open as a script, run search function."""
+    typer.run(search)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import asyncio
+
+from rich import print
+import typer
+
+from practice_turkish.dictionaries import DictionaryFormatError
+from practice_turkish.server import Library, PracticeServer
+
+
+def serve(
+    paths: list[str] = typer.Argument(
+        ..., help="Dictionary files or directories to serve."
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to listen on."),
+    port: int = typer.Option(8000, "--port", help="Port to listen on."),
+) -> None:
+    """Run a server practicing dictionaries with many learners at once.
+
+    Dictionaries are loaded once and shared by sessions of all learners,
+    which run concurrently in one event loop. Learners' clients talk to the
+    server in JSON over HTTP, see `PracticeServer` for the endpoints.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Paths to dictionary files or directories.
+    host : str
+        The address to listen on, default is localhost. Use 0.0.0.0 to let
+        other computers of the classroom connect.
+    port : int
+        The port to listen on, default is 8000.
+    """
+    try:
+        library = Library.load(paths)
+    except DictionaryFormatError as error:
+        print(f"[red]DictionaryFormatError[/red]: [yellow]{error}[/yellow]")
+        raise typer.Exit(code=1)
+    for description in library.describe():
+        print(f"[yellow]{description['name']}[/yellow]: {description['size']} entries")
+    print(f"Serving on [green]http://{host}:{port}[/green], press Ctrl+C to stop.")
+    try:
+        asyncio.run(PracticeServer(library).serve(host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    "If open as a script, run serve function."
+    typer.run(serve)
+
+
+if __name__ == "__main__":
+    main()
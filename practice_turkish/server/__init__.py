@@ -0,0 +1,3 @@
+from practice_turkish.server.protocol import HTTPError, Request
+from practice_turkish.server.sessions import Library, PracticeSession, SessionStore
+from practice_turkish.server.app import PracticeServer
@@ -0,0 +1,197 @@
+from typing import Any, Optional
+import asyncio
+import traceback
+
+from practice_turkish.server.protocol import (
+    HTTPError,
+    Request,
+    encode_response,
+    read_request,
+)
+from practice_turkish.server.sessions import (
+    SESSION_TTL,
+    Library,
+    PracticeSession,
+    SessionStore,
+)
+
+Reply = tuple[int, Any]
+
+
+class PracticeServer:
+    """A class used to run practice sessions of many learners over HTTP.
+
+    All sessions run in one event loop and share dictionaries of the library.
+    Requests and responses are JSON:
+
+    - `GET /dictionaries` lists dictionaries.
+    - `POST /sessions` with `{"dictionary": name, "a2b": true, "questions": 20,
+      "seed": 1}` starts a session and returns its identifier and the first
+      question. Everything but the name is optional.
+    - `GET /sessions/<id>` returns the current question and the score.
+    - `POST /sessions/<id>/answer` with `{"answer": text}` grades the answer
+      and returns the expected translation and the next question.
+    - `GET /sessions/<id>/mistakes` lists entries answered wrong.
+    - `DELETE /sessions/<id>` finishes a session.
+
+    Attributes
+    ----------
+    library : Library
+        Dictionaries shared by all sessions.
+    sessions : SessionStore
+        Sessions of all learners.
+    """
+
+    def __init__(self, library: Library) -> None:
+        self.library = library
+        self.sessions = SessionStore()
+
+    def dispatch(self, request: Request) -> Reply:
+        """Handle a request.
+
+        Parameters
+        ----------
+        request : Request
+            The request of a client.
+
+        Returns
+        ----------
+        status : int
+            The status code of the response.
+        payload : Any
+            The object to send back as JSON.
+
+        Raises
+        ----------
+        HTTPError
+            If the request can't be handled.
+        """
+        parts = request.path.strip("/").split("/")
+        match request.method, parts:
+            case "GET", ["dictionaries"]:
+                return 200, self.library.describe()
+            case "POST", ["sessions"]:
+                return self.create_session(request.json())
+            case "GET", ["sessions", identifier]:
+                session = self.find(identifier)
+                return 200, {"question": session.question(), "score": session.score()}
+            case "POST", ["sessions", identifier, "answer"]:
+                return self.answer(self.find(identifier), request.json())
+            case "GET", ["sessions", identifier, "mistakes"]:
+                return 200, self.find(identifier).mistaken_entries()
+            case "DELETE", ["sessions", identifier]:
+                session = self.find(identifier)
+                self.sessions.remove(identifier)
+                return 200, {"score": session.score()}
+            case _, ["dictionaries"] | ["sessions", *_]:
+                raise HTTPError(405, f"{request.method} isn't allowed here.")
+        raise HTTPError(404, f"Nothing at {request.path}.")
+
+    def find(self, identifier: str) -> PracticeSession:
+        "Find a session or fail with 404."
+        session = self.sessions.get(identifier)
+        if session is None:
+            raise HTTPError(404, "No such session, it might have expired.")
+        return session
+
+    def create_session(self, parameters: dict[str, Any]) -> Reply:
+        "Start a session with the parameters sent by the client."
+        name = parameters.get("dictionary")
+        if not isinstance(name, str):
+            raise HTTPError(400, "dictionary should be a string.")
+        dictionary = self.library.dictionaries.get(name)
+        if dictionary is None:
+            raise HTTPError(404, f"No dictionary named {name!r}.")
+        a2b = parameters.get("a2b", True)
+        n_questions = parameters.get("questions")
+        seed = parameters.get("seed")
+        if not isinstance(a2b, bool):
+            raise HTTPError(400, "a2b should be true or false.")
+        for value in (n_questions, seed):
+            if value is not None and (
+                not isinstance(value, int) or isinstance(value, bool)
+            ):
+                raise HTTPError(400, "questions and seed should be integers.")
+        if n_questions is not None and n_questions <= 0:
+            raise HTTPError(400, "questions should be positive.")
+        identifier, session = self.sessions.create(dictionary, a2b, n_questions, seed)
+        return 201, {"session": identifier, "question": session.question()}
+
+    def answer(self, session: PracticeSession, parameters: dict[str, Any]) -> Reply:
+        "Grade the answer sent by the client."
+        text = parameters.get("answer")
+        if not isinstance(text, str):
+            raise HTTPError(400, "answer should be a string.")
+        if session.finished:
+            raise HTTPError(400, "All questions are answered already.")
+        is_correct, expected = session.answer(text.strip())
+        return 200, {
+            "correct": is_correct,
+            "expected": expected,
+            "next": session.question(),
+            "score": session.score(),
+        }
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        "Answer requests sent over one connection until the client closes it."
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as error:
+                    writer.write(
+                        encode_response(error.status, {"error": str(error)}, False)
+                    )
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                keep_alive = request.keep_alive
+                try:
+                    status, payload = self.dispatch(request)
+                except HTTPError as error:
+                    status, payload = error.status, {"error": str(error)}
+                except Exception:
+                    traceback.print_exc()
+                    status, payload = 500, {"error": "Internal server error."}
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def expire_sessions(self, ttl: float = SESSION_TTL) -> None:
+        "Remove inactive sessions once in a while."
+        while True:
+            await asyncio.sleep(min(ttl, 60))
+            self.sessions.expire(ttl)
+
+    async def serve(
+        self, host: str = "127.0.0.1", port: int = 8000, ready: Optional[Any] = None
+    ) -> None:
+        """Accept connections until cancelled.
+
+        Parameters
+        ----------
+        host : str
+            The address to listen on, default is localhost.
+        port : int
+            The port to listen on, default is 8000.
+        ready : Optional[Any]
+            If given, its `set` method is called once the server listens,
+            e.g. an `asyncio.Event` or a `multiprocessing.Event`.
+        """
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        expiry = asyncio.create_task(self.expire_sessions())
+        if ready is not None:
+            ready.set()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            expiry.cancel()
@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+import asyncio
+import json
+
+MAX_HEADER_LINES = 100
+MAX_BODY_SIZE = 64 * 1024
+
+reasons = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """Exception raised to answer a request with an error status.
+
+    Attributes
+    ----------
+    status : int
+        The status code of the response.
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class Request:
+    """A class used to represent an HTTP request.
+
+    Attributes
+    ----------
+    method : str
+        The method of the request, e.g. "GET".
+    path : str
+        The path of the request without the query string.
+    version : str
+        The version of the protocol, e.g. "HTTP/1.1".
+    headers : dict[str, str]
+        Headers of the request with lowercase names.
+    body : bytes
+        The body of the request.
+    """
+
+    method: str
+    path: str
+    version: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def keep_alive(self) -> bool:
+        "True, if the connection should stay open after the response."
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> dict[str, Any]:
+        """The body of the request parsed as a JSON object.
+
+        Raises
+        ----------
+        HTTPError
+            If the body isn't a JSON object.
+        """
+        if not self.body:
+            return {}
+        try:
+            document = json.loads(self.body)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPError(400, "The body isn't valid JSON.")
+        if not isinstance(document, dict):
+            raise HTTPError(400, "The body should be a JSON object.")
+        return document
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Read an HTTP request from a connection.
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        The reading end of the connection.
+
+    Returns
+    ----------
+    request : Optional[Request]
+        The request, None if the client closed the connection.
+
+    Raises
+    ----------
+    HTTPError
+        If the request is malformed or its body is too large.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line.")
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(400, "Too many headers.")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(400, "Malformed Content-Length.")
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(413, "The body is too large.")
+    body = await reader.readexactly(length) if length > 0 else b""
+    path = target.partition("?")[0]
+    return Request(method.upper(), path, version, headers, body)
+
+
+def encode_response(status: int, payload: Any, keep_alive: bool = True) -> bytes:
+    """Encode a JSON response.
+
+    Parameters
+    ----------
+    status : int
+        The status code of the response.
+    payload : Any
+        The object sent as JSON in the body.
+    keep_alive : bool
+        True, if the connection stays open after the response.
+
+    Returns
+    ----------
+    response : bytes
+        The status line, headers and the body.
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {reasons.get(status, 'Unknown')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
@@ -0,0 +1,240 @@
+from array import array
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any, Optional
+import os
+import secrets
+import time
+
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.interning import string_pool
+from practice_turkish.dictionaries.mixture import load_dictionaries, resolve_sources
+
+SESSION_TTL = 60 * 60
+
+
+@dataclass
+class Library:
+    """A class used to represent dictionaries shared by all sessions.
+
+    Each dictionary is loaded once when the server starts. Sessions refer to
+    entries by their indices and never modify dictionaries, so any number of
+    sessions share one copy of them. Nothing is loaded afterwards, so the
+    string pool is cleared once dictionaries are loaded.
+
+    Attributes
+    ----------
+    dictionaries : dict[str, Dictionary]
+        Loaded dictionaries by their names.
+    """
+
+    dictionaries: dict[str, Dictionary[DictionaryEntry]]
+
+    @classmethod
+    def load(cls, paths: list[str]) -> "Library":
+        """Load dictionaries in parallel.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Paths to dictionary files or directories.
+
+        Returns
+        ----------
+        library : Library
+            Loaded dictionaries named by their paths relative to the current
+            directory, with forward slashes.
+        """
+        sources = resolve_sources(paths)
+        dictionaries = load_dictionaries([(path, type) for path, type, _ in sources])
+        names = [os.path.relpath(path).replace(os.sep, "/") for path, _, _ in sources]
+        string_pool.clear()
+        return cls(dict(zip(names, dictionaries)))
+
+    def describe(self) -> list[dict[str, Any]]:
+        "Names, sizes and languages of dictionaries."
+        return [
+            {
+                "name": name,
+                "size": len(dictionary),
+                "language_a": dictionary.language_a.name,
+                "language_b": dictionary.language_b.name,
+            }
+            for name, dictionary in self.dictionaries.items()
+        ]
+
+
+@dataclass(slots=True)
+class PracticeSession:
+    """A class used to represent the state of a session of one learner.
+
+    The state is kept compact, since a server holds thousands of sessions:
+    questions and mistakes are arrays of indices of entries of the shared
+    dictionary.
+
+    Attributes
+    ----------
+    dictionary : Dictionary
+        The practiced dictionary, shared with other sessions.
+    a2b : bool
+        True, if entries are translated from language A to language B.
+    order : array
+        Indices of entries in the order they are asked.
+    position : int
+        The number of answered questions.
+    n_correct : int
+        The number of correct answers.
+    mistakes : array
+        Indices of entries answered wrong.
+    last_seen : float
+        The moment of the last request of the session.
+    """
+
+    dictionary: Dictionary[DictionaryEntry]
+    a2b: bool
+    order: array
+    position: int = 0
+    n_correct: int = 0
+    mistakes: array = field(default_factory=lambda: array("I"))
+    last_seen: float = field(default_factory=time.monotonic)
+
+    @property
+    def finished(self) -> bool:
+        "True, if all questions are answered."
+        return self.position >= len(self.order)
+
+    @property
+    def entry(self) -> DictionaryEntry:
+        "The entry of the current question."
+        return self.dictionary[self.order[self.position]]
+
+    def question(self) -> Optional[dict[str, Any]]:
+        "The current question, None if the session is finished."
+        if self.finished:
+            return None
+        entry = self.entry
+        language = entry.language_b if self.a2b else entry.language_a
+        return {
+            "query": entry.query_a if self.a2b else entry.query_b,
+            "language": language.name,
+            "number": self.position + 1,
+            "total": len(self.order),
+        }
+
+    def answer(self, text: str) -> tuple[bool, str]:
+        """Grade the answer to the current question and move to the next one.
+
+        Parameters
+        ----------
+        text : str
+            The answer of the learner.
+
+        Returns
+        ----------
+        is_correct : bool
+            True, if the answer is correct.
+        expected : str
+            The correct translation as written in the dictionary.
+        """
+        entry = self.entry
+        is_correct = entry.check_translation(self.a2b, text)
+        if is_correct:
+            self.n_correct += 1
+        else:
+            self.mistakes.append(self.order[self.position])
+        self.position += 1
+        return is_correct, entry.query_b if self.a2b else entry.query_a
+
+    def score(self) -> dict[str, int]:
+        "The numbers of answered questions and correct answers."
+        return {"answered": self.position, "correct": self.n_correct}
+
+    def mistaken_entries(self) -> list[tuple[str, str]]:
+        "Queries of entries answered wrong in both languages."
+        entries = (self.dictionary[i] for i in self.mistakes)
+        return [(entry.query_a, entry.query_b) for entry in entries]
+
+
+class SessionStore:
+    """A class used to hold sessions of all learners by their identifiers.
+
+    Methods
+    ----------
+    def create(self, dictionary: Dictionary, a2b: bool,
+               n_questions: Optional[int] = None,
+               seed: Optional[int] = None) -> tuple[str, PracticeSession]
+        Start a new session.
+
+    def get(self, identifier: str) -> Optional[PracticeSession]
+        Find a session, marking it as active.
+
+    def remove(self, identifier: str) -> bool
+        Remove a session.
+
+    def expire(self, ttl: float = SESSION_TTL) -> int
+        Remove sessions inactive for longer than ttl seconds.
+    """
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, PracticeSession] = {}
+
+    def create(
+        self,
+        dictionary: Dictionary[DictionaryEntry],
+        a2b: bool,
+        n_questions: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> tuple[str, PracticeSession]:
+        """Start a new session with questions in random order.
+
+        Parameters
+        ----------
+        dictionary : Dictionary
+            The practiced dictionary.
+        a2b : bool
+            True, if entries are translated from language A to language B.
+        n_questions : Optional[int]
+            The number of questions, all entries by default.
+        seed : Optional[int]
+            Seed of the random order of questions.
+
+        Returns
+        ----------
+        identifier : str
+            The identifier of the session.
+        session : PracticeSession
+            The new session.
+        """
+        n = len(dictionary)
+        k = n if n_questions is None else max(0, min(n_questions, n))
+        order = array("I", Random(seed).sample(range(n), k))
+        identifier = secrets.token_urlsafe(12)
+        session = PracticeSession(dictionary, a2b, order)
+        self.sessions[identifier] = session
+        return identifier, session
+
+    def get(self, identifier: str) -> Optional[PracticeSession]:
+        "Find a session, marking it as active."
+        session = self.sessions.get(identifier)
+        if session is not None:
+            session.last_seen = time.monotonic()
+        return session
+
+    def remove(self, identifier: str) -> bool:
+        "Remove a session, returning True if it existed."
+        return self.sessions.pop(identifier, None) is not None
+
+    def expire(self, ttl: float = SESSION_TTL) -> int:
+        "Remove sessions inactive for longer than ttl seconds, return their number."
+        deadline = time.monotonic() - ttl
+        expired = [
+            identifier
+            for identifier, session in self.sessions.items()
+            if session.last_seen < deadline
+        ]
+        for identifier in expired:
+            del self.sessions[identifier]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
@@ -0,0 +1,60 @@
+from practice_turkish.session.pipeline import (
+    Asker,
+    Grader,
+    Outcome,
+    Preparer,
+    Question,
+    Response,
+    make_live_questions,
+    make_questions,
+)
+from practice_turkish.session.sources import (
+    EntryStream,
+    from_entries,
+    from_file,
+    from_sample,
+    from_stream,
+    peek,
+)
+from practice_turkish.session.filters import (
+    contains_any,
+    has_hint,
+    is_phrase,
+    length_between,
+    matching,
+    take,
+    unique,
+    where,
+)
+from practice_turkish.session.orderers import (
+    adaptive,
+    in_order,
+    shuffled,
+    windowed_shuffle,
+)
+from practice_turkish.session.askers import (
+    HeadlessAsker,
+    ask,
+    ask_choice,
+    ask_typing,
+    prepare_choice,
+    prepare_typing,
+)
+from practice_turkish.session.prefetch import prefetch
+from practice_turkish.session.graders import (
+    grade,
+    choice_grader,
+    default_grader,
+    exact_grader,
+    inflection_grader,
+)
+from practice_turkish.session.sinks import (
+    Sink,
+    AdaptiveSink,
+    CSVSink,
+    FeedbackSink,
+    HistorySink,
+    TableSink,
+    TelegramSink,
+    run,
+)
@@ -0,0 +1,146 @@
+from typing import Any, Iterable, Iterator, Protocol, Sequence
+import random
+
+from InquirerPy import inquirer
+from InquirerPy.base.control import Choice
+
+from practice_turkish.dictionaries import DictionaryEntry
+from practice_turkish.session.pipeline import Asker, Question, Response
+
+
+class DistractorPool(Protocol):
+    "Anything able to sample entries, e.g. a dictionary or a mixture of them."
+
+    def sample(self, k: int) -> Sequence[DictionaryEntry]:
+        ...
+
+
+def ask(questions: Iterable[Question], asker: Asker) -> Iterator[Response]:
+    "Generator asking each question only when the following stage needs it."
+    for question in questions:
+        yield asker(question)
+
+
+def prepare_typing(question: Question) -> Question:
+    "Format the query and the expected answer of a question in advance."
+    question.prepare()
+    return question
+
+
+def ask_typing(question: Question) -> Response:
+    "Prompt the user to type in the translation in the language of the answer."
+    answer = question.entry.prompt_translation(question.a2b, question.query)
+    return Response(question, answer)
+
+
+def choice_options(
+    question: Question, pool: DistractorPool, n_choices: int = 4
+) -> list[DictionaryEntry]:
+    """Pick options for a question: the entry itself and random other entries.
+
+    Parameters
+    ----------
+    question : Question
+        The question to pick options for.
+    pool : DistractorPool
+        Entries other options are sampled from.
+    n_choices : int
+        The number of options, default is 4.
+
+    Returns
+    ----------
+    options : list[DictionaryEntry]
+        Options in random order, the entry of the question among them.
+    """
+    entry = question.entry
+    distractors = pool.sample(n_choices)
+    options = [entry] + [other for other in distractors if other is not entry]
+    options = options[:n_choices]
+    random.shuffle(options)
+    return options
+
+
+def ask_choice(
+    question: Question, pool: DistractorPool, n_choices: int = 4
+) -> Response:
+    """Prompt the user to pick the translation from several options.
+
+    Parameters
+    ----------
+    question : Question
+        The question to ask.
+    pool : DistractorPool
+        Entries other options are sampled from.
+    n_choices : int
+        The number of options, default is 4.
+
+    Returns
+    ----------
+    response : Response
+        The picked option and its entry.
+    """
+    if question.options is None:
+        prepare_choice(question, pool, n_choices)
+    assert question.options is not None
+    return pick_option(question, question.options)
+
+
+def prepare_choice(
+    question: Question, pool: DistractorPool, n_choices: int = 4
+) -> Question:
+    """Pick options of a question and render them for the prompt in advance.
+
+    Parameters
+    ----------
+    question : Question
+        The question to prepare, its `options` and `choices` are set.
+    pool : DistractorPool
+        Entries other options are sampled from.
+    n_choices : int
+        The number of options, default is 4.
+
+    Returns
+    ----------
+    question : Question
+        The same question.
+    """
+    question.prepare()
+    options = choice_options(question, pool, n_choices)
+    question.options = options
+    question.choices = option_choices(question, options)
+    return question
+
+
+def option_choices(question: Question, options: list[DictionaryEntry]) -> list[Any]:
+    "Render options of a question as choices of the prompt."
+    a2b = question.a2b
+    return [
+        Choice(value=i, name=option.query_b if a2b else option.query_a)
+        for i, option in enumerate(options)
+    ]
+
+
+def pick_option(question: Question, options: list[DictionaryEntry]) -> Response:
+    "Prompt the user to pick one of prepared options for the question."
+    a2b = question.a2b
+    choices = question.choices
+    if choices is None or question.options is not options:
+        choices = option_choices(question, options)
+    i = inquirer.select(message=f"{question.query} ⇨ ", choices=choices).execute()
+    chosen = options[i]
+    return Response(question, chosen.query_b if a2b else chosen.query_a, chosen)
+
+
+class HeadlessAsker:
+    """A class used to answer questions without the user.
+
+    Answers are taken from an iterable one by one, e.g. from lines of a file.
+    Useful for scripted sessions and benchmarks of other stages. An exhausted
+    iterable answers with empty strings.
+    """
+
+    def __init__(self, answers: Iterable[str]) -> None:
+        self._answers = iter(answers)
+
+    def __call__(self, question: Question) -> Response:
+        return Response(question, next(self._answers, "").strip())
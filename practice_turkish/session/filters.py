@@ -0,0 +1,84 @@
+from itertools import islice
+from typing import Iterable, Iterator
+
+from practice_turkish.dictionaries import DictionaryEntry
+from practice_turkish.dictionaries.bitmap import (
+    EntryMatcher,
+    Predicate,
+    compile_filter,
+    entry_texts,
+)
+
+
+def where(
+    entries: Iterable[DictionaryEntry], predicate: Predicate
+) -> Iterator[DictionaryEntry]:
+    "Generator yielding entries satisfying the predicate."
+    return filter(predicate, entries)
+
+
+def take(entries: Iterable[DictionaryEntry], n: int) -> Iterator[DictionaryEntry]:
+    "Generator yielding at most n first entries."
+    return islice(entries, n)
+
+
+def unique(entries: Iterable[DictionaryEntry]) -> Iterator[DictionaryEntry]:
+    "Generator yielding entries, skipping those with already seen queries."
+    seen: set[tuple[str, str]] = set()
+    for entry in entries:
+        key = entry.query_a, entry.query_b
+        if key not in seen:
+            seen.add(key)
+            yield entry
+
+
+def matching(expression: str) -> Predicate:
+    """Create a predicate checking if the entry matches the filter expression.
+
+    The expression means the same as in `Dictionary.filter`, but entries are
+    checked one by one, so a stream is filtered without indexing it.
+
+    Raises
+    ----------
+    FilterExpressionError
+        If the expression can't be parsed.
+    """
+    return compile_filter(expression)
+
+
+def has_hint(entry: DictionaryEntry) -> bool:
+    "Check if the entry has a hint in any of the languages, as `hint` does."
+    return entry.has_hint
+
+
+def is_phrase(entry: DictionaryEntry) -> bool:
+    "Check if any alternative consists of several words, as `phrase` does."
+    return any(" " in text for text in entry_texts(entry))
+
+
+def contains_any(letters: str) -> Predicate:
+    """Create a predicate checking if words of the entry contain any of letters.
+
+    Words of both languages are checked ignoring case, as `has:<letters>`
+    does.
+
+    Parameters
+    ----------
+    letters : str
+        Letters to look for, e.g. "ğşı".
+
+    Returns
+    ----------
+    predicate : Callable[[DictionaryEntry], bool]
+        The predicate.
+    """
+    return EntryMatcher().feature(f"has:{letters}")
+
+
+def length_between(low: int, high: int) -> Predicate:
+    """Create a predicate checking the length of the entry, as `len:` does.
+
+    The predicate is true if the shortest word in language A has from low to
+    high letters.
+    """
+    return EntryMatcher().feature(f"len:{low}-{high}")
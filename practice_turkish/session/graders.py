@@ -0,0 +1,58 @@
+from typing import Iterable, Iterator
+
+from practice_turkish.languages import Language
+from practice_turkish.languages.morphology import same_lemma
+from practice_turkish.profiling import profiler
+from practice_turkish.session.pipeline import Grader, Outcome, Response
+
+
+def grade(
+    responses: Iterable[Response], grader: Grader, inflections: bool = False
+) -> Iterator[Outcome]:
+    """Generator grading each answer as soon as it's given.
+
+    If `inflections` is True, answers the grader rejects are accepted as the
+    right word in a wrong form when `inflection_grader` accepts them.
+    """
+    for response in responses:
+        if grader(response):
+            yield Outcome(response, True)
+        elif inflections and inflection_grader(response):
+            yield Outcome(response, True, inflected=True)
+        else:
+            yield Outcome(response, False)
+
+
+def exact_grader(response: Response) -> bool:
+    "Check if the typed in answer is one of alternatives of the entry."
+    question = response.question
+    return question.entry.check_translation(question.a2b, response.text)
+
+
+def choice_grader(response: Response) -> bool:
+    "Check if the picked option is the entry of the question."
+    return response.chosen is response.question.entry
+
+
+def default_grader(response: Response) -> bool:
+    "Grade a picked option by its entry and a typed in answer by its text."
+    if response.chosen is not None:
+        return choice_grader(response)
+    return exact_grader(response)
+
+
+@profiler.timed("inflection_grader")
+def inflection_grader(response: Response) -> bool:
+    """Check if the typed in answer is a form of one of alternatives of the entry.
+
+    Only Turkish answers are checked, by stems of the last words of the
+    answer and the alternative, e.g. "evlerde" for "ev" or "gidiyorum" for
+    "gitmek", see `same_lemma`.
+    """
+    question = response.question
+    if response.chosen is not None or question.language != Language.turkish:
+        return False
+    entry = question.entry
+    target = entry.words_b if question.a2b else entry.words_a
+    answer = response.text.strip()
+    return bool(answer) and any(same_lemma(answer, word) for word in target)
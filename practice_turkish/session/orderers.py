@@ -0,0 +1,86 @@
+from random import Random
+from typing import Iterable, Iterator, Optional
+
+from practice_turkish.dictionaries import (
+    Dictionary,
+    DictionaryEntry,
+    DictionaryFormatError,
+)
+from practice_turkish.dictionaries.adaptive import AdaptiveDictionary
+
+
+def in_order(entries: Iterable[DictionaryEntry]) -> Iterator[DictionaryEntry]:
+    "Generator yielding entries in the order they come, e.g. as in the file."
+    yield from entries
+
+
+def shuffled(
+    entries: Iterable[DictionaryEntry], seed: Optional[int] = None
+) -> Iterator[DictionaryEntry]:
+    """Generator yielding entries in random order.
+
+    Unlike other stages, it has to consume all entries before yielding the
+    first one.
+    """
+    collected = list(entries)
+    Random(seed).shuffle(collected)
+    yield from collected
+
+
+def windowed_shuffle(
+    entries: Iterable[DictionaryEntry], window: int, seed: Optional[int] = None
+) -> Iterator[DictionaryEntry]:
+    """Generator yielding entries in random order, keeping at most window of them.
+
+    Each yielded entry is picked at random from the next `window` entries, so
+    entries are only shuffled locally, but arbitrarily long streams are
+    shuffled in constant memory.
+    """
+    rng = Random(seed)
+    buffer: list[DictionaryEntry] = []
+    for entry in entries:
+        buffer.append(entry)
+        if len(buffer) >= window:
+            i = rng.randrange(len(buffer))
+            buffer[i], buffer[-1] = buffer[-1], buffer[i]
+            yield buffer.pop()
+    rng.shuffle(buffer)
+    yield from buffer
+
+
+def adaptive(
+    entries: Iterable[DictionaryEntry],
+    path: str,
+    n_questions: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> AdaptiveDictionary[DictionaryEntry]:
+    """Order entries focusing on mistakes, see `AdaptiveDictionary`.
+
+    All entries are collected, since any of them can be drawn at any time.
+    Pass the result to `AdaptiveSink` to update and save weights of entries.
+
+    Parameters
+    ----------
+    entries : Iterable[DictionaryEntry]
+        Entries of the dictionary file. All of them share the same languages.
+    path : str
+        A string representing a path to the dictionary file.
+    n_questions : Optional[int]
+        The number of questions, the number of entries by default.
+    seed : Optional[int]
+        Seed of the random number generator drawing questions.
+
+    Raises
+    ----------
+    DictionaryFormatError
+        If there are no entries.
+    """
+    if isinstance(entries, Dictionary):
+        dictionary = entries
+    else:
+        collected = list(entries)
+        if not collected:
+            raise DictionaryFormatError("The dictionary is empty.")
+        first = collected[0]
+        dictionary = Dictionary(collected, first.language_a, first.language_b)
+    return AdaptiveDictionary(dictionary, path, n_questions, seed)
@@ -0,0 +1,136 @@
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import DictionaryEntry
+from practice_turkish.dictionaries.watch import WatchedDictionary
+from practice_turkish.output import output
+
+
+@dataclass
+class Question:
+    """A class used to represent a question asked during a session.
+
+    Attributes
+    ----------
+    entry : DictionaryEntry
+        The practiced dictionary entry.
+    a2b : bool
+        True, if the entry is translated from language A to language B.
+    options : Optional[list[DictionaryEntry]]
+        Options of a choice question, if picked in advance.
+    choices : Optional[list[Any]]
+        Options rendered for the prompt, if built in advance.
+
+    The query and the expected answer are formatted once, so preparing a
+    question in advance (see `prefetch`) saves formatting them later.
+    """
+
+    entry: DictionaryEntry
+    a2b: bool
+    options: Optional[list[DictionaryEntry]] = field(default=None, repr=False)
+    choices: Optional[list[Any]] = field(default=None, repr=False)
+
+    @cached_property
+    def query(self) -> str:
+        "The query shown to the user."
+        return self.entry.query_a if self.a2b else self.entry.query_b
+
+    @cached_property
+    def expected(self) -> str:
+        "The correct translation as written in the dictionary."
+        return self.entry.query_b if self.a2b else self.entry.query_a
+
+    @property
+    def language(self) -> Language:
+        "The language of the answer."
+        return self.entry.language_b if self.a2b else self.entry.language_a
+
+    def prepare(self) -> None:
+        "Format the query and the expected answer now rather than when asked."
+        _ = self.query, self.expected
+
+
+@dataclass
+class Response:
+    """A class used to represent an answer of the user to a question.
+
+    Attributes
+    ----------
+    question : Question
+        The answered question.
+    text : str
+        The answer typed in or the option picked by the user.
+    chosen : Optional[DictionaryEntry]
+        The entry of the picked option, None if the answer was typed in.
+    """
+
+    question: Question
+    text: str
+    chosen: Optional[DictionaryEntry] = None
+
+
+@dataclass
+class Outcome:
+    """A class used to represent a graded answer.
+
+    Attributes
+    ----------
+    response : Response
+        The answer of the user.
+    is_correct : bool
+        True, if the answer is correct.
+    inflected : bool
+        True, if the answer is accepted as the right word in a wrong form.
+    """
+
+    response: Response
+    is_correct: bool
+    inflected: bool = False
+
+    @property
+    def question(self) -> Question:
+        "The answered question."
+        return self.response.question
+
+    @property
+    def entry(self) -> DictionaryEntry:
+        "The practiced dictionary entry."
+        return self.response.question.entry
+
+
+Asker = Callable[[Question], Response]
+Preparer = Callable[[Question], Question]
+Grader = Callable[[Response], bool]
+
+
+def make_questions(entries: Iterable[DictionaryEntry], a2b: bool) -> Iterator[Question]:
+    "Generator yielding a question for each entry."
+    for entry in entries:
+        yield Question(entry, a2b)
+
+
+def make_live_questions(
+    dictionary: WatchedDictionary[DictionaryEntry], a2b: bool
+) -> Iterator[Question]:
+    """Generator yielding a question for each entry, following edits of the file.
+
+    Before each question the file is checked for changes. Added entries are
+    asked after the remaining ones, modified entries are asked in their new
+    form, and removed entries aren't asked.
+    """
+    pending = deque(dictionary.entries)
+    while True:
+        changes = dictionary.refresh()
+        if changes is not None:
+            pending = deque(changes.apply(pending))
+            output.line(("Dictionary changed", "yellow"), f": {changes.describe()}.")
+            if changes.invalid:
+                lines = ", ".join(map(str, changes.invalid))
+                what = "line" if len(changes.invalid) == 1 else "lines"
+                output.line(("Skipped", "red"), f" {what} {lines}, fix to practice.")
+        if not pending:
+            return
+        yield Question(pending.popleft(), a2b)
@@ -0,0 +1,100 @@
+from queue import Empty, Full, Queue
+from typing import Any, Iterable, Iterator
+import threading
+
+from practice_turkish.profiling import profiler
+from practice_turkish.session.pipeline import Preparer, Question
+
+DEFAULT_DEPTH = 3
+POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+class _Failure:
+    "An exception raised by the worker, re-raised by the consumer."
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch(
+    questions: Iterable[Question], prepare: Preparer, depth: int = DEFAULT_DEPTH
+) -> Iterator[Question]:
+    """Generator preparing the next questions on a worker thread.
+
+    While the user thinks over the current question, a worker thread draws
+    the following ones from `questions`, e.g. decodes entries and samples
+    options of choice questions, and prepares them with `prepare`, so the
+    next prompt is shown without a delay. At most `depth` prepared questions
+    wait in a queue.
+
+    The stage must only wrap sources not depending on answers to previous
+    questions, since it draws questions ahead of them.
+
+    Parameters
+    ----------
+    questions : Iterable[Question]
+        Questions to prepare, drawn on the worker thread.
+    prepare : Preparer
+        Function preparing a question, e.g. `prepare_typing`.
+    depth : int
+        The number of questions prepared ahead. If not positive, questions
+        are passed as they are and prepared by the asker when asked.
+
+    Yields
+    ----------
+    question : Question
+        Prepared questions in the original order.
+    """
+    if depth <= 0:
+        yield from questions
+        return
+
+    prepared: Queue[Any] = Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def offer(item: Any) -> bool:
+        "Put an item into the queue unless the consumer stopped."
+        while not stop.is_set():
+            try:
+                prepared.put(item, timeout=POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def work() -> None:
+        try:
+            for question in questions:
+                with profiler.timer("prefetch"):
+                    question = prepare(question)
+                if not offer(question):
+                    return
+        except Exception as error:
+            offer(_Failure(error))
+        else:
+            offer(_END)
+
+    def take() -> Any:
+        "Get the next item, waiting with a timeout keeps Ctrl+C working on Windows."
+        while True:
+            try:
+                return prepared.get(timeout=POLL_INTERVAL)
+            except Empty:
+                continue
+
+    worker = threading.Thread(target=work, name="prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            if prepared.empty():
+                profiler.count("prefetch misses")
+            item = take()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,213 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+import csv
+import json
+import time
+
+from InquirerPy import inquirer
+
+from practice_turkish.cache import cache_path
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.adaptive import AdaptiveDictionary
+from practice_turkish.output import output
+from practice_turkish.profiling import profiler
+from practice_turkish.session.pipeline import Outcome
+
+
+class Sink(ABC):
+    """An ABC used to represent a consumer of graded answers.
+
+    Methods
+    ----------
+    def consume(self, outcome: Outcome) -> None
+        Handle a graded answer right after it's graded.
+
+    def close(self) -> None
+        Finish handling after the last answer.
+    """
+
+    @abstractmethod
+    def consume(self, outcome: Outcome) -> None:
+        "Handle a graded answer right after it's graded."
+        raise NotImplementedError
+
+    def close(self) -> None:
+        "Finish handling after the last answer."
+
+
+class FeedbackSink(Sink):
+    "Tell the user whether each answer is correct and what the right one is."
+
+    def consume(self, outcome: Outcome) -> None:
+        expected = outcome.question.expected
+        if outcome.response.chosen is not None:
+            if outcome.is_correct:
+                output.line(("Correct!", "green"))
+            else:
+                output.line(
+                    ("Incorrect!", "red"),
+                    " Correct option was '",
+                    (expected, "green"),
+                    "'",
+                )
+            return
+        if outcome.inflected:
+            verdict = ("Right word, wrong form!", "yellow")
+        elif outcome.is_correct:
+            verdict = ("Correct!", "green")
+        else:
+            verdict = ("Incorrect!", "red")
+        output.line(
+            verdict,
+            ' In the file: "',
+            (expected, "green"),
+            '".',
+        )
+
+
+class MistakesSink(Sink):
+    "Collect entries answered wrong into a dictionary."
+
+    def __init__(self) -> None:
+        self.mistakes: Optional[Dictionary[DictionaryEntry]] = None
+        self.total = 0
+
+    def consume(self, outcome: Outcome) -> None:
+        self.total += 1
+        if outcome.is_correct:
+            return
+        entry = outcome.entry
+        if self.mistakes is None:
+            self.mistakes = Dictionary([], entry.language_a, entry.language_b)
+        self.mistakes.insert(entry)
+
+    @property
+    def n_mistakes(self) -> int:
+        "The number of wrong answers."
+        return 0 if self.mistakes is None else len(self.mistakes)
+
+
+class TableSink(MistakesSink):
+    "Print the table of mistakes and the score at the end of the session."
+
+    def close(self) -> None:
+        if self.mistakes is not None:
+            self.mistakes.print(title="Your mistakes")
+        incorrect = self.n_mistakes
+        correct = self.total - incorrect
+        output.line("Correct:   ", (f"{correct:3}", "green"), f"/{self.total}")
+        output.line("Incorrect: ", (f"{incorrect:3}", "red"), f"/{self.total}")
+
+
+class TelegramSink(MistakesSink):
+    "Offer to send mistakes to telegram at the end of the session."
+
+    def __init__(self, config: str = "config.ini") -> None:
+        super().__init__()
+        self.config = config
+
+    def close(self) -> None:
+        if self.mistakes is None:
+            return
+        output.flush()
+        if inquirer.confirm(
+            message="Send your mistakes to telegram", default=True
+        ).execute():
+            self.mistakes.send_to_telegram(self.config)
+
+
+class HistorySink(Sink):
+    """Append each answer to the history of all sessions.
+
+    The history is a JSON lines file in the cache directory, one object per
+    answer with the time, the question, the answer and whether it's correct.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = cache_path("history.jsonl") if path is None else path
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def consume(self, outcome: Outcome) -> None:
+        record = {
+            "time": time.time(),
+            "query": outcome.question.query,
+            "expected": outcome.question.expected,
+            "answer": outcome.response.text,
+            "correct": outcome.is_correct,
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CSVSink(Sink):
+    "Write each answer to a CSV file with the same separator as CSV dictionaries."
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file, delimiter=";")
+        self._writer.writerow(["query", "expected", "answer", "correct"])
+
+    def consume(self, outcome: Outcome) -> None:
+        question = outcome.question
+        self._writer.writerow(
+            [
+                question.query,
+                question.expected,
+                outcome.response.text,
+                outcome.is_correct,
+            ]
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class AdaptiveSink(Sink):
+    "Update weights of an adaptive dictionary after each answer and save them."
+
+    def __init__(self, dictionary: AdaptiveDictionary[DictionaryEntry]) -> None:
+        self.dictionary = dictionary
+
+    def consume(self, outcome: Outcome) -> None:
+        self.dictionary.record(outcome.entry, outcome.is_correct)
+
+    def close(self) -> None:
+        self.dictionary.save()
+
+
+def run(outcomes: Iterable[Outcome], sinks: Iterable[Sink]) -> int:
+    """Drive a session: pull graded answers one by one and pass them to sinks.
+
+    Pulling an outcome asks the next question, so each sink handles an answer
+    before the following question is asked, and the output is flushed before
+    it. Sinks are closed even if the session is interrupted.
+
+    Parameters
+    ----------
+    outcomes : Iterable[Outcome]
+        Graded answers, typically the last stage of a pipeline.
+    sinks : Iterable[Sink]
+        Consumers of graded answers, in the order they should handle them.
+
+    Returns
+    ----------
+    n : int
+        The number of answered questions.
+    """
+    sinks = list(sinks)
+    n = 0
+    try:
+        for outcome in outcomes:
+            n += 1
+            profiler.count("answers")
+            for sink in sinks:
+                sink.consume(outcome)
+            output.flush()
+    finally:
+        for sink in sinks:
+            sink.close()
+        output.flush()
+    return n
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from itertools import chain
+from random import Random
+from typing import Iterable, Iterator, Optional, TextIO, Type
+
+from practice_turkish.languages import Language
+from practice_turkish.dictionaries import DictionaryEntry, FileDictionaryEntry
+from practice_turkish.dictionaries.compression import open_text
+from practice_turkish.dictionaries.sampling import reservoir_sample
+
+
+@dataclass
+class EntryStream:
+    """A class used to represent entries of a dictionary read lazily.
+
+    Entries are passed through stages one by one, so only those kept by a
+    stage, e.g. to shuffle them, are held in memory.
+
+    Attributes
+    ----------
+    entries : Iterator[DictionaryEntry]
+        Entries not read yet.
+    language_a : Language
+        Language A of the entries.
+    language_b : Language
+        Language B of the entries.
+    """
+
+    entries: Iterator[DictionaryEntry]
+    language_a: Language
+    language_b: Language
+
+    def __iter__(self) -> Iterator[DictionaryEntry]:
+        return self.entries
+
+
+def from_stream(f: TextIO, type: Type[DictionaryEntry]) -> Iterator[DictionaryEntry]:
+    """Generator yielding entries parsed from an open text stream one by one.
+
+    Parameters
+    ----------
+    f : TextIO
+        A text stream with a dictionary, e.g. an open file or standard input.
+    type : Type[DictionaryEntry]
+        The type of entries of the dictionary, a `FileDictionaryEntry`.
+
+    Yields
+    ----------
+    entry : DictionaryEntry
+        Entries in the order of the stream. Only the current one is kept in
+        memory.
+    """
+    assert issubclass(type, FileDictionaryEntry)
+    records, language_a, language_b = type.read_records(f)
+    for record in records:
+        yield type.from_record(record, language_a, language_b)
+
+
+def from_file(path: str, type: Type[DictionaryEntry]) -> Iterator[DictionaryEntry]:
+    "Generator yielding entries of a dictionary file, possibly compressed."
+    with open_text(path) as f:
+        yield from from_stream(f, type)
+
+
+def from_entries(entries: Iterable[DictionaryEntry]) -> Iterator[DictionaryEntry]:
+    "Generator yielding entries of a loaded dictionary or any other iterable."
+    yield from entries
+
+
+def from_sample(
+    path: str, type: Type[DictionaryEntry], k: int, seed: Optional[int] = None
+) -> Iterator[DictionaryEntry]:
+    """Generator yielding k random entries of a dictionary file.
+
+    Raw records are sampled in one pass over the file and entries are created
+    only for the selected ones, see `Dictionary.sample_from_file`. Entries
+    keep the order of the file.
+    """
+    assert issubclass(type, FileDictionaryEntry)
+    with open_text(path) as f:
+        records, language_a, language_b = type.read_records(f)
+        selected = reservoir_sample(records, k, Random(seed))
+    for record in selected:
+        yield type.from_record(record, language_a, language_b)
+
+
+def peek(entries: Iterable[DictionaryEntry]) -> Optional[EntryStream]:
+    """Read the first entry in order to learn languages of entries.
+
+    Returns
+    ----------
+    stream : Optional[EntryStream]
+        All the entries, including the first one, with its languages. None if
+        there are no entries.
+    """
+    iterator = iter(entries)
+    first = next(iterator, None)
+    if first is None:
+        return None
+    return EntryStream(chain([first], iterator), first.language_a, first.language_b)
@@ -0,0 +1,163 @@
+from random import Random
+from typing import Optional
+
+from rich import print
+import typer
+
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.mixture import load_dictionaries, resolve_sources
+from practice_turkish.filepath import prompt_dictionary_file
+from practice_turkish.languages import Language, PrompterInTheLanguage
+from practice_turkish.languages.inflection import (
+    InflectionTable,
+    PartOfSpeech,
+    build_tables,
+    drill,
+)
+from practice_turkish.output import output
+
+
+def turkish_words(
+    dictionaries: list[Dictionary[DictionaryEntry]],
+) -> dict[str, str]:
+    """Collect Turkish words of dictionaries with their translations.
+
+    Parameters
+    ----------
+    dictionaries : list[Dictionary]
+        Loaded dictionaries, ones without Turkish are skipped.
+
+    Returns
+    ----------
+    translations : dict[str, str]
+        Translations of Turkish alternatives of entries by the alternatives.
+    """
+    translations: dict[str, str] = {}
+    for dictionary in dictionaries:
+        for entry in dictionary.entries:
+            if entry.language_a == Language.turkish:
+                words, translation = entry.words_a, entry.query_b
+            elif entry.language_b == Language.turkish:
+                words, translation = entry.words_b, entry.query_a
+            else:
+                continue
+            for word in sorted(words):
+                translations.setdefault(word, translation)
+    return translations
+
+
+def practice_form(
+    table: InflectionTable,
+    name: str,
+    translation: str,
+    prompter: PrompterInTheLanguage,
+) -> Optional[bool]:
+    """Prompt a form of a word and tell the user whether it's correct.
+
+    Parameters
+    ----------
+    table : InflectionTable
+        The table of the word.
+    name : str
+        The name of the form.
+    translation : str
+        The translation of the word shown as a hint.
+    prompter : PrompterInTheLanguage
+        The prompter in Turkish.
+
+    Returns
+    ----------
+    is_correct : Optional[bool]
+        True, if the form is correct, None if the user escaped.
+    """
+    output.line(
+        "Write ",
+        (table.word, "yellow"),
+        f" ({translation}) in the form ",
+        (name, "blue"),
+        ". Press ",
+        ("enter", "blue"),
+        " to escape.",
+    )
+    output.flush()
+    user_answer = prompter.prompt()
+    if not user_answer:
+        return None
+    if table.check(name, user_answer):
+        output.line(("Correct!", "green"))
+        return True
+    correct_answer = table.forms[name]
+    output.line(("Incorrect!", "red"), " Right answer:\n> ", (correct_answer, "green"))
+    return False
+
+
+def suffixes(
+    paths: Optional[list[str]] = typer.Argument(
+        None,
+        help="Dictionary files or directories with Turkish words. Prompted if "
+        "not given.",
+    ),
+    part_of_speech: Optional[PartOfSpeech] = typer.Option(
+        None,
+        "--only",
+        case_sensitive=False,
+        help="Drill only nouns or only verbs, both by default.",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed of the random words and forms."
+    ),
+    plain: Optional[bool] = typer.Option(
+        None,
+        "--plain/--rich",
+        help="Write feedback as plain text. Default when output isn't a terminal.",
+    ),
+) -> None:
+    """Practice session for suffixes.
+
+    Turkish words of dictionaries are inflected in plural, cases,
+    possessives and tenses following vowel harmony and consonant mutation.
+    Words ending in "-mak" or "-mek" are drilled as verbs, other words as
+    nouns. The user is asked for random forms of random words.
+
+    Parameters
+    ----------
+    paths : Optional[list[str]]
+        Paths to dictionary files or directories, a single dictionary is
+        prompted from the user if not given.
+    part_of_speech : Optional[PartOfSpeech]
+        If given, only words of this part of speech are drilled.
+    seed : Optional[int]
+        Seed of the random number generator drawing words and forms.
+    plain : Optional[bool]
+        True, if feedback should be written as plain text through a buffer,
+        False to render it with rich. Chosen by whether stdout is a terminal
+        if None.
+    """
+    if plain is not None:
+        output.use(plain)
+    if paths:
+        sources = [(path, type) for path, type, _ in resolve_sources(paths)]
+    else:
+        sources = [prompt_dictionary_file("Choose file to practice: ")]
+    translations = turkish_words(load_dictionaries(sources))
+    tables = build_tables(translations)
+    if part_of_speech is not None:
+        tables = [table for table in tables if table.part_of_speech is part_of_speech]
+    if not tables:
+        print("[red]No Turkish words to practice.[/red]")
+        raise typer.Exit(code=1)
+
+    prompter = PrompterInTheLanguage(Language.turkish)
+    for table, name in drill(tables, Random(seed)):
+        translation = translations[table.word]
+        if practice_form(table, name, translation, prompter) is None:
+            break
+
+
+def main() -> None:
+    """If open as a script, run suffixes function."""
+    typer.run(suffixes)
+
+
+if __name__ == "__main__":
+    main()
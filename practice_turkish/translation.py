@@ -1,7 +1,6 @@
 from enum import Enum
 from functools import partial
-from typing import Type, Callable
-import random
+from typing import Optional, Type
 
 from rich import print
 import typer
@@ -9,11 +8,62 @@ from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 
 from practice_turkish.languages import prompt_way_of_translation
-from practice_turkish.filepath import prompt_filepath, prompt_dictionary_type
+from practice_turkish.filepath import prompt_dictionary_file
 from practice_turkish.dictionaries import (
     Dictionary,
     DictionaryEntry,
 )
+from practice_turkish.dictionaries.adaptive import AdaptiveDictionary
+from practice_turkish.dictionaries.bitmap import FilterExpressionError
+from practice_turkish.dictionaries.watch import WatchedDictionary
+from practice_turkish.dictionaries.interning import string_pool
+from practice_turkish.output import output
+from practice_turkish.profiling import profiler
+from practice_turkish.cache import cache_path
+from practice_turkish.dictionaries.mixture import (
+    Source,
+    DictionaryMixture,
+    load_dictionaries,
+    resolve_sources,
+)
+from practice_turkish.session.prefetch import DEFAULT_DEPTH
+from practice_turkish.session import (
+    Asker,
+    EntryStream,
+    Preparer,
+    Sink,
+    AdaptiveSink,
+    CSVSink,
+    FeedbackSink,
+    HistorySink,
+    TableSink,
+    TelegramSink,
+    ask,
+    ask_choice,
+    ask_typing,
+    adaptive,
+    default_grader,
+    from_file,
+    from_sample,
+    grade,
+    make_live_questions,
+    make_questions,
+    matching,
+    peek,
+    prefetch,
+    prepare_choice,
+    prepare_typing,
+    run,
+    shuffled,
+    where,
+)
+
+Practiced = (
+    Dictionary[DictionaryEntry]
+    | DictionaryMixture[DictionaryEntry]
+    | AdaptiveDictionary[DictionaryEntry]
+    | EntryStream
+)
 
 
 class AnswerType(str, Enum):
@@ -31,19 +81,38 @@ class AnswerType(str, Enum):
     CHOICE = "CHOICE"
 
 
-def prompt_shuffle() -> bool:
-    """Prompt the user whether to shuffle the dictionary or not.
+class Order(str, Enum):
+    """An enum used to represent the order of questions.
+
+    Values
+    ----------
+    FILE
+        Entries are asked once each, as they are in the file.
+    SHUFFLED
+        Entries are asked once each, in random order.
+    ADAPTIVE
+        Entries are drawn at random, those with more mistakes more often.
+    """
+
+    FILE = "FILE"
+    SHUFFLED = "SHUFFLED"
+    ADAPTIVE = "ADAPTIVE"
+
+
+def prompt_order() -> Order:
+    """Prompt the user to pick the order of questions.
 
     Returns
     ----------
-    x : bool
-        True if user chooses to shuffle, False otherwise.
+    order : Order
+        Order.FILE, Order.SHUFFLED or Order.ADAPTIVE.
     """
     return inquirer.select(
         message="What order of questions would you prefer?",
         choices=[
-            Choice(value=True, name="Shuffled order"),
-            Choice(value=False, name="As it is in the file"),
+            Choice(value=Order.SHUFFLED, name="Shuffled order"),
+            Choice(value=Order.FILE, name="As it is in the file"),
+            Choice(value=Order.ADAPTIVE, name="Focus on my mistakes"),
         ],
     ).execute()
 
@@ -60,161 +129,396 @@ def prompt_answer_type() -> AnswerType:
     ).execute()
 
 
-def answer_with_prompt(entry: DictionaryEntry, a2b: bool) -> bool:
-    """Prompt an answer from the user by typing it in, and check its correctness.
+def stream_practiced(
+    path: str,
+    type: Type[DictionaryEntry],
+    n_questions: Optional[int] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    order: Optional[Order] = None,
+    filter_expression: Optional[str] = None,
+) -> EntryStream | AdaptiveDictionary[DictionaryEntry]:
+    """Read a single dictionary file through lazy stages.
 
-    Prompt the user to translate a dictionary item by typing a translation
-    in console, and check if the translation is correct.
+    The source stage reads entries of the file one by one, or a sample of
+    them in one pass, the filter stage drops entries not matching the
+    expression, and the order stage passes entries on as they come. Entries
+    are collected only to shuffle them or to draw them according to mistakes.
 
     Parameters
     ----------
-    entry : DictionaryEntry
-        The dictionary entry to be practiced.
-    a2b : bool
-        True, if translation should be checked from language a to language b.
-        False, otherwise.
+    path : str
+        A string representing a path to the dictionary file.
+    type : Type[DictionaryEntry]
+        Type of entries of the dictionary.
+    n_questions : Optional[int]
+        The number of questions drawn with ADAPTIVE order.
+    sample : Optional[int]
+        If given, only this number of random entries is read from the file.
+    seed : Optional[int]
+        Seed of the random sample and of the order of questions.
+    order : Optional[Order]
+        The order of questions, prompted if not given.
+    filter_expression : Optional[str]
+        If given, only entries matching the expression are practiced.
 
     Returns
     ----------
-    is_correct : bool
-        True if translation is correct, False otherwise.
+    entries : EntryStream | AdaptiveDictionary
+        Entries read lazily with their languages, or a dictionary with
+        questions drawn according to mistakes.
     """
-    answer = entry.prompt_translation(a2b)
-    is_correct = entry.check_translation(a2b, answer)
-    correct_translation = entry.query_b if a2b else entry.query_a
-    if is_correct:
-        print("[green]Correct![/green]", end=" ")
+    if sample is None:
+        entries = from_file(path, type)
     else:
-        print("[red]Incorrect![/red]", end=" ")
-    print(f'In the file: "[green]{correct_translation}[/green]".')
-    return is_correct
-
-
-def answer_with_choice(
-    the_entry: DictionaryEntry,
-    dictionary: Dictionary[DictionaryEntry],
-    a2b: bool,
-    n_choices: int = 4,
-) -> bool:
-    """Prompt an answer from the user by picking from several options, check its correctness.
-
-    Prompt the user to translate a dictionary item by picking an answer from
-    list of `n_choices` options, and check if the user picked the correct one.
+        entries = from_sample(path, type, sample, seed)
+    if filter_expression is not None:
+        entries = where(entries, matching(filter_expression))
+    stream = peek(entries)
+    if stream is None:
+        if filter_expression is None:
+            print(f"[red]No entries in[/red] [yellow]{path}[/yellow].")
+        else:
+            print(f"[red]No entries match[/red] [yellow]{filter_expression}[/yellow].")
+        raise typer.Exit(code=1)
+
+    match order or prompt_order():
+        case Order.SHUFFLED:
+            stream.entries = shuffled(stream.entries, seed)
+        case Order.ADAPTIVE:
+            return adaptive(stream.entries, path, n_questions, seed)
+    return stream
+
+
+def load_practiced(
+    paths: Optional[list[str]],
+    n_questions: Optional[int] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    order: Optional[Order] = None,
+    filter_expression: Optional[str] = None,
+    watch: bool = False,
+) -> Practiced:
+    """Load dictionaries to practice.
+
+    If no paths are given, a single dictionary file is prompted from the user.
+    A single file is read lazily, see `stream_practiced`, unless it's
+    watched. Several files or directories are loaded in parallel and merged
+    into a mixture of dictionaries. The order of questions of a single
+    dictionary is prompted unless given.
 
     Parameters
     ----------
-    the_entry : DictionaryEntry
-        The dictionary entry to be practiced.
-    dictionary : Dictionary
-        The dictionary other options will be sampled from.
-    a2b : bool
-        True, if translation should be checked from language a to language b.
-        False, otherwise.
-    n_choices : int
-        The number of options to pick from, default is 4.
+    paths : Optional[list[str]]
+        Paths to dictionary files or directories, optionally followed by
+        "=weight".
+    n_questions : Optional[int]
+        The number of questions drawn from a mixture of dictionaries.
+    sample : Optional[int]
+        If given, only this number of random entries is loaded from each file.
+    seed : Optional[int]
+        Seed of the random number generator used to sample entries.
+    order : Optional[Order]
+        The order of questions of a single dictionary.
+    filter_expression : Optional[str]
+        If given, only entries matching the expression are practiced, see
+        `Dictionary.filter`. Dictionaries left without entries are skipped.
+    watch : bool
+        True, if a single dictionary file should be followed for changes,
+        see `WatchedDictionary`.
 
     Returns
     ----------
-    is_correct : bool
-        True if translation is correct, False otherwise.
+    dictionary : Dictionary | DictionaryMixture | AdaptiveDictionary | EntryStream
+        Loaded dictionary, a mixture of dictionaries, a dictionary with
+        questions drawn according to mistakes, or entries read lazily.
     """
-    query = the_entry.query_a if a2b else the_entry.query_b
-    incorrect_options = random.sample(dictionary.entries, k=n_choices)
-    incorrect_options = [
-        entry for entry in incorrect_options if entry is not the_entry]
-    options = [the_entry] + incorrect_options[: n_choices - 1]
-    random.shuffle(options)
-    choices = [
-        Choice(value=i, name=o.query_b if a2b else o.query_a)
-        for i, o in enumerate(options)
-    ]
-
-    i = inquirer.select(message=f"{query} ⇨ ", choices=choices).execute()
-
-    choice = options[i]
-    if choice is the_entry:
-        print("[green]Correct![/green]")
-        return True
-    correct_answer = the_entry.query_b if a2b else the_entry.query_a
+    if not paths:
+        path, dictionary_entry_type = prompt_dictionary_file(
+            "Choose file to practice: "
+        )
+        sources: list[Source] = [(path, dictionary_entry_type, None)]
+    else:
+        sources = resolve_sources(paths)
+
+    if len(sources) == 1 and not watch:
+        path, type, _ = sources[0]
+        return stream_practiced(
+            path, type, n_questions, sample, seed, order, filter_expression
+        )
+    if watch:
+        if len(sources) != 1 or sample is not None:
+            print(
+                "[red]--watch works with a single dictionary file "
+                "without --sample.[/red]"
+            )
+            raise typer.Exit(code=2)
+        path, type, _ = sources[0]
+        dictionaries: list[Dictionary[DictionaryEntry]] = [
+            WatchedDictionary.watch(path, type)
+        ]
+    else:
+        dictionaries = load_dictionaries(
+            [(path, type) for path, type, _ in sources], sample=sample, seed=seed
+        )
+    if filter_expression is not None:
+        filtered = [
+            (source, dictionary.filter(filter_expression))
+            for source, dictionary in zip(sources, dictionaries)
+        ]
+        filtered = [(source, d) for source, d in filtered if len(d) > 0]
+        if not filtered:
+            print(f"[red]No entries match[/red] [yellow]{filter_expression}[/yellow].")
+            raise typer.Exit(code=1)
+        sources = [source for source, _ in filtered]
+        dictionaries = [dictionary for _, dictionary in filtered]
+    if len(dictionaries) == 1:
+        dictionary = dictionaries[0]
+        match order or prompt_order():
+            case Order.SHUFFLED:
+                dictionary.shuffle()
+            case Order.ADAPTIVE:
+                path = sources[0][0]
+                return AdaptiveDictionary(dictionary, path, n_questions, seed)
+        return dictionary
+
+    weights = [weight for _, _, weight in sources]
+    mixture = DictionaryMixture(dictionaries, weights, n_questions)
     print(
-        f"[red]Incorrect![/red] Correct option was '[green]{correct_answer}[/green]'")
-    return False
-
-
-def prepare_session() -> (
-    tuple[Dictionary[DictionaryEntry], Callable[[DictionaryEntry], bool]]
-):
+        f"Loaded [yellow]{len(mixture.dictionaries)}[/yellow] dictionaries: "
+        f"{string_pool.describe()}."
+    )
+    return mixture
+
+
+def prepare_session(
+    paths: Optional[list[str]] = None,
+    n_questions: Optional[int] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    order: Optional[Order] = None,
+    filter_expression: Optional[str] = None,
+    watch: bool = False,
+) -> tuple[Practiced, bool, Asker, Preparer]:
     """Prepare translation session.
 
-    1) Prompts dictionary type, path to it and then loads it.
-    2) Prompts form of answering, and prepares answer function
+    1) Prompts path to a dictionary, detects its type and then loads it,
+    unless paths to dictionaries are given.
+    2) Prompts the way of translation and form of answering, and prepares the
+    asker stage of the session and the function preparing its questions.
+
+    Parameters
+    ----------
+    paths : Optional[list[str]]
+        Paths to dictionary files or directories, see `load_practiced`.
+    n_questions : Optional[int]
+        The number of questions drawn from a mixture of dictionaries.
+    sample : Optional[int]
+        If given, only this number of random entries is loaded from each file.
+    seed : Optional[int]
+        Seed of the random number generator used to sample entries.
+    order : Optional[Order]
+        The order of questions of a single dictionary, prompted if not given.
+    filter_expression : Optional[str]
+        If given, only entries matching the expression are practiced.
+    watch : bool
+        True, if a single dictionary file should be followed for changes.
 
     Returns
     ----------
-    dictionary: Dictionary
-        Loaded dictionary.
-    answer_function: Callable[[DictionaryEntry], bool]
-        Function taking in a dictionary entry, prompting user to translate it
-        and returning boolean value indicating if the given translation is
-        correct.
+    dictionary: Dictionary | DictionaryMixture | AdaptiveDictionary | EntryStream
+        Loaded dictionary, a mixture of dictionaries, or entries read lazily.
+        Entries read lazily are collected to pick options of choice questions.
+    a2b : bool
+        True, if entries are translated from language A to language B.
+    asker: Callable[[Question], Response]
+        Function prompting the user to answer a question.
+    preparer: Callable[[Question], Question]
+        Function preparing a question for the asker in advance.
     """
-    dictionary_entry_type = prompt_dictionary_type()
-    path = prompt_filepath(
-        message="Choose file to practice: ",
-        is_file=True,
-        extension=dictionary_entry_type.extension(),
-        directory=dictionary_entry_type.default_directory(),
+    dictionary = load_practiced(
+        paths, n_questions, sample, seed, order, filter_expression, watch
     )
-    dictionary = Dictionary.from_file(path, dictionary_entry_type)
-    if prompt_shuffle():
-        dictionary.shuffle()
 
-    a2b = prompt_way_of_translation(
-        dictionary.language_a, dictionary.language_b)
-    match prompt_answer_type():
+    with profiler.timer("prompt_way_of_translation"):
+        a2b = prompt_way_of_translation(
+            dictionary.language_a, dictionary.language_b)
+    with profiler.timer("prompt_answer_type"):
+        answer_type = prompt_answer_type()
+    asker: Asker
+    preparer: Preparer
+    match answer_type:
         case AnswerType.TYPING:
-            answer_function = partial(answer_with_prompt, a2b=a2b)
+            asker = ask_typing
+            preparer = prepare_typing
         case AnswerType.CHOICE:
-            answer_function = partial(
-                answer_with_choice, a2b=a2b, dictionary=dictionary
-            )
+            if isinstance(dictionary, EntryStream):
+                # Options are picked among all practiced entries.
+                dictionary = Dictionary(
+                    list(dictionary), dictionary.language_a, dictionary.language_b
+                )
+            asker = partial(ask_choice, pool=dictionary)
+            preparer = partial(prepare_choice, pool=dictionary)
 
-    return dictionary, answer_function
+    return dictionary, a2b, asker, preparer
 
 
 def translation(
+    paths: Optional[list[str]] = typer.Argument(
+        None,
+        help="Dictionary files or directories to practice, each optionally "
+        "followed by '=weight'. Prompted if not given.",
+    ),
+    n_questions: Optional[int] = typer.Option(
+        None,
+        "--questions",
+        help="Number of questions drawn from several dictionaries.",
+    ),
+    sample: Optional[int] = typer.Option(
+        None,
+        "--sample",
+        help="Practice only this number of random entries from each file.",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed of the random sample."
+    ),
+    order: Optional[Order] = typer.Option(
+        None,
+        "--order",
+        case_sensitive=False,
+        help="Order of questions of a single dictionary. Prompted if not given.",
+    ),
+    filter_expression: Optional[str] = typer.Option(
+        None,
+        "--filter",
+        help="Practice only entries matching the expression, e.g. "
+        "'hint & !phrase', 'has:ğşı' or 'len:3-6'.",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="Follow edits of the dictionary file during the session.",
+    ),
+    inflections: bool = typer.Option(
+        False,
+        "--inflections",
+        help="Accept Turkish words in another form as the right word in a "
+        "wrong form, e.g. 'evler' for 'ev'.",
+    ),
+    history: bool = typer.Option(
+        False, "--history", help="Append your answers to the history of sessions."
+    ),
+    log: Optional[str] = typer.Option(
+        None, "--log", help="Write your answers to a CSV file."
+    ),
     config: str = typer.Option(
         "config.ini", "--config", help="Path to your configuration file."
-    )
+    ),
+    depth: int = typer.Option(
+        DEFAULT_DEPTH,
+        "--prefetch",
+        help="Number of questions prepared in background, 0 to turn it off.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Time phases of the session, print a summary and write a trace.",
+    ),
+    plain: Optional[bool] = typer.Option(
+        None,
+        "--plain/--rich",
+        help="Write feedback as plain text. Default when output isn't a terminal.",
+    ),
 ) -> None:
     """Run a translation session based on a dictionary.
 
+    The session is a pipeline of lazy stages: entries of the dictionary are
+    turned into questions, asked, graded, and each graded answer is passed to
+    sinks before the next question is asked.
+
     Parameters
     ----------
+    paths : Optional[list[str]]
+        Paths to dictionary files or directories. Several dictionaries are
+        practiced in one session with questions drawn by weighted sampling.
+        A single dictionary is prompted from the user if not given.
+    n_questions : Optional[int]
+        The number of questions drawn from several dictionaries, the total
+        number of entries by default.
+    sample : Optional[int]
+        If given, only this number of random entries is read from each file
+        in one pass over it.
+    seed : Optional[int]
+        Seed of the random number generator used to sample entries.
+    order : Optional[Order]
+        The order of questions of a single dictionary. With ADAPTIVE order
+        entries answered wrong are asked more often, in this session and
+        the following ones.
+    filter_expression : Optional[str]
+        If given, only entries matching the expression are practiced.
+        Features "hint", "phrase", "has:<letters>" and "len:<low>-<high>"
+        are combined with "&", "|", "!" and parenthesis.
+    watch : bool
+        True, if the dictionary file should be checked for edits before each
+        question. Only changed lines are parsed again, new and edited entries
+        join the session, removed ones leave it. Works with a single file
+        without `sample`, ignored with ADAPTIVE order.
+    inflections : bool
+        True, if a typed in Turkish answer rejected as it is should be
+        accepted when it's an alternative with other suffixes, e.g.
+        "gidiyorum" for "gitmek". Such answers are marked as the right word
+        in a wrong form and aren't counted as mistakes.
+    history : bool
+        True, if answers should be appended to the history of sessions in
+        the cache directory.
+    log : Optional[str]
+        A path to a CSV file to write answers to, if given.
     config : str
         A string representing path to your configuration file, default is
         'config.ini'.
+    depth : int
+        The number of questions prepared on a worker thread while the user
+        answers the current one. Ignored with ADAPTIVE order, since the next
+        question depends on the answer, and with `watch`, since questions
+        depend on the file.
+    profile : bool
+        True, if phases of the session should be timed. A summary table is
+        printed at exit and a Chrome trace is written to the cache directory.
+    plain : Optional[bool]
+        True, if feedback, tables and the score should be written as plain
+        text through a buffer, False to render them with rich. Chosen by
+        whether stdout is a terminal if None.
     """
-    dictionary, answer_function = prepare_session()
-    mistakes: Dictionary[DictionaryEntry] = Dictionary(
-        [], dictionary.language_a, dictionary.language_b
-    )
-    for entry in dictionary:
-        is_correct = answer_function(entry)
-        if not is_correct:
-            mistakes.insert(entry)
-
-    mistakes.print(title="Your mistakes")
-    total = len(dictionary)
-    incorrect = len(mistakes)
-    correct = total - incorrect
-    print(f"Correct:   [green]{correct:3}[/green]/{total}")
-    print(f"Incorrect: [red]{incorrect:3}[/red]/{total}")
-    if mistakes:
-        if inquirer.confirm(
-            message="Send your mistakes to telegram", default=True
-        ).execute():
-            mistakes.send_to_telegram(config)
+    if plain is not None:
+        output.use(plain)
+    if profile:
+        profiler.enable()
+    try:
+        try:
+            dictionary, a2b, asker, preparer = prepare_session(
+                paths, n_questions, sample, seed, order, filter_expression, watch
+            )
+        except FilterExpressionError as error:
+            print(f"[red]Invalid filter[/red]: [yellow]{error}[/yellow]")
+            raise typer.Exit(code=2)
+        sinks: list[Sink] = [FeedbackSink(), TableSink(), TelegramSink(config)]
+        if isinstance(dictionary, AdaptiveDictionary):
+            sinks.append(AdaptiveSink(dictionary))
+        if history:
+            sinks.append(HistorySink())
+        if log is not None:
+            sinks.append(CSVSink(log))
+
+        if isinstance(dictionary, WatchedDictionary):
+            questions = make_live_questions(dictionary, a2b)
+        else:
+            questions = make_questions(dictionary, a2b)
+            if not isinstance(dictionary, AdaptiveDictionary):
+                questions = prefetch(questions, preparer, depth)
+        run(grade(ask(questions, asker), default_grader, inflections), sinks)
+    finally:
+        if profile:
+            profiler.report(cache_path("profile.json"))
 
 
 def main() -> None:
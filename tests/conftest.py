@@ -0,0 +1,13 @@
+import pytest
+
+from benchmarks.generator import write_csv
+
+N_ENTRIES = 2000
+
+
+@pytest.fixture(scope="session")
+def csv_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    "A synthetic CSV dictionary shared by tests, which mustn't modify it."
+    path = tmp_path_factory.mktemp("dictionaries") / "dictionary.csv"
+    write_csv(str(path), N_ENTRIES)
+    return str(path)
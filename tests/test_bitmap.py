@@ -0,0 +1,142 @@
+from typing import Callable
+
+import pytest
+
+from practice_turkish.dictionaries.bitmap import (
+    BitmapIndex,
+    FilterExpressionError,
+    compile_filter,
+    from_flags,
+    iterate_bits,
+)
+from practice_turkish.dictionaries.csvdictionary import CSVDictionaryEntry
+from practice_turkish.dictionaries.dictionary import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.duplicates import normalize_word
+from practice_turkish.languages import Language
+
+
+def words(entry: DictionaryEntry) -> list[str]:
+    "Normalized words of the entry in both languages."
+    return [normalize_word(w, entry.language_a) for w in entry.words_a] + [
+        normalize_word(w, entry.language_b) for w in entry.words_b
+    ]
+
+
+def hint(entry: DictionaryEntry) -> bool:
+    return entry.has_hint
+
+
+def phrase(entry: DictionaryEntry) -> bool:
+    return any(" " in word for word in words(entry))
+
+
+def has(letters: str) -> Callable[[DictionaryEntry], bool]:
+    return lambda entry: any(
+        letter in word for word in words(entry) for letter in letters
+    )
+
+
+def length(entry: DictionaryEntry) -> int:
+    return min(len(word) for word in entry.words_a)
+
+
+# Filter expressions and the same conditions checked entry by entry.
+EXPRESSIONS: list[tuple[str, Callable[[DictionaryEntry], bool]]] = [
+    ("hint", hint),
+    ("phrase", phrase),
+    ("!hint", lambda e: not hint(e)),
+    ("not phrase", lambda e: not phrase(e)),
+    ("hint & !phrase", lambda e: hint(e) and not phrase(e)),
+    ("hint and phrase", lambda e: hint(e) and phrase(e)),
+    ("hint | phrase", lambda e: hint(e) or phrase(e)),
+    ("has:ğ", has("ğ")),
+    ("has:ĞŞ", has("ğş")),
+    ("has:ж", has("ж")),
+    ("has:q", has("q")),
+    ("len:3", lambda e: length(e) == 3),
+    ("len:3-6", lambda e: 3 <= length(e) <= 6),
+    ("len:-4", lambda e: length(e) <= 4),
+    ("len:10-", lambda e: length(e) >= 10),
+    ("has:ğş | len:-4", lambda e: has("ğş")(e) or length(e) <= 4),
+    ("hint | phrase & has:ü", lambda e: hint(e) or (phrase(e) and has("ü")(e))),
+    ("(hint | phrase) & has:ü", lambda e: (hint(e) or phrase(e)) and has("ü")(e)),
+    ("!!hint", hint),
+    ("~(hint | len:-5)", lambda e: not (hint(e) or length(e) <= 5)),
+    ("hint & !hint", lambda e: False),
+]
+
+INVALID = ["", "hint &", "& hint", "(hint", "hint)", "hint phrase", "foo", "has:"]
+
+
+@pytest.fixture(scope="module")
+def dictionary(csv_path: str) -> Dictionary:
+    return Dictionary.from_file(csv_path, CSVDictionaryEntry)
+
+
+@pytest.mark.parametrize("expression, predicate", EXPRESSIONS)
+def test_index_matches_brute_force(
+    dictionary: Dictionary,
+    expression: str,
+    predicate: Callable[[DictionaryEntry], bool],
+) -> None:
+    expected = [entry for entry in dictionary.entries if predicate(entry)]
+    index = dictionary.bitmap_index()
+    assert index.select(index.evaluate(expression)) == expected
+    assert dictionary.filter(expression).entries == expected
+
+
+@pytest.mark.parametrize("expression, predicate", EXPRESSIONS)
+def test_compiled_filter_matches_brute_force(
+    dictionary: Dictionary,
+    expression: str,
+    predicate: Callable[[DictionaryEntry], bool],
+) -> None:
+    matches = compile_filter(expression)
+    for entry in dictionary.entries:
+        assert matches(entry) == predicate(entry)
+
+
+def test_expressions_select_something(dictionary: Dictionary) -> None:
+    for expression in ["hint", "phrase", "has:ğ", "len:3"]:
+        assert 0 < len(dictionary.filter(expression)) < len(dictionary)
+
+
+@pytest.mark.parametrize("expression", INVALID + ["len:a-b"])
+def test_invalid_expressions(dictionary: Dictionary, expression: str) -> None:
+    with pytest.raises(FilterExpressionError):
+        dictionary.bitmap_index().evaluate(expression)
+
+
+@pytest.mark.parametrize("expression", INVALID)
+def test_invalid_compiled_filters(expression: str) -> None:
+    with pytest.raises(FilterExpressionError):
+        compile_filter(expression)
+
+
+def test_insert_drops_the_index(dictionary: Dictionary) -> None:
+    copy = Dictionary(
+        list(dictionary.entries), dictionary.language_a, dictionary.language_b
+    )
+    before = len(copy.filter("has:q"))
+    index = copy.bitmap_index()
+    entry = CSVDictionaryEntry(["qoq"], ["кук"], Language.turkish, Language.russian)
+    copy.insert(entry)
+    assert copy.bitmap_index() is not index
+    assert len(copy.bitmap_index()) == len(dictionary) + 1
+    filtered = copy.filter("has:q")
+    assert len(filtered) == before + 1
+    assert filtered.entries[-1] is entry
+
+
+def test_empty_index() -> None:
+    index: BitmapIndex[DictionaryEntry] = BitmapIndex([])
+    assert index.evaluate("!hint") == 0
+    assert index.select(index.evaluate("has:a | len:-3")) == []
+
+
+@pytest.mark.parametrize(
+    "flags", [b"", b"\x00", b"\x01", b"\x01\x00\x01\x01", bytes(70)]
+)
+def test_flags_round_trip(flags: bytes) -> None:
+    bits = from_flags(flags)
+    assert list(iterate_bits(bits)) == [i for i, flag in enumerate(flags) if flag]
@@ -0,0 +1,81 @@
+import csv
+import gzip
+import shutil
+from pathlib import Path
+
+import pytest
+
+from practice_turkish.dictionaries import chunked
+from practice_turkish.dictionaries.chunked import parse_in_parallel, split_byte_ranges
+from practice_turkish.dictionaries.csvdictionary import CSVDictionaryEntry
+from practice_turkish.dictionaries.dictionary import Dictionary
+
+# Small chunks, so the synthetic dictionary is split into many of them.
+CHUNK_SIZE = 1 << 12
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(chunked, "MIN_CHUNK_SIZE", CHUNK_SIZE)
+
+
+def test_ranges_cover_the_file_by_lines(csv_path: str) -> None:
+    header, ranges = split_byte_ranges(csv_path, 16)
+    data = Path(csv_path).read_bytes()
+    assert data.startswith(header)
+    assert len(ranges) == 16
+    assert ranges[0][0] == len(header)
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 1 : start] == b"\n"
+
+
+def test_small_file_is_one_range(tmp_path: Path) -> None:
+    path = tmp_path / "small.csv"
+    path.write_text("turkish;russian;;\nev;дом;;\n", encoding="utf-8")
+    _, ranges = split_byte_ranges(str(path), 16)
+    assert ranges == [(18, path.stat().st_size)]
+
+
+def test_records_in_file_order(csv_path: str) -> None:
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        header, *records = csv.reader(f, delimiter=";")
+    parsed_header, parsed = parse_in_parallel(csv_path, 4)
+    assert parsed_header == header
+    assert [list(record) for record in parsed] == records
+
+
+@pytest.mark.parametrize("processes", [2, 4])
+def test_parallel_equals_serial(csv_path: str, processes: int) -> None:
+    serial = CSVDictionaryEntry.read_dictionary_from_file(csv_path)
+    parallel = CSVDictionaryEntry.read_dictionary_from_file_in_parallel(
+        csv_path, processes
+    )
+    assert parallel == serial
+    assert len(parallel[0]) > 0
+
+
+def test_dictionary_from_file_in_parallel(csv_path: str) -> None:
+    serial = Dictionary.from_file(csv_path, CSVDictionaryEntry)
+    parallel = Dictionary.from_file(csv_path, CSVDictionaryEntry, processes=4)
+    assert parallel == serial
+
+
+def test_multiline_records_fall_back_to_serial(tmp_path: Path, csv_path: str) -> None:
+    path = tmp_path / "multiline.csv"
+    text = Path(csv_path).read_text(encoding="utf-8")
+    path.write_text(text + 'ev;"дом\nжилище";;\n', encoding="utf-8")
+    serial = CSVDictionaryEntry.read_dictionary_from_file(str(path))
+    parallel = CSVDictionaryEntry.read_dictionary_from_file_in_parallel(str(path), 4)
+    assert parallel == serial
+    assert serial[0][-1].words_b == {"дом\nжилище"}
+
+
+def test_compressed_file(tmp_path: Path, csv_path: str) -> None:
+    path = tmp_path / "dictionary.csv.gz"
+    with open(csv_path, "rb") as source, gzip.open(path, "wb") as target:
+        shutil.copyfileobj(source, target)
+    serial = CSVDictionaryEntry.read_dictionary_from_file(csv_path)
+    parallel = CSVDictionaryEntry.read_dictionary_from_file_in_parallel(str(path), 4)
+    assert parallel == serial
@@ -0,0 +1,114 @@
+from itertools import islice
+from random import Random
+
+import pytest
+
+from practice_turkish.languages.inflection import (
+    InflectionTable,
+    PartOfSpeech,
+    build_tables,
+    check_answers,
+    drill,
+    forms,
+)
+from practice_turkish.languages.morphology import same_lemma
+
+WORDS = [
+    "ev",
+    "kitap",
+    "okul",
+    "göz",
+    "kapı",
+    "renk",
+    "İstanbul",
+    "çok iyi",
+    "gitmek",
+    "gelmek",
+    "yapmak",
+    "başlamak",
+    "söylemek",
+    "yardım etmek",
+]
+
+
+@pytest.mark.parametrize(
+    "word, name, inflected",
+    [
+        ("ev", "plural, locative", "evlerde"),
+        ("ev", "my, dative", "evime"),
+        ("kitap", "accusative", "kitabı"),
+        ("kitap", "locative", "kitapta"),
+        ("kapı", "his/her, locative", "kapısında"),
+        ("kapı", "instrumental", "kapıyla"),
+        ("renk", "genitive", "rengin"),
+        ("okul", "our, ablative", "okulumuzdan"),
+        ("İstanbul", "locative", "istanbulda"),
+        ("gitmek", "present, I", "gidiyorum"),
+        ("gitmek", "past, I", "gittim"),
+        ("gelmek", "aorist, he/she", "gelir"),
+        ("yapmak", "aorist, he/she", "yapar"),
+        ("başlamak", "present, they", "başlıyorlar"),
+        ("başlamak", "future, I", "başlayacağım"),
+        ("söylemek", "present, I", "söylüyorum"),
+        ("söylemek", "aorist, I", "söylerim"),
+        ("yardım etmek", "future, you (plural)", "yardım edeceksiniz"),
+    ],
+)
+def test_forms(word: str, name: str, inflected: str) -> None:
+    table = InflectionTable.build(word)
+    assert table is not None
+    assert table.forms[name] == inflected
+
+
+@pytest.mark.parametrize(
+    "word, part_of_speech",
+    [
+        ("ev", PartOfSpeech.NOUN),
+        ("mak", PartOfSpeech.NOUN),
+        ("gitmek", PartOfSpeech.VERB),
+        ("yardım etmek", PartOfSpeech.VERB),
+    ],
+)
+def test_part_of_speech(word: str, part_of_speech: PartOfSpeech) -> None:
+    table = InflectionTable.build(word)
+    assert table is not None
+    assert table.part_of_speech is part_of_speech
+    expected = [form.name for form in forms if form.part_of_speech is part_of_speech]
+    assert list(table.forms) == expected
+
+
+@pytest.mark.parametrize("word", ["", "   ", "x", "bbb", "ev2"])
+def test_not_inflected(word: str) -> None:
+    assert InflectionTable.build(word) is None
+
+
+@pytest.mark.parametrize("word", WORDS)
+def test_forms_have_the_same_lemma(word: str) -> None:
+    table = InflectionTable.build(word)
+    assert table is not None
+    for inflected in table.forms.values():
+        assert same_lemma(inflected, word)
+
+
+def test_check_ignores_case_and_spaces() -> None:
+    table = InflectionTable.build("yardım etmek")
+    assert table is not None
+    assert table.check("past, I", "  Yardım   ETTİM ")
+    assert not table.check("past, I", "yardım ettin")
+
+
+def test_build_tables_skips_duplicates_and_uninflected() -> None:
+    tables = build_tables(["ev", "x", "ev", "gitmek"])
+    assert [table.word for table in tables] == ["ev", "gitmek"]
+
+
+def test_drill_and_check_answers() -> None:
+    tables = build_tables(WORDS)
+    drawn = list(islice(drill(tables, Random(0)), 100))
+    assert drawn == list(islice(drill(tables, Random(0)), 100))
+    assert all(name in table.forms for table, name in drawn)
+
+    right = [(table, name, table.forms[name]) for table, name in drawn]
+    assert check_answers(right) == [True] * len(drawn)
+    wrong = [(table, name, table.word + "x") for table, name in drawn]
+    assert check_answers(wrong) == [False] * len(drawn)
@@ -0,0 +1,92 @@
+import pytest
+
+from practice_turkish.languages.morphology import (
+    harmony_class,
+    lowercase,
+    realize,
+    same_lemma,
+    suffix_automaton,
+)
+
+
+@pytest.mark.parametrize(
+    "word, vowel_class",
+    [("ev", "e"), ("kapı", "a"), ("okul", "o"), ("göz", "ö"), ("saat", "a")],
+)
+def test_harmony_class(word: str, vowel_class: str) -> None:
+    assert harmony_class(word) == vowel_class
+
+
+def test_harmony_class_without_vowels() -> None:
+    assert harmony_class("str") == ""
+
+
+@pytest.mark.parametrize(
+    "chain, vowel_class, end, spelled",
+    [
+        (("lAr", "DA"), "e", "voiced", ("lerde", False)),
+        (("DA",), "a", "voiceless", ("ta", False)),
+        (("(y)I",), "a", "vowel", ("yı", False)),
+        (("(y)I",), "o", "voiced", ("u", False)),
+        (("(s)I", "nDA"), "ö", "vowel", ("sünde", False)),
+        (("~Iyor", "(y)Im"), "a", "vowel", ("ıyorum", True)),
+        (("(y)AcAk", "(y)Im"), "e", "voiced", ("eceğim", False)),
+    ],
+)
+def test_realize(
+    chain: tuple[str, ...], vowel_class: str, end: str, spelled: tuple[str, bool]
+) -> None:
+    assert realize(chain, vowel_class, end) == spelled
+
+
+def test_lowercase_keeps_dotted_and_dotless_i_apart() -> None:
+    assert lowercase("IŞIK İnek") == "ışık inek"
+
+
+@pytest.mark.parametrize(
+    "word, stem",
+    [
+        ("evlerde", "ev"),
+        ("kitabı", "kitap"),
+        ("gidiyorum", "git"),
+        ("başlıyorum", "başla"),
+    ],
+)
+def test_stems(word: str, stem: str) -> None:
+    stems = suffix_automaton().stems(word)
+    assert word in stems
+    assert stem in stems
+
+
+@pytest.mark.parametrize(
+    "answer, word",
+    [
+        ("ev", "ev"),
+        ("evlerde", "ev"),
+        ("evler", "evim"),
+        ("EVLERDE", "ev"),
+        ("kitabı", "kitap"),
+        ("rengi", "renk"),
+        ("gidiyorum", "gitmek"),
+        ("söylüyorum", "söylemek"),
+        ("başlayacağım", "başlamak"),
+        ("büyük evde", "büyük ev"),
+        ("Istanbulda", "ıstanbul"),
+    ],
+)
+def test_same_lemma(answer: str, word: str) -> None:
+    assert same_lemma(answer, word)
+
+
+@pytest.mark.parametrize(
+    "answer, word",
+    [
+        ("kedi", "ev"),
+        ("evlerde", "okul"),
+        ("küçük evde", "büyük ev"),
+        ("evde", "büyük ev"),
+        ("", "ev"),
+    ],
+)
+def test_not_same_lemma(answer: str, word: str) -> None:
+    assert not same_lemma(answer, word)
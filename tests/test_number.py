@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+from practice_turkish.number import (
+    read_decimal,
+    read_distributive,
+    read_fraction,
+    read_many,
+    read_number,
+    read_ordinal,
+    read_percentage,
+    spell_decimal,
+    spell_distributive,
+    spell_fraction,
+    spell_many,
+    spell_number,
+    spell_ordinal,
+    spell_percentage,
+)
+
+# Small numbers, every digit group boundary and a few random big numbers.
+NUMBERS = [
+    *range(1001),
+    1_001,
+    1_100,
+    10_000,
+    100_000,
+    1_000_000,
+    1_000_001,
+    1_001_000,
+    1_000_000_000,
+    10**12 - 1,
+    *random.Random(0).sample(range(10**12), 200),
+]
+
+
+@pytest.mark.parametrize(
+    "number, spelling",
+    [
+        (0, "sıfır"),
+        (6, "altı"),
+        (100, "yüz"),
+        (1_000, "bin"),
+        (1_234, "bin iki yüz otuz dört"),
+        (2_000_000, "iki milyon"),
+    ],
+)
+def test_spell_number(number: int, spelling: str) -> None:
+    assert spell_number(number) == spelling
+
+
+@pytest.mark.parametrize("number", [-1, 10**12])
+def test_spell_number_out_of_range(number: int) -> None:
+    with pytest.raises(ValueError):
+        spell_number(number)
+
+
+def test_cardinal_round_trip() -> None:
+    assert read_many(spell_many(NUMBERS)) == NUMBERS
+
+
+@pytest.mark.parametrize(
+    "number, spelling",
+    [
+        (1, "birinci"),
+        (2, "ikinci"),
+        (4, "dördüncü"),
+        (23, "yirmi üçüncü"),
+        (100, "yüzüncü"),
+    ],
+)
+def test_spell_ordinal(number: int, spelling: str) -> None:
+    assert spell_ordinal(number) == spelling
+
+
+def test_ordinal_round_trip() -> None:
+    numbers = NUMBERS[1:]
+    assert read_many(spell_many(numbers, spell_ordinal), read_ordinal) == numbers
+
+
+@pytest.mark.parametrize(
+    "number, spelling",
+    [(1, "birer"), (2, "ikişer"), (6, "altışar"), (10, "onar"), (40, "kırkar")],
+)
+def test_spell_distributive(number: int, spelling: str) -> None:
+    assert spell_distributive(number) == spelling
+
+
+def test_distributive_round_trip() -> None:
+    numbers = NUMBERS[1:]
+    spellings = spell_many(numbers, spell_distributive)
+    assert read_many(spellings, read_distributive) == numbers
+
+
+@pytest.mark.parametrize(
+    "fraction, spelling",
+    [((1, 2), "ikide bir"), ((3, 4), "dörtte üç"), ((5, 100), "yüzde beş")],
+)
+def test_spell_fraction(fraction: tuple[int, int], spelling: str) -> None:
+    assert spell_fraction(*fraction) == spelling
+
+
+def test_fraction_round_trip() -> None:
+    fractions = [
+        (numerator, denominator)
+        for denominator in range(1, 120)
+        for numerator in range(denominator + 1)
+    ]
+    for fraction in fractions:
+        assert read_fraction(spell_fraction(*fraction)) == fraction
+
+
+def test_spell_fraction_zero_denominator() -> None:
+    with pytest.raises(ValueError):
+        spell_fraction(1, 0)
+
+
+@pytest.mark.parametrize(
+    "number, spelling",
+    [
+        ("3", "üç"),
+        ("3,05", "üç virgül sıfır beş"),
+        ("0,5", "sıfır virgül beş"),
+        ("12,00", "on iki virgül sıfır sıfır"),
+    ],
+)
+def test_spell_decimal(number: str, spelling: str) -> None:
+    assert spell_decimal(number) == spelling
+
+
+@pytest.mark.parametrize("number", ["", "3,", ",5", "3.5", "-1"])
+def test_spell_decimal_invalid(number: str) -> None:
+    with pytest.raises(ValueError):
+        spell_decimal(number)
+
+
+@pytest.mark.parametrize(
+    "number", ["0", "7", "3,05", "0,5", "12,00", "99,99", "100,001", "45,120"]
+)
+def test_decimal_round_trip(number: str) -> None:
+    assert read_decimal(spell_decimal(number)) == number
+    assert read_percentage(spell_percentage(number)) == number
+
+
+def test_spell_percentage() -> None:
+    assert spell_percentage("45") == "yüzde kırk beş"
+
+
+@pytest.mark.parametrize("spelling", ["bir elma", "ikinci", "dört buçuk"])
+def test_read_number_invalid(spelling: str) -> None:
+    with pytest.raises(ValueError):
+        read_number(spelling)
@@ -0,0 +1,196 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from practice_turkish.dictionaries import Dictionary, DictionaryEntry
+from practice_turkish.dictionaries.csvdictionary import CSVDictionaryEntry
+from practice_turkish.server import HTTPError, Library, PracticeServer, Request
+
+WORDS = {"ev": "дом", "kedi": "кошка", "su": "вода"}
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> PracticeServer:
+    path = tmp_path / "words.csv"
+    lines = [f"{a};{b};;\n" for a, b in WORDS.items()]
+    path.write_text("turkish;russian;;\n" + "".join(lines), encoding="utf-8")
+    dictionary: Dictionary[DictionaryEntry] = Dictionary.from_file(
+        str(path), CSVDictionaryEntry
+    )
+    return PracticeServer(Library({"words.csv": dictionary}))
+
+
+def request(method: str, path: str, body: Any = None) -> Request:
+    "A request with the JSON body, if any."
+    encoded = b"" if body is None else json.dumps(body).encode()
+    return Request(method, path, "HTTP/1.1", body=encoded)
+
+
+def fails(server: PracticeServer, method: str, path: str, body: Any = None) -> int:
+    "The status of the error the request is answered with."
+    with pytest.raises(HTTPError) as error:
+        server.dispatch(request(method, path, body))
+    return error.value.status
+
+
+def start(server: PracticeServer, **parameters: Any) -> str:
+    "Start a session, returning its identifier."
+    status, payload = server.dispatch(
+        request("POST", "/sessions", {"dictionary": "words.csv", **parameters})
+    )
+    assert status == 201
+    return payload["session"]
+
+
+def test_dictionaries(server: PracticeServer) -> None:
+    assert server.dispatch(request("GET", "/dictionaries")) == (
+        200,
+        [
+            {
+                "name": "words.csv",
+                "size": 3,
+                "language_a": "turkish",
+                "language_b": "russian",
+            }
+        ],
+    )
+
+
+def test_session(server: PracticeServer) -> None:
+    status, payload = server.dispatch(
+        request("POST", "/sessions", {"dictionary": "words.csv", "questions": 2})
+    )
+    assert status == 201
+    identifier = payload["session"]
+    question = payload["question"]
+    assert question["number"] == 1 and question["total"] == 2
+    assert question["language"] == "russian"
+
+    status, payload = server.dispatch(
+        request("POST", f"/sessions/{identifier}/answer", {"answer": "yanlış"})
+    )
+    assert status == 200
+    assert not payload["correct"]
+    assert payload["expected"] == WORDS[question["query"]]
+    assert payload["score"] == {"answered": 1, "correct": 0}
+
+    question = payload["next"]
+    answer = {"answer": f" {WORDS[question['query']]} "}
+    _, payload = server.dispatch(
+        request("POST", f"/sessions/{identifier}/answer", answer)
+    )
+    assert payload["correct"]
+    assert payload["next"] is None
+
+    _, payload = server.dispatch(request("GET", f"/sessions/{identifier}"))
+    assert payload == {"question": None, "score": {"answered": 2, "correct": 1}}
+    _, mistakes = server.dispatch(request("GET", f"/sessions/{identifier}/mistakes"))
+    assert len(mistakes) == 1
+    assert fails(server, "POST", f"/sessions/{identifier}/answer", answer) == 400
+
+    _, payload = server.dispatch(request("DELETE", f"/sessions/{identifier}"))
+    assert payload == {"score": {"answered": 2, "correct": 1}}
+    assert fails(server, "GET", f"/sessions/{identifier}") == 404
+    assert len(server.sessions) == 0
+
+
+def test_seed_fixes_the_order(server: PracticeServer) -> None:
+    queries = []
+    for _ in range(2):
+        identifier = start(server, seed=7, a2b=False)
+        _, payload = server.dispatch(request("GET", f"/sessions/{identifier}"))
+        queries.append(payload["question"]["query"])
+    assert queries[0] == queries[1]
+    assert queries[0] in WORDS.values()
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {},
+        {"dictionary": 1},
+        {"dictionary": "words.csv", "a2b": "yes"},
+        {"dictionary": "words.csv", "questions": "2"},
+        {"dictionary": "words.csv", "questions": True},
+        {"dictionary": "words.csv", "questions": 0},
+        {"dictionary": "words.csv", "seed": 1.5},
+    ],
+)
+def test_invalid_session_parameters(
+    server: PracticeServer, parameters: dict[str, Any]
+) -> None:
+    assert fails(server, "POST", "/sessions", parameters) == 400
+
+
+@pytest.mark.parametrize("body", [b"{", b"[1, 2]", b"\xff"])
+def test_invalid_body(server: PracticeServer, body: bytes) -> None:
+    with pytest.raises(HTTPError) as error:
+        server.dispatch(Request("POST", "/sessions", "HTTP/1.1", body=body))
+    assert error.value.status == 400
+
+
+def test_invalid_answer(server: PracticeServer) -> None:
+    identifier = start(server)
+    path = f"/sessions/{identifier}/answer"
+    assert fails(server, "POST", path, {}) == 400
+    assert fails(server, "POST", path, {"answer": 1}) == 400
+
+
+@pytest.mark.parametrize(
+    "method, path, body, status",
+    [
+        ("POST", "/sessions", {"dictionary": "other.csv"}, 404),
+        ("GET", "/sessions/unknown", None, 404),
+        ("POST", "/sessions/unknown/answer", {"answer": "ev"}, 404),
+        ("GET", "/sessions/unknown/mistakes", None, 404),
+        ("DELETE", "/sessions/unknown", None, 404),
+        ("GET", "/", None, 404),
+        ("GET", "/words", None, 404),
+        ("POST", "/dictionaries", None, 405),
+        ("PUT", "/sessions", None, 405),
+        ("GET", "/sessions", None, 405),
+    ],
+)
+def test_errors(
+    server: PracticeServer, method: str, path: str, body: Any, status: int
+) -> None:
+    assert fails(server, method, path, body) == status
+
+
+async def exchange(server: PracticeServer, data: bytes) -> bytes:
+    "Send raw bytes over a connection and read the response."
+    listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(data)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+    return response
+
+
+def test_connection(server: PracticeServer) -> None:
+    data = b"GET /dictionaries HTTP/1.1\r\nConnection: close\r\n\r\n"
+    response = asyncio.run(exchange(server, data))
+    assert response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b'"words.csv"' in response
+
+
+def test_failures_are_answered_with_500(
+    server: PracticeServer,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    def fail(_: Request) -> None:
+        raise RuntimeError("Broken")
+
+    monkeypatch.setattr(server, "dispatch", fail)
+    data = b"GET /dictionaries HTTP/1.1\r\nConnection: close\r\n\r\n"
+    response = asyncio.run(exchange(server, data))
+    assert response.startswith(b"HTTP/1.1 500 Internal Server Error\r\n")
+    assert "RuntimeError: Broken" in capsys.readouterr().err
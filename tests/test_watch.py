@@ -0,0 +1,208 @@
+import os
+from itertools import count
+from pathlib import Path
+from random import Random
+from typing import Callable
+
+import pytest
+
+from practice_turkish.dictionaries import watch
+from practice_turkish.dictionaries.csvdictionary import CSVDictionaryEntry
+from practice_turkish.dictionaries.watch import (
+    Changes,
+    FileLines,
+    Matching,
+    WatchedDictionary,
+    match_by_diff,
+    match_by_hash,
+    trim_common_ends,
+)
+from practice_turkish.languages import Language
+
+HEADER = "turkish;russian;;\n"
+LINES = ["ev;дом;;", "kedi;кошка;;", "su;вода;;", "göz;глаз;;", "okul;школа;;"]
+
+# Modification times set by `write`, so every write changes the stamp.
+clock = count(1_600_000_000)
+
+
+def write(path: Path, lines: list[str], header: str = HEADER) -> None:
+    "Write the header and the lines, moving the modification time forward."
+    path.write_text(header + "".join(line + "\n" for line in lines), encoding="utf-8")
+    seconds = next(clock)
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+def words(entries: list[CSVDictionaryEntry]) -> list[str]:
+    "The Turkish word of each entry."
+    return [entry._words_a[0] for entry in entries]
+
+
+@pytest.fixture
+def lines(tmp_path: Path) -> FileLines[CSVDictionaryEntry]:
+    "Lines of a small dictionary file which has been read once."
+    path = tmp_path / "dictionary.csv"
+    write(path, LINES)
+    file_lines = FileLines(str(path), CSVDictionaryEntry)
+    changes = file_lines.update()
+    assert words(changes.added) == ["ev", "kedi", "su", "göz", "okul"]
+    assert not changes.removed and not changes.modified and not changes.invalid
+    return file_lines
+
+
+def rewrite(file_lines: FileLines[CSVDictionaryEntry], lines: list[str]) -> Changes:
+    "Write new lines of the file and read its changes."
+    write(Path(file_lines.path), lines)
+    assert file_lines.changed()
+    changes = file_lines.update()
+    assert not file_lines.changed()
+    return changes
+
+
+def test_unchanged(lines: FileLines[CSVDictionaryEntry]) -> None:
+    assert not lines.changed()
+    changes = rewrite(lines, LINES)
+    assert changes == Changes()
+    assert changes.describe() == "no entries"
+
+
+def test_added(lines: FileLines[CSVDictionaryEntry]) -> None:
+    changes = rewrite(lines, LINES[:2] + ["deniz;море;;"] + LINES[2:] + ["el;рука;;"])
+    assert words(changes.added) == ["deniz", "el"]
+    assert not changes.removed and not changes.modified
+    assert words(lines.entries) == ["ev", "kedi", "deniz", "su", "göz", "okul", "el"]
+
+
+def test_removed(lines: FileLines[CSVDictionaryEntry]) -> None:
+    old = lines.entries
+    changes = rewrite(lines, LINES[:1] + LINES[2:4])
+    assert changes.removed == [old[1], old[4]]
+    assert not changes.added and not changes.modified
+    assert lines.entries == [old[0], old[2], old[3]]
+
+
+def test_modified(lines: FileLines[CSVDictionaryEntry]) -> None:
+    old = lines.entries
+    changes = rewrite(lines, LINES[:2] + ["su;вода, жидкость;;"] + LINES[3:])
+    assert not changes.added and not changes.removed
+    [(before, after)] = changes.modified
+    assert before is old[2]
+    assert after.words_b == {"вода, жидкость"}
+    assert changes.describe() == "1 modified"
+
+
+def test_moved_lines_keep_entries(lines: FileLines[CSVDictionaryEntry]) -> None:
+    old = lines.entries
+    changes = rewrite(lines, LINES[3:] + LINES[:3])
+    assert not changes.added and not changes.removed and not changes.modified
+    assert lines.entries == old[3:] + old[:3]
+    assert all(new is before for new, before in zip(lines.entries, old[3:] + old[:3]))
+
+    changes = rewrite(lines, [LINES[0], LINES[3], LINES[4], "kedi;кот;;", LINES[2]])
+    assert not changes.added and not changes.removed
+    [(before, after)] = changes.modified
+    assert before is old[1] and after.words_b == {"кот"}
+    assert lines.entries == [old[0], old[3], old[4], after, old[2]]
+
+
+def test_invalid_and_blank_lines(lines: FileLines[CSVDictionaryEntry]) -> None:
+    changes = rewrite(lines, LINES[:1] + ["broken", "", 'su;"вода;;'] + LINES[1:])
+    assert changes.invalid == [3, 5]
+    assert changes == Changes(invalid=[3, 5])
+
+    changes = rewrite(lines, LINES[:1] + ["bozuk;сломан;;", ""] + LINES[1:])
+    assert words(changes.added) == ["bozuk"]
+    assert not changes.invalid
+    assert len(lines.entries) == len(LINES) + 1
+
+
+def test_header_change_reads_everything(
+    lines: FileLines[CSVDictionaryEntry],
+) -> None:
+    old = lines.entries
+    write(Path(lines.path), LINES, header="turkish;english;;\n")
+    changes = lines.update()
+    assert changes.removed == old
+    assert words(changes.added) == words(old)
+    assert lines.language_b is Language.english
+
+
+def test_long_changes_are_matched_by_hash(
+    lines: FileLines[CSVDictionaryEntry], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(watch, "MAX_DIFF_LINES", 0)
+    old = lines.entries
+    changes = rewrite(lines, LINES[:2] + ["su;вода, жидкость;;"] + LINES[3:])
+    assert changes.removed == [old[2]]
+    assert words(changes.added) == ["su"]
+    assert not changes.modified
+
+
+def test_random_edits_match_a_fresh_read(
+    lines: FileLines[CSVDictionaryEntry],
+) -> None:
+    rng = Random(0)
+    text = list(LINES)
+    tracked = lines.entries
+    for n in range(200):
+        kind = rng.choice(["add", "remove", "edit", "move", "blank"])
+        i = rng.randrange(len(text) + 1)
+        if kind == "add" or not text:
+            text.insert(i, f"kelime{n};слово{n};;")
+        elif kind == "remove":
+            del text[i - 1]
+        elif kind == "edit":
+            text[i - 1] = text[i - 1].replace(";;", f";ipucu{n};")
+        elif kind == "move":
+            text.insert(rng.randrange(len(text)), text.pop(i - 1))
+        else:
+            text.insert(i, "")
+        changes = rewrite(lines, text)
+        tracked = changes.apply(tracked)
+
+        fresh = FileLines(lines.path, CSVDictionaryEntry)
+        assert lines.entries == fresh.update().added
+        assert sorted(map(id, tracked)) == sorted(map(id, lines.entries))
+
+
+def test_trim_common_ends() -> None:
+    assert trim_common_ends([1, 2, 3, 4], [1, 2, 3, 4]) == (4, 4, 4)
+    assert trim_common_ends([1, 2, 3, 4], [1, 5, 6, 4]) == (1, 3, 3)
+    assert trim_common_ends([1, 2, 3], [1, 2, 2, 3]) == (2, 2, 3)
+    assert trim_common_ends([], [1]) == (0, 0, 1)
+
+
+@pytest.mark.parametrize("match", [match_by_diff, match_by_hash])
+def test_matching_keeps_equal_lines(
+    match: Callable[[list[int], list[int]], Matching]
+) -> None:
+    sources, removed, _ = match([1, 2, 3, 4], [3, 4, 5, 1])
+    assert [sources[0], sources[1], sources[3]] == [2, 3, 0]
+    assert sources[2] is None
+    assert removed == [1]
+
+
+def test_match_by_diff_pairs_replaced_lines() -> None:
+    assert match_by_diff([1, 2, 3], [1, 5, 3]) == ([0, None, 2], [1], [(1, 1)])
+
+
+def test_watched_dictionary_follows_the_filter(tmp_path: Path) -> None:
+    path = tmp_path / "dictionary.csv"
+    write(path, LINES)
+    dictionary = WatchedDictionary.watch(str(path), CSVDictionaryEntry)
+    filtered = dictionary.filter("has:ö")
+    assert filtered.refresh() is None
+    assert words(filtered.entries) == ["göz"]
+
+    write(path, LINES + ["gök;небо;;", "el;рука;;"])
+    changes = filtered.refresh()
+    assert changes is not None and words(changes.added) == ["gök"]
+    assert words(filtered.entries) == ["göz", "gök"]
+
+    write(path, LINES[:3] + ["göz;глаз;око;", "okul;школа;;", "gök;небо;;"])
+    changes = filtered.refresh()
+    assert changes is not None and len(changes.modified) == 1
+    write(path, LINES[:3] + ["goz;глаз;;", "okul;школа;;", "gök;небо;;"])
+    changes = filtered.refresh()
+    assert changes is not None and len(changes.removed) == 1
+    assert words(filtered.entries) == ["gök"]